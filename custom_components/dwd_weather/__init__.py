@@ -10,11 +10,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.entity_registry import async_migrate_entries
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.core import callback
 from simple_dwd_weatherforecast import dwdforecast
 
 from .connector import DWDMapData, DWDWeatherData
+from .fetcher import MosmixSFetcher
+from .snapshot import snapshot_store
 from .const import (
     CONF_DAILY_TEMP_HIGH_PRECISION,
     CONF_DATA_TYPE,
@@ -37,17 +40,21 @@ from .const import (
     CONF_MAP_TIMESTAMP,
     CONF_ADDITIONAL_FORECAST_ATTRIBUTES,
     CONF_MAP_DARK_MODE,
+    CONF_SENSOR_DATA_FORMAT,
     CONF_SENSOR_FORECAST_STEPS,
     CONF_STATION_ID,
     CONF_STATION_NAME,
     CONF_WIND_DIRECTION_TYPE,
     DEFAULT_INTERPOLATION,
+    DEFAULT_INTERPOLATION_INTERVAL,
+    DEFAULT_SENSOR_DATA_FORMAT,
     DEFAULT_MAP_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_WIND_DIRECTION_TYPE,
     DOMAIN,
     DWDWEATHER_COORDINATOR,
     DWDWEATHER_DATA,
+    DWDWEATHER_MOSMIX_S,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -71,20 +78,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     entry.async_on_unload(entry.add_update_listener(update_listener))
     random_delay = random.randint(1, 59)
     if entry.data[CONF_ENTITY_TYPE] == CONF_ENTITY_TYPE_STATION:
-        dwd_weather_data = DWDWeatherData(hass, entry)
+        mosmix_s = None
+        if entry.data[CONF_HOURLY_UPDATE]:
+            # All stations with hourly updates share one MOSMIX_S download
+            dwdweather_hass_data = hass.data.setdefault(DOMAIN, {})
+            if DWDWEATHER_MOSMIX_S not in dwdweather_hass_data:
+                dwdweather_hass_data[DWDWEATHER_MOSMIX_S] = MosmixSFetcher()
+            mosmix_s = dwdweather_hass_data[DWDWEATHER_MOSMIX_S]
+            entry.async_on_unload(mosmix_s.register(entry.data[CONF_STATION_ID]))
+        dwd_weather_data = DWDWeatherData(hass, entry, mosmix_s)
+
+        async def async_update():
+            """Update the data and plan the next refresh along the DWD releases."""
+            await dwd_weather_data.async_update()
+            dwdweather_coordinator.update_interval = (
+                dwd_weather_data.get_update_interval() + timedelta(seconds=random_delay)
+            )
 
         # Coordinator checks for new updates
         dwdweather_coordinator = DataUpdateCoordinator(
             hass,
             _LOGGER,
             name=f"DWD Weather Coordinator for {entry.data[CONF_STATION_ID]}",
-            update_method=dwd_weather_data.async_update,
+            update_method=async_update,
             update_interval=DEFAULT_SCAN_INTERVAL + timedelta(seconds=random_delay),
         )
 
-        # Fetch initial data so we have data when entities subscribe
+        # Restore the data of the last run, so the entities are available at once
+        # and the first download happens in the background. Without it the
+        # initial data is fetched before the entities subscribe.
         if dwd_weather_data.dwd_weather.forecast_data is None:
-            await dwdweather_coordinator.async_refresh()
+            if await dwd_weather_data.async_restore_snapshot():
+                entry.async_create_background_task(
+                    hass,
+                    dwdweather_coordinator.async_refresh(),
+                    f"DWD Weather refresh for {entry.data[CONF_STATION_ID]}",
+                )
+            else:
+                await dwdweather_coordinator.async_refresh()
         _LOGGER.debug("issue_time: {}".format(dwd_weather_data.dwd_weather.issue_time))
         if dwd_weather_data.dwd_weather.forecast_data is None:
             _LOGGER.debug("ConfigEntryNotReady")
@@ -101,6 +132,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         for component in PLATFORMS:
             await hass.config_entries.async_forward_entry_setups(entry, [component])
 
+        if entry.data.get(CONF_INTERPOLATE, False):
+
+            async def publish_interpolated_values(_now):
+                """Let the entities write their interpolated values without a download."""
+                await dwd_weather_data.async_prepare_sensor_snapshot()
+                dwdweather_coordinator.async_update_listeners()
+
+            entry.async_on_unload(
+                async_track_time_interval(
+                    hass, publish_interpolated_values, DEFAULT_INTERPOLATION_INTERVAL
+                )
+            )
+
     elif entry.data[CONF_ENTITY_TYPE] == CONF_ENTITY_TYPE_MAP:
         dwd_weather_data = DWDMapData(hass, entry)
 
@@ -210,6 +254,10 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         new[CONF_DOWNLOAD_APPARENT_TEMPERATURE] = False
         new[CONF_DOWNLOAD_AIRQUALITY] = False
         hass.config_entries.async_update_entry(config_entry, data=new, version=13)
+    elif config_entry.version == 13:
+        new = {**config_entry.data}
+        new[CONF_SENSOR_DATA_FORMAT] = DEFAULT_SENSOR_DATA_FORMAT
+        hass.config_entries.async_update_entry(config_entry, data=new, version=14)
 
     _LOGGER.info("Migration to version %s successful", config_entry.version)
     return True
@@ -220,6 +268,12 @@ async def async_update(self):
     return await self._hass.async_add_executor_job(self._update)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved data of a config entry."""
+    if entry.data[CONF_ENTITY_TYPE] == CONF_ENTITY_TYPE_STATION:
+        await snapshot_store(hass, entry.entry_id).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     if entry.data[CONF_ENTITY_TYPE] == CONF_ENTITY_TYPE_STATION:
@@ -239,6 +293,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         )
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
-        if not hass.data[DOMAIN]:
+        if hass.data[DOMAIN].keys() <= {DWDWEATHER_MOSMIX_S}:
             hass.data.pop(DOMAIN)
     return unload_ok
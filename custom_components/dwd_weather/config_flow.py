@@ -30,6 +30,9 @@ from .const import (
     CONF_ENTITY_TYPE_STATION,
     CONF_HOURLY_UPDATE,
     CONF_INTERPOLATE,
+    CONF_SENSOR_DATA_FORMAT,
+    CONF_SENSOR_DATA_FORMAT_COMPACT,
+    CONF_SENSOR_DATA_FORMAT_LIST,
     CONF_SENSOR_FORECAST_STEPS,
     CONF_LOCATION_COORDINATES,
     CONF_CUSTOM_LOCATION,
@@ -69,6 +72,7 @@ from .const import (
     DOMAIN,
     CONF_VERSION,
     CONF_WIND_DIRECTION_TYPE,
+    DEFAULT_SENSOR_DATA_FORMAT,
     conversion_table_map_foreground,
     CONF_MAP_HOMEMARKER_SHAPE_CIRCLE,
 )
@@ -282,7 +286,7 @@ class DWDWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     default="degrees",  # type: ignore
                 ): SelectSelector(
                     {
-                        "options": list(["degrees", "direction"]),
+                        "options": list(["degrees", "direction", "direction_16"]),
                         "custom_value": False,
                         "mode": "list",
                         "translation_key": CONF_WIND_DIRECTION_TYPE,
@@ -304,6 +308,22 @@ class DWDWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_SENSOR_FORECAST_STEPS,
                     default=250,  # type: ignore
                 ): NumberSelector({"min": 1, "max": 250, "step": 1, "mode": "box"}),
+                vol.Required(
+                    CONF_SENSOR_DATA_FORMAT,
+                    default=DEFAULT_SENSOR_DATA_FORMAT,  # type: ignore
+                ): SelectSelector(
+                    {
+                        "options": list(
+                            [
+                                CONF_SENSOR_DATA_FORMAT_LIST,
+                                CONF_SENSOR_DATA_FORMAT_COMPACT,
+                            ]
+                        ),
+                        "custom_value": False,
+                        "mode": "list",
+                        "translation_key": CONF_SENSOR_DATA_FORMAT,
+                    }
+                ),
                 vol.Required(
                     CONF_ADDITIONAL_FORECAST_ATTRIBUTES,
                     default=False,  # type: ignore
@@ -655,7 +675,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     default=self.config_entry.data[CONF_WIND_DIRECTION_TYPE],
                 ): SelectSelector(
                     {
-                        "options": list(["degrees", "direction"]),
+                        "options": list(["degrees", "direction", "direction_16"]),
                         "custom_value": False,
                         "mode": "list",
                         "translation_key": CONF_WIND_DIRECTION_TYPE,
@@ -680,6 +700,25 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_SENSOR_FORECAST_STEPS,
                     default=self.config_entry.data[CONF_SENSOR_FORECAST_STEPS],
                 ): NumberSelector({"min": 1, "max": 250, "step": 1, "mode": "box"}),
+                vol.Required(
+                    CONF_SENSOR_DATA_FORMAT,
+                    default=self.config_entry.data.get(
+                        CONF_SENSOR_DATA_FORMAT,
+                        DEFAULT_SENSOR_DATA_FORMAT,
+                    ),
+                ): SelectSelector(
+                    {
+                        "options": list(
+                            [
+                                CONF_SENSOR_DATA_FORMAT_LIST,
+                                CONF_SENSOR_DATA_FORMAT_COMPACT,
+                            ]
+                        ),
+                        "custom_value": False,
+                        "mode": "list",
+                        "translation_key": CONF_SENSOR_DATA_FORMAT,
+                    }
+                ),
                 vol.Required(
                     CONF_ADDITIONAL_FORECAST_ATTRIBUTES,
                     default=self.config_entry.data[CONF_ADDITIONAL_FORECAST_ATTRIBUTES],
@@ -1,14 +1,20 @@
 """Connector class to retrieve data, which is use by the weather and sensor enities."""
 
+import csv
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
 import math
 import re
+import threading
 import time
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple
 import PIL
 import PIL.ImageDraw
 from markdownify import markdownify
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import dt
 from io import BytesIO
 import warnings
@@ -43,6 +49,36 @@ from simple_dwd_weatherforecast.dwdairquality import (
     AirQuality,
 )
 
+from .derived import (
+    ZERO_CELSIUS,
+    absolute_humidity,
+    absolute_humidity_from_kelvin,
+    SENSOR_CONVERSIONS,
+    convert_series,
+    kelvin_to_celsius,
+    ms_to_kmh,
+    pa_to_hpa,
+    round_series,
+    shift,
+    wind_direction_symbols,
+)
+from .fetcher import ConditionalFetcher, MosmixSFetcher
+from .kml import apply_forecast
+from .scheduler import RefreshScheduler
+from .snapshot import (
+    SNAPSHOT_SAVE_DELAY,
+    pack_snapshot,
+    snapshot_store,
+    unpack_snapshot,
+)
+from .forecast_store import (
+    ROLLUP_INTERVALS,
+    ForecastStore,
+    Rollup,
+    condition_text,
+    epoch_hour,
+    index_by_hour,
+)
 from .const import (
     ATTR_FORECAST_APPARENT_TEMP,
     ATTR_FORECAST_AIRQUALITY_OZON,
@@ -73,6 +109,8 @@ from .const import (
     CONF_DATA_TYPE_MIXED,
     CONF_DATA_TYPE_REPORT,
     CONF_INTERPOLATE,
+    DEFAULT_INTERPOLATION_INTERVAL,
+    WIND_DIRECTION_POINTS,
     CONF_MAP_BACKGROUND_TYPE,
     CONF_MAP_FOREGROUND_TYPE,
     CONF_MAP_HOMEMARKER_COLOR,
@@ -88,12 +126,13 @@ from .const import (
     CONF_MAP_TYPE,
     CONF_MAP_TYPE_GERMANY,
     CONF_MAP_WINDOW,
+    CONF_SENSOR_DATA_FORMAT,
+    CONF_SENSOR_DATA_FORMAT_COMPACT,
     CONF_SENSOR_FORECAST_STEPS,
     CONF_STATION_ID,
     CONF_STATION_NAME,
     CONF_WIND_DIRECTION_TYPE,
     CONF_HOURLY_UPDATE,
-    DEFAULT_WIND_DIRECTION_TYPE,
     CONF_MAP_DARK_MODE,
     CONF_MAP_FOREGROUND_PRECIPITATION,
     CONF_MAP_FOREGROUND_MAXTEMP,
@@ -110,6 +149,17 @@ from .const import (
     CONF_MAP_BACKGROUND_SATELLIT,
 )
 
+# The hourly forecast covers nine days
+FORECAST_HOURLY_STEPS = 9 * 24
+
+# Keep key names aligned with dedicated air quality sensors.
+AIRQUALITY_FORECAST_FIELDS = {
+    "Stickstoffdioxid": ATTR_FORECAST_AIRQUALITY_STICKSTOFFDIOXID,
+    "Ozon": ATTR_FORECAST_AIRQUALITY_OZON,
+    "PM2_5": ATTR_FORECAST_AIRQUALITY_PM2_5,
+    "PM10": ATTR_FORECAST_AIRQUALITY_PM10,
+}
+
 conversion_table_map_homemarker_shape = {
     CONF_MAP_HOMEMARKER_SHAPE_CIRCLE: MarkerShape.CIRCLE,
     CONF_MAP_HOMEMARKER_SHAPE_CROSS: MarkerShape.CROSS,
@@ -118,12 +168,75 @@ conversion_table_map_homemarker_shape = {
 
 _LOGGER = logging.getLogger(__name__)
 
+MEASUREMENTS_URL = "https://opendata.dwd.de/weather/weather_reports/poi/{}-BEOB.csv"
+
+
+class SensorValues(NamedTuple):
+    """State and extra attributes of a sensor at one tick."""
+
+    state: Any
+    attributes: Mapping[str, Any]
+
+
+# State getter and attribute getters of a sensor type, called with the connector
+SensorGetters = tuple[
+    Callable[["DWDWeatherData"], Any],
+    Mapping[str, Callable[["DWDWeatherData"], Any]],
+]
+
+
+def compact_series(data):
+    """Return a series of timestamped entries as start, step and values.
+
+    The step is the smallest distance between two entries in seconds, gaps
+    in the series become None. Anything that is not a list of entries on a
+    regular grid is returned unchanged.
+    """
+    if not isinstance(data, list) or not all(
+        isinstance(item, dict) and ATTR_FORECAST_TIME in item for item in data
+    ):
+        return data
+    if not data:
+        return {"start": None, "step": None, "values": []}
+
+    times = []
+    for item in data:
+        timestamp = item[ATTR_FORECAST_TIME]
+        if isinstance(timestamp, str):
+            timestamp = dt.parse_datetime(timestamp)
+        if not isinstance(timestamp, datetime):
+            return data
+        times.append(timestamp.timestamp())
+    offsets = [int(time - times[0]) for time in times]
+    step = min(
+        (later - earlier for earlier, later in zip(offsets, offsets[1:])),
+        default=None,
+    )
+    if step is None:
+        values = [data[0]["value"]]
+    elif step <= 0 or any(offset % step for offset in offsets):
+        return data
+    else:
+        values = [None] * (offsets[-1] // step + 1)
+        for offset, item in zip(offsets, data):
+            values[offset // step] = item["value"]
+    return {"start": data[0][ATTR_FORECAST_TIME], "step": step, "values": values}
+
 
 class DWDWeatherData:
-    def __init__(self, hass, config_entry: ConfigEntry):
-        """Initialize the data object."""
+    def __init__(
+        self,
+        hass,
+        config_entry: ConfigEntry,
+        mosmix_s: MosmixSFetcher | None = None,
+    ):
+        """Initialize the data object.
+
+        With hourly updates the MOSMIX_S data is read from the shared fetcher.
+        """
         self._config = config_entry.data
         self._hass = hass
+        self._mosmix_s = mosmix_s
         self.forecast = None
         self._report = None
         self.latest_update = None
@@ -142,11 +255,40 @@ class DWDWeatherData:
         self._forecast_daily_cache = None
         self._forecast_daily_cache_update = None
         self._forecast_daily_cache_day = None
+        self._forecast_interval_cache = {}
         self._forecast_hourly_cache = None
         self._forecast_hourly_cache_update = None
         self._forecast_hourly_cache_hour = None
-        self._forecast_timestamp_cache = {}
-        self._forecast_timestamp_cache_update = None
+        self._forecast_store = None
+        self._forecast_store_update = None
+        self._sun_hours = {}
+        self._sun_hours_day = None
+        self._apparent_temperature_index = {}
+        self._uv_indices = {}
+        self._airquality_hourly_index = {}
+        self._airquality_forecast_fields = {}
+        self._uv_indices_version = None
+        self._apparent_temperature_index_update = None
+        self._published_forecasts = {}
+        self.forecast_changes = {}
+        self._forecast_columns = {}
+        self._forecast_columns_update = None
+        self._hourly_series = {}
+        self._humidity_absolute_hourly = []
+        self._hourly_series_version = None
+        self._sensor_getters = {}
+        self._sensor_snapshot = MappingProxyType({})
+        self._sensor_snapshot_version = None
+        self._fetcher = ConditionalFetcher()
+        # Serializes the executor jobs reading and replacing the forecast data
+        self._lock = threading.Lock()
+        self._store = snapshot_store(hass, config_entry.entry_id)
+        self._snapshot = None
+        self._scheduler = RefreshScheduler(
+            self._config[CONF_HOURLY_UPDATE],
+            self._config[CONF_DATA_TYPE]
+            in (CONF_DATA_TYPE_REPORT, CONF_DATA_TYPE_MIXED),
+        )
 
         self._airquality_station_id = None
         self._airquality_hourly = None
@@ -155,6 +297,18 @@ class DWDWeatherData:
     def register_entity(self, entity):
         self.entities.append(entity)
 
+    def register_sensor(
+        self, sensor_type: str, getters: SensorGetters
+    ) -> Callable[[], None]:
+        """Add a sensor to the snapshot and return the callback removing it."""
+        self._sensor_getters[sensor_type] = getters
+        self._sensor_snapshot_version = None
+
+        def unregister() -> None:
+            self._sensor_getters.pop(sensor_type, None)
+
+        return unregister
+
     def supports_apparent_temperature(self) -> bool:
         """Return whether apparent temperature data can be requested."""
         if not self._config.get(CONF_DOWNLOAD_APPARENT_TEMPERATURE, False):
@@ -188,14 +342,168 @@ class DWDWeatherData:
                     )
             except Exception as error:
                 _LOGGER.warning("Failed to initialize air quality data: %s", error)
-        if await self._hass.async_add_executor_job(self._update):
+        changed_forecast_types = await self._hass.async_add_executor_job(self._refresh)
+        if changed_forecast_types:
             for entity in self.entities:
-                await entity.async_update_listeners(("daily", "hourly"))
+                await entity.async_update_listeners(changed_forecast_types)
+        if self._snapshot is not None:
+            self._store.async_delay_save(self._take_snapshot, SNAPSHOT_SAVE_DELAY)
+
+    def _take_snapshot(self) -> dict:
+        """Return the snapshot of the last download to be written once."""
+        snapshot, self._snapshot = self._snapshot, None
+        return snapshot
+
+    async def async_restore_snapshot(self) -> bool:
+        """Restore the data saved with the last update, return whether it worked.
+
+        The restored data is published until the next update downloaded new data.
+        """
+        try:
+            snapshot = await self._store.async_load()
+        except HomeAssistantError as error:
+            _LOGGER.warning("Failed to load the last data: %s", error)
+            return False
+        if snapshot is None:
+            return False
+        return await self._hass.async_add_executor_job(self._restore_snapshot, snapshot)
+
+    def _restore_snapshot(self, snapshot: dict) -> bool:
+        """Restore a snapshot and prepare the forecasts within the executor job."""
+        with self._lock:
+            return self._restore_snapshot_locked(snapshot)
+
+    def _restore_snapshot_locked(self, snapshot: dict) -> bool:
+        try:
+            latest_update = unpack_snapshot(self.dwd_weather, snapshot)
+        except Exception as error:
+            _LOGGER.warning("Failed to restore the last data: %s", error)
+            return False
+        _LOGGER.debug(
+            "Restored data of %s from %s",
+            self._config[CONF_STATION_NAME],
+            latest_update,
+        )
+        self._publish_update(latest_update)
+        self._prepare_forecasts()
+        self._prepare_sensor_snapshot()
+        return True
+
+    def _refresh(self) -> tuple[str, ...]:
+        """Update the data and prepare the forecasts within the executor job.
+
+        Returns the forecast types whose payload changed, so only their
+        subscribers have to be notified.
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> tuple[str, ...]:
+        if not self._update():
+            # Without new data a forecast only changes when its first entry
+            # expired, e.g. at the full hour
+            changed_forecast_types = (
+                self._prepare_forecasts() if self._published_forecasts else ()
+            )
+            self._prepare_sensor_snapshot()
+            return changed_forecast_types
+        changed_forecast_types = self._prepare_forecasts()
+        self._prepare_sensor_snapshot()
+        return changed_forecast_types
+
+    def _prepare_forecasts(self) -> tuple[str, ...]:
+        """Build the hourly and daily forecast once per update."""
+        forecasts = {
+            "daily": self.get_forecast_daily(),
+            "hourly": self.get_forecast_hourly(),
+        }
+        changed = []
+        for forecast_type, forecast in forecasts.items():
+            previous = self._published_forecasts.get(forecast_type)
+            if forecast is previous:
+                continue
+            changed_times = self._get_changed_forecast_times(previous, forecast)
+            self._published_forecasts[forecast_type] = forecast
+            self.forecast_changes[forecast_type] = changed_times
+            head_expired = bool(previous and forecast) and (
+                previous[0][ATTR_FORECAST_TIME] != forecast[0][ATTR_FORECAST_TIME]
+            )
+            if changed_times or head_expired:
+                _LOGGER.debug(
+                    "%s forecast changed for %s", forecast_type, changed_times
+                )
+                changed.append(forecast_type)
+        return tuple(changed)
+
+    @staticmethod
+    def _get_changed_forecast_times(
+        previous: list[Forecast] | None, current: list[Forecast] | None
+    ) -> list[str]:
+        """Return the times of forecast entries that are new or differ.
+
+        Entries are matched by ATTR_FORECAST_TIME. Entries that dropped off
+        the head of the forecast have expired and do not count as a change.
+        """
+        current = current or []
+        if not previous:
+            return [entry[ATTR_FORECAST_TIME] for entry in current]
+        if not current:
+            return [entry[ATTR_FORECAST_TIME] for entry in previous]
+        previous_entries = {entry[ATTR_FORECAST_TIME]: entry for entry in previous}
+        return [
+            entry[ATTR_FORECAST_TIME]
+            for entry in current
+            if previous_entries.get(entry[ATTR_FORECAST_TIME]) != entry
+        ]
+
+    def _update_mosmix_s(self) -> None:
+        """Take the station's forecast from the shared MOSMIX_S release."""
+        try:
+            forecast = self._mosmix_s.get_forecast(self.dwd_weather.station_id)
+        except Exception as error:
+            _LOGGER.warning("Failed to download MOSMIX_S: %s", error)
+            return
+        if forecast is not None:
+            apply_forecast(self.dwd_weather, forecast)
+
+    def _download_measurements(self) -> None:
+        """Download and parse the latest measurements, if DWD published new ones."""
+        station_id = self.dwd_weather.station_id
+        if len(station_id) == 4:
+            station_id = station_id + "_"
+        url = MEASUREMENTS_URL.format(station_id)
+        try:
+            content = self._fetcher.fetch(url)
+            if content is None:
+                return
+            rows = csv.DictReader(content.decode("utf-8").splitlines(), delimiter=";")
+            # The two rows after the header hold the units and descriptions
+            next(rows)
+            next(rows)
+            row = next(rows)
+            # Some items are only reported each hour
+            for backup_row in islice(rows, 3):
+                for key in (
+                    "cloud_cover_total",
+                    "horizontal_visibility",
+                    "present_weather",
+                ):
+                    if row[key] == self.dwd_weather.NOT_AVAILABLE:
+                        row[key] = backup_row[key]
+            self.dwd_weather.parse_csv_row(row)
+        except Exception as error:
+            # Download the report again with the next update
+            self._fetcher.forget(url)
+            _LOGGER.warning("Failed to update the measurements: %s", error)
+
+    def get_update_interval(self) -> timedelta:
+        """Return the time until the next refresh planned by the scheduler."""
+        return self._scheduler.next_interval(datetime.now(timezone.utc))
 
     def _update(self):
         """Get the latest data from DWD."""
         timestamp = datetime.now(timezone.utc)
-        if timestamp.minute % 10 != 0 and self.latest_update is not None:
+        if self.latest_update is not None and not self._scheduler.is_due(timestamp):
             return False
 
         _LOGGER.info("Updating {}".format(self._config[CONF_STATION_NAME]))
@@ -212,18 +520,25 @@ class DWDWeatherData:
             CONF_DATA_TYPE_REPORT,
             CONF_DATA_TYPE_MIXED,
         )
+        with_forecast = self._scheduler.forecast_due(timestamp)
         self.dwd_weather.update(
             force_hourly=self._config[CONF_HOURLY_UPDATE],
-            with_forecast=True,
-            with_measurements=should_request_measurements,
+            with_forecast=with_forecast and self._mosmix_s is None,
+            with_measurements=False,
             with_report=True,
             with_uv=True,
             with_apparent_temperature=self.supports_apparent_temperature(),
         )
+        if should_request_measurements and self.dwd_weather.has_measurement(
+            self.dwd_weather.station_id
+        ):
+            self._download_measurements()
+        if with_forecast and self._mosmix_s is not None:
+            self._update_mosmix_s()
 
         if self._config.get(CONF_DOWNLOAD_AIRQUALITY, False):
             if self._airquality_hourly is not None:
-                self._airquality_hourly.update()
+                self._update_airquality_hourly()
             if self._airquality_daily is not None:
                 self._airquality_daily.update(with_current_day=True)
 
@@ -257,8 +572,20 @@ class DWDWeatherData:
                 )
             # Hacky workaround end
 
+        report_time = self._publish_update(timestamp)
+        self._scheduler.plan(timestamp, self.dwd_weather.issue_time, report_time)
+        if self.dwd_weather.forecast_data:
+            try:
+                self._snapshot = pack_snapshot(self.dwd_weather, timestamp)
+            except Exception as error:
+                _LOGGER.warning("Failed to save the data: %s", error)
+        return True
+
+    def _publish_update(self, timestamp: datetime) -> datetime | None:
+        """Publish the data downloaded at timestamp, return the report time."""
         self.infos[ATTR_LATEST_UPDATE] = timestamp
         self.latest_update = timestamp
+        report_time = None
         if (
             self._config[CONF_DATA_TYPE] == CONF_DATA_TYPE_REPORT
             or self._config[CONF_DATA_TYPE] == CONF_DATA_TYPE_MIXED
@@ -266,6 +593,7 @@ class DWDWeatherData:
             report_date_array = self.dwd_weather.report_data["date"].split(".")
             date = f"20{report_date_array[2]}-{report_date_array[1]}-{report_date_array[0]}T{self.dwd_weather.report_data['time']}:00+00:00"
             self.infos[ATTR_REPORT_ISSUE_TIME] = date
+            report_time = datetime.fromisoformat(date)
         else:
             self.infos[ATTR_REPORT_ISSUE_TIME] = ""
         self.infos[ATTR_ISSUE_TIME] = self.dwd_weather.issue_time
@@ -292,11 +620,131 @@ class DWDWeatherData:
         }
 
         _LOGGER.debug("Forecast data {}".format(self.dwd_weather.forecast_data))
-        return True
+        self.get_forecast_store()
+        return report_time
+
+    def get_forecast_store(self) -> ForecastStore:
+        """Return the columnar store of the current forecast data."""
+        if (
+            self._forecast_store is None
+            or self._forecast_store_update != self.latest_update
+        ):
+            self._forecast_store = ForecastStore(self.dwd_weather.forecast_data)
+            self._forecast_store_update = self.latest_update
+        return self._forecast_store
+
+    def get_sensor_snapshot(self) -> Mapping[str, SensorValues]:
+        """Return the values of the registered sensors prepared by the last job.
+
+        Reading the snapshot never evaluates a getter, so the sensors can read
+        it on the event loop.
+        """
+        return self._sensor_snapshot
+
+    async def async_prepare_sensor_snapshot(self) -> None:
+        """Prepare the sensor values of the current tick in the executor."""
+        await self._hass.async_add_executor_job(self._prepare_sensor_snapshot_job)
+
+    def _prepare_sensor_snapshot_job(self) -> None:
+        with self._lock:
+            self._prepare_sensor_snapshot()
+
+    def _prepare_sensor_snapshot(self) -> Mapping[str, SensorValues]:
+        """Build the values of all registered sensors for the current tick.
+
+        The snapshot is built once per update and hour, every sensor property
+        read in between is a lookup into it. Interpolated values change within
+        the hour, so they get a new snapshot every interpolation interval.
+        """
+        now = datetime.now(timezone.utc)
+        if self._config.get(CONF_INTERPOLATE, False):
+            tick = int(
+                now.timestamp() // DEFAULT_INTERPOLATION_INTERVAL.total_seconds()
+            )
+        else:
+            tick = epoch_hour(now)
+        version = (self.latest_update, tick)
+        if self._sensor_snapshot_version != version:
+            self._sensor_snapshot = MappingProxyType(
+                {
+                    sensor_type: self._get_sensor_values(getters)
+                    for sensor_type, getters in tuple(self._sensor_getters.items())
+                }
+            )
+            self._sensor_snapshot_version = version
+        return self._sensor_snapshot
+
+    def _get_sensor_values(self, getters: SensorGetters) -> SensorValues:
+        """Evaluate the state and attribute getters of one sensor."""
+        state_getter, attribute_getters = getters
+        return SensorValues(
+            state_getter(self),
+            MappingProxyType(self.get_sensor_attributes(attribute_getters)),
+        )
+
+    def get_sensor_attributes(
+        self, attribute_getters: Mapping[str, Callable[["DWDWeatherData"], Any]]
+    ) -> dict[str, Any]:
+        """Evaluate the attribute getters of one sensor in the configured format."""
+        attributes = {name: getter(self) for name, getter in attribute_getters.items()}
+        if (
+            "data" in attributes
+            and self._config.get(CONF_SENSOR_DATA_FORMAT)
+            == CONF_SENSOR_DATA_FORMAT_COMPACT
+        ):
+            attributes["data"] = compact_series(attributes["data"])
+        return attributes
+
+    def _get_sun_hours(self, day: date) -> tuple[int, int]:
+        """Return the UTC hours of sunrise and sunset of a day.
+
+        The table covers the hourly forecast window plus one day and is
+        rebuilt once per day, so the lookups do not repeat the astronomical
+        calculation of SunTimes.
+        """
+        today = datetime.now(timezone.utc).date()
+        if self._sun_hours_day != today:
+            self._sun_hours = {}
+            self._sun_hours_day = today
+            for offset in range(FORECAST_HOURLY_STEPS // 24 + 2):
+                self._add_sun_hours(today + timedelta(days=offset))
+        sun_hours = self._sun_hours.get(day)
+        if sun_hours is None:
+            sun_hours = self._add_sun_hours(day)
+        return sun_hours
+
+    def _add_sun_hours(self, day: date) -> tuple[int, int]:
+        sun_hours = (
+            self.sun.riseutc(day).hour,  # type: ignore
+            self.sun.setutc(day).hour,  # type: ignore
+        )
+        self._sun_hours[day] = sun_hours
+        return sun_hours
+
+    def _get_apparent_temperature_index(self) -> dict[int, float | None]:
+        """Return the apparent temperature forecast keyed by epoch hour."""
+        if self._apparent_temperature_index_update != self.latest_update:
+            self._apparent_temperature_index = index_by_hour(
+                self.dwd_weather.get_apparent_temperature_forecast(shouldUpdate=False)
+            )
+            self._apparent_temperature_index_update = self.latest_update
+        return self._apparent_temperature_index
+
+    def _is_night_hour(self, timestamp: datetime) -> bool:
+        """Return whether the UTC hour is before sunrise or after sunset."""
+        rise_hour, set_hour = self._get_sun_hours(timestamp.date())
+        return timestamp.hour < rise_hour or timestamp.hour > set_hour
 
     def get_forecast(
-        self, forecast_feature: WeatherEntityFeature
+        self, forecast_feature: WeatherEntityFeature, interval: int | None = None
     ) -> list[Forecast] | None:
+        """Return the forecast of a feature, or in steps of interval hours.
+
+        With an interval out of ROLLUP_INTERVALS the forecast is read from the
+        rollup pyramid of the forecast store instead.
+        """
+        if interval is not None:
+            return self.get_forecast_interval(interval)
         forecast_getters = {
             WeatherEntityFeature.FORECAST_HOURLY: self.get_forecast_hourly,
             WeatherEntityFeature.FORECAST_DAILY: self.get_forecast_daily,
@@ -304,6 +752,31 @@ class DWDWeatherData:
         getter = forecast_getters.get(forecast_feature)
         return getter() if getter is not None else None
 
+    async def async_get_forecast(
+        self, forecast_feature: WeatherEntityFeature
+    ) -> list[Forecast] | None:
+        """Return the prepared forecast, building it in the executor if outdated."""
+        cached_getters = {
+            WeatherEntityFeature.FORECAST_HOURLY: self._get_cached_forecast_hourly,
+            WeatherEntityFeature.FORECAST_DAILY: self._get_cached_forecast_daily,
+        }
+        cached_getter = cached_getters.get(forecast_feature)
+        if cached_getter is None:
+            return None
+        forecast = cached_getter()
+        if forecast is not None:
+            return forecast
+        return await self._hass.async_add_executor_job(
+            self._build_forecast, forecast_feature
+        )
+
+    def _build_forecast(
+        self, forecast_feature: WeatherEntityFeature
+    ) -> list[Forecast] | None:
+        """Build a forecast in the executor, never while an update is running."""
+        with self._lock:
+            return self.get_forecast(forecast_feature)
+
     def _should_add_airquality_to_forecast(self) -> bool:
         return self._config.get(
             CONF_ADDITIONAL_FORECAST_ATTRIBUTES, False
@@ -314,15 +787,8 @@ class DWDWeatherData:
         if not isinstance(airquality_entry, dict):
             return {}
 
-        # Keep key names aligned with dedicated air quality sensors.
-        mapping = {
-            "Stickstoffdioxid": ATTR_FORECAST_AIRQUALITY_STICKSTOFFDIOXID,
-            "Ozon": ATTR_FORECAST_AIRQUALITY_OZON,
-            "PM2_5": ATTR_FORECAST_AIRQUALITY_PM2_5,
-            "PM10": ATTR_FORECAST_AIRQUALITY_PM10,
-        }
         result = {}
-        for source_key, target_key in mapping.items():
+        for source_key, target_key in AIRQUALITY_FORECAST_FIELDS.items():
             if source_key in airquality_entry:
                 result[target_key] = airquality_entry[source_key]
         return result
@@ -334,11 +800,6 @@ class DWDWeatherData:
             return {}
 
         airquality_data = self._resolve_airquality_source(forecast_type)
-        if forecast_type == WeatherEntityFeature.FORECAST_HOURLY:
-            if isinstance(airquality_data, list) and index < len(airquality_data):
-                return self._to_forecast_airquality_fields(airquality_data[index])
-            return {}
-
         if isinstance(airquality_data, dict):
             day_keys = ["today", "tomorrow", "day_after"]
             if index < len(day_keys):
@@ -352,263 +813,475 @@ class DWDWeatherData:
 
         return {}
 
+    def _update_airquality_hourly(self) -> None:
+        """Download the hourly air quality and index it if a new run arrived.
+
+        The library downloads the run of the current UTC hour
+        (lq_forecast_YYYYMMDDHH), which is the reference time of its columns.
+        A failed download keeps the previous run and its index.
+        """
+        data = self._airquality_hourly.data
+        run_hour = epoch_hour(datetime.now(timezone.utc))
+        self._airquality_hourly.update()
+        if self._airquality_hourly.data is not data:
+            self._index_airquality_hourly(run_hour)
+
+    def _index_airquality_hourly(self, run_hour: int) -> None:
+        """Key the entries of an air quality run by epoch hour.
+
+        The first entry is the "-01h" column, the others are "+01h" to "+96h"
+        after the run hour.
+        """
+        data = self._resolve_airquality_source(WeatherEntityFeature.FORECAST_HOURLY)
+        entries = data if isinstance(data, list) else []
+        self._airquality_hourly_index = {
+            run_hour + (position or -1): entry for position, entry in enumerate(entries)
+        }
+        self._airquality_forecast_fields = {
+            hour: self._to_forecast_airquality_fields(entry)
+            for hour, entry in self._airquality_hourly_index.items()
+        }
+
+    def _get_airquality_hourly_index(self) -> dict[int, dict]:
+        """Return the hourly air quality entries keyed by epoch hour."""
+        return self._airquality_hourly_index
+
+    def _get_airquality_forecast_fields(self) -> dict[int, dict]:
+        """Return the air quality forecast fields keyed by epoch hour."""
+        return self._airquality_forecast_fields
+
+    def _get_cached_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the cached hourly forecast if it is valid for the current hour."""
+        current_hour = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        )
+        if (
+            self._forecast_hourly_cache is not None
+            and self._forecast_hourly_cache_update == self.latest_update
+            and self._forecast_hourly_cache_hour == current_hour
+        ):
+            return self._forecast_hourly_cache
+        return None
+
     def get_forecast_hourly(self) -> list[Forecast] | None:
         start_time = time.perf_counter()
-        weather_interval = 1
         # now = dt.now()
         now = datetime.now(timezone.utc)
         current_hour = now.replace(minute=0, second=0, microsecond=0)
         # Check if cache is valid
-        if (
-            self._forecast_hourly_cache is not None
-            and self._forecast_hourly_cache_update == self.latest_update
-            and self._forecast_hourly_cache_hour == current_hour
-        ):
+        cached = self._get_cached_forecast_hourly()
+        if cached is not None:
             _LOGGER.debug("Hourly forecast cache hit")
             end_time = time.perf_counter()
             _LOGGER.info(
                 f"get_forecast_hourly (cached) executed in {end_time - start_time:.4f} seconds"
             )
-            return self._forecast_hourly_cache
+            return cached
 
         forecast_data = []
         if self.latest_update and self.dwd_weather.is_in_timerange(now):
-            timestep = datetime(
-                now.year,
-                now.month,
-                now.day,
-                now.hour,
-                tzinfo=timezone.utc,
-            )
-
-            forecast_index = 0
-            for _ in range(0, 9):
-                for _ in range(int(24 / weather_interval)):
-                    condition = self.dwd_weather.get_timeframe_condition(
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
-                    if (
-                        condition == "sunny"
-                        and weather_interval < 4
-                        and (
-                            timestep.hour < self.sun.riseutc(timestep).hour  # type: ignore
-                            or timestep.hour > self.sun.setutc(timestep).hour  # type: ignore
-                        )
-                    ):
-                        condition = "clear-night"
-                    temp_max = self.dwd_weather.get_timeframe_max(
-                        WeatherDataType.TEMPERATURE,
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
+            if self._can_roll_forward_forecast_hourly(current_hour):
+                forecast_data = self._roll_forward_forecast_hourly(current_hour)
+            else:
+                forecast_data = self._build_forecast_hourly(
+                    current_hour, FORECAST_HOURLY_STEPS
+                )
+        end_time = time.perf_counter()
+        _LOGGER.info(
+            f"get_forecast_hourly executed in {end_time - start_time:.4f} seconds"
+        )
+        # Update cache
+        self._forecast_hourly_cache = forecast_data
+        self._forecast_hourly_cache_update = self.latest_update
+        self._forecast_hourly_cache_hour = current_hour
+        return forecast_data
 
-                    if self.supports_apparent_temperature():
-                        apparent_temp = self.dwd_weather.get_apparent_temperature(
-                            shouldUpdate=False
-                        )
+    def _can_roll_forward_forecast_hourly(self, current_hour: datetime) -> bool:
+        """Return whether the cached hourly forecast only has to be shifted.
+
+        This is the case if no new data arrived since the cache was built and
+        only the hour advanced. The UV table is anchored at the current local
+        day, so a new day still rebuilds all entries.
+        """
+        cache = self._forecast_hourly_cache
+        cache_hour = self._forecast_hourly_cache_hour
+        return (
+            bool(cache)
+            and len(cache) == FORECAST_HOURLY_STEPS
+            and self._forecast_hourly_cache_update == self.latest_update
+            and cache_hour < current_hour
+            and dt.as_local(cache_hour).date() == dt.as_local(current_hour).date()
+        )
 
-                    dew_point = self.dwd_weather.get_timeframe_max(
-                        WeatherDataType.DEWPOINT,
-                        timestep,
-                        weather_interval,
-                        False,
+    def _roll_forward_forecast_hourly(self, current_hour: datetime) -> list[Forecast]:
+        """Drop the expired head of the cached forecast and build the new tail."""
+        expired = int(
+            (current_hour - self._forecast_hourly_cache_hour).total_seconds() // 3600
+        )
+        _LOGGER.debug("Rolling hourly forecast forward by %s hours", expired)
+        kept = self._forecast_hourly_cache[expired:]
+        tail = self._build_forecast_hourly(
+            current_hour + timedelta(hours=len(kept)),
+            FORECAST_HOURLY_STEPS - len(kept),
+        )
+        return kept + tail
+
+    def _get_forecast_columns(self) -> dict[str, list]:
+        """Return the forecast columns converted to their units, once per update.
+
+        The raw values are rounded to two decimals first, like the reductions
+        of the library, before they are converted.
+        """
+        if self._forecast_columns_update != self.latest_update:
+            columns = self.get_forecast_store().columns
+            rounded = {
+                data_type: round_series(columns[data_type], 2)
+                for data_type in (
+                    WeatherDataType.TEMPERATURE,
+                    WeatherDataType.DEWPOINT,
+                    WeatherDataType.PRESSURE,
+                    WeatherDataType.WIND_SPEED,
+                    WeatherDataType.WIND_GUSTS,
+                    WeatherDataType.HUMIDITY,
+                )
+            }
+            self._forecast_columns = {
+                ATTR_FORECAST_NATIVE_TEMP: kelvin_to_celsius(
+                    rounded[WeatherDataType.TEMPERATURE]
+                ),
+                ATTR_FORECAST_NATIVE_DEW_POINT: kelvin_to_celsius(
+                    rounded[WeatherDataType.DEWPOINT]
+                ),
+                ATTR_FORECAST_PRESSURE: pa_to_hpa(rounded[WeatherDataType.PRESSURE]),
+                ATTR_FORECAST_NATIVE_WIND_SPEED: ms_to_kmh(
+                    rounded[WeatherDataType.WIND_SPEED]
+                ),
+                ATTR_WEATHER_WIND_GUST_SPEED: ms_to_kmh(
+                    rounded[WeatherDataType.WIND_GUSTS]
+                ),
+                ATTR_FORECAST_HUMIDITY_ABSOLUTE: absolute_humidity_from_kelvin(
+                    rounded[WeatherDataType.TEMPERATURE],
+                    rounded[WeatherDataType.HUMIDITY],
+                ),
+            }
+            points = self._get_wind_direction_points()
+            if points is not None:
+                # Hours without a wind direction count as north
+                self._forecast_columns[ATTR_FORECAST_WIND_BEARING] = (
+                    wind_direction_symbols(
+                        (
+                            0.0 if value is None else value
+                            for value in round_series(
+                                columns[WeatherDataType.WIND_DIRECTION], 2
+                            )
+                        ),
+                        points,
                     )
+                )
+            self._forecast_columns_update = self.latest_update
+        return self._forecast_columns
+
+    def _build_forecast_hourly(self, start: datetime, steps: int) -> list[Forecast]:
+        """Build the hourly forecast entries in one pass over the forecast timeline.
+
+        Each entry holds the values of a single hour, so the max, min, sum and
+        avg of the hourly window reduce to reading that hour from the store.
+        """
+        store = self.get_forecast_store()
+        # Additional attributes raises errors when parsed in HA weather template so this has to be optional
+        with_additional_attributes = self._config[CONF_ADDITIONAL_FORECAST_ATTRIBUTES]
+        with_airquality = (
+            with_additional_attributes
+            and self._config[CONF_DOWNLOAD_AIRQUALITY]
+            and self._airquality_hourly is not None
+        )
+        if with_airquality:
+            airquality_fields = self._get_airquality_forecast_fields()
+        with_apparent_temperature = self.supports_apparent_temperature()
+        if with_apparent_temperature:
+            apparent_temperature_index = self._get_apparent_temperature_index()
+            apparent_temperatures = dict(
+                zip(
+                    apparent_temperature_index,
+                    kelvin_to_celsius(apparent_temperature_index.values()),
+                )
+            )
+        uv_indices = self._get_uv_indices()
+        local_tz = dt.get_default_time_zone()
+
+        columns = store.columns
+        wind_direction = columns[WeatherDataType.WIND_DIRECTION]
+        precipitation = columns[WeatherDataType.PRECIPITATION]
+        precipitation_probability = columns[WeatherDataType.PRECIPITATION_PROBABILITY]
+        precipitation_duration = columns[WeatherDataType.PRECIPITATION_DURATION]
+        cloud_coverage = columns[WeatherDataType.CLOUD_COVERAGE]
+        visibility = columns[WeatherDataType.VISIBILITY]
+        sun_duration = columns[WeatherDataType.SUN_DURATION]
+        sun_irradiance = columns[WeatherDataType.SUN_IRRADIANCE]
+        fog_probability = columns[WeatherDataType.FOG_PROBABILITY]
+        humidity_column = columns[WeatherDataType.HUMIDITY]
+        evaporation = columns[WeatherDataType.EVAPORATION]
+        converted = self._get_forecast_columns()
+        temperature_celsius = converted[ATTR_FORECAST_NATIVE_TEMP]
+        dew_point_celsius = converted[ATTR_FORECAST_NATIVE_DEW_POINT]
+        pressure_hpa = converted[ATTR_FORECAST_PRESSURE]
+        wind_speed_kmh = converted[ATTR_FORECAST_NATIVE_WIND_SPEED]
+        wind_gusts_kmh = converted[ATTR_WEATHER_WIND_GUST_SPEED]
+        humidity_absolute = converted[ATTR_FORECAST_HUMIDITY_ABSOLUTE]
+        wind_direction_symbol = converted.get(ATTR_FORECAST_WIND_BEARING)
+
+        def converted_value(column, position: int | None):
+            return column[position] if position is not None else None
+
+        def value(column, position: int | None):
+            if position is None:
+                return None
+            result = column[position]
+            # NaN marks a missing value
+            return round(result, 2) if result == result else None
+
+        def total(column, position: int | None):
+            result = value(column, position)
+            return result if result is not None else 0.0
+
+        time_axis = store.time_axis
+        first_hour = epoch_hour(start)
+        forecast_data = []
+        for hour in range(first_hour, first_hour + steps):
+            timestep = time_axis.datetime(hour)
+            position = store.position(hour)
+
+            condition = (
+                condition_text(store.conditions[position])
+                if position is not None
+                else None
+            )
+            if condition == "sunny" and self._is_night_hour(timestep):
+                condition = "clear-night"
 
-                    wind_dir = self.dwd_weather.get_timeframe_avg(
-                        WeatherDataType.WIND_DIRECTION,
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
+            if wind_direction_symbol is not None:
+                wind_dir = (
+                    wind_direction_symbol[position] if position is not None else ""
+                )
+            else:
+                wind_dir = value(wind_direction, position)
+                if position is not None and wind_dir is None:
+                    wind_dir = 0.0
+
+            precipitation_prop = value(precipitation_probability, position)
+            if precipitation_prop is not None:
+                precipitation_prop = int(precipitation_prop)
+
+            data_item = {
+                ATTR_FORECAST_TIME: time_axis.iso(hour),
+                ATTR_FORECAST_CLOUD_COVERAGE: value(cloud_coverage, position),
+                ATTR_FORECAST_CONDITION: condition,
+                ATTR_FORECAST_NATIVE_DEW_POINT: converted_value(
+                    dew_point_celsius, position
+                ),
+                ATTR_FORECAST_NATIVE_PRECIPITATION: total(precipitation, position),
+                ATTR_FORECAST_PRECIPITATION_PROBABILITY: precipitation_prop,
+                ATTR_FORECAST_PRESSURE: converted_value(pressure_hpa, position),
+                ATTR_FORECAST_NATIVE_TEMP: converted_value(
+                    temperature_celsius, position
+                ),
+                ATTR_WEATHER_UV_INDEX: uv_indices.get(
+                    time_axis.local_date(hour, local_tz)
+                ),
+                ATTR_FORECAST_NATIVE_WIND_SPEED: converted_value(
+                    wind_speed_kmh, position
+                ),
+                ATTR_WEATHER_WIND_GUST_SPEED: converted_value(wind_gusts_kmh, position),
+                ATTR_FORECAST_WIND_BEARING: wind_dir,
+            }
+            if with_apparent_temperature:
+                data_item[ATTR_FORECAST_APPARENT_TEMP] = apparent_temperatures.get(hour)
+            if with_additional_attributes:
+                data_item.update(
+                    {
+                        ATTR_FORECAST_EVAPORATION: value(evaporation, position),
+                        ATTR_FORECAST_FOG_PROBABILITY: value(fog_probability, position),
+                        ATTR_FORECAST_SUN_IRRADIANCE: total(sun_irradiance, position),
+                        ATTR_FORECAST_VISIBILITY: value(visibility, position),
+                        ATTR_FORECAST_SUN_DURATION: total(sun_duration, position),
+                        ATTR_FORECAST_PRECIPITATION_DURATION: value(
+                            precipitation_duration, position
+                        ),
+                        ATTR_FORECAST_HUMIDITY: value(humidity_column, position),
+                        ATTR_FORECAST_HUMIDITY_ABSOLUTE: converted_value(
+                            humidity_absolute, position
+                        ),
+                    }
+                )
+                if with_airquality:
+                    data_item.update(airquality_fields.get(hour, {}))
+            forecast_data.append(data_item)
+        return forecast_data
 
-                    if (
-                        self._config[CONF_WIND_DIRECTION_TYPE]
-                        != DEFAULT_WIND_DIRECTION_TYPE
-                    ):
-                        wind_dir = self.get_wind_direction_symbol(wind_dir)
-
-                    precipitation_prop = self.dwd_weather.get_timeframe_max(
-                        WeatherDataType.PRECIPITATION_PROBABILITY,
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
-                    if precipitation_prop is not None:
-                        precipitation_prop = int(precipitation_prop)
+    def get_forecast_interval(self, interval: int) -> list[Forecast] | None:
+        """Return the forecast in steps of interval hours, starting now."""
+        if interval not in ROLLUP_INTERVALS:
+            return None
+        current_hour = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        )
+        version = (self.latest_update, current_hour)
+        cached = self._forecast_interval_cache.get(interval)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-                    uv_index = (
-                        self.dwd_weather.get_uv_index(
-                            timestep.day - now.day, shouldUpdate=False
-                        )
-                        if timestep.day - now.day >= 0 and timestep.day - now.day < 3
-                        else None
-                    )
-                    wind_speed = self.dwd_weather.get_timeframe_max(
-                        WeatherDataType.WIND_SPEED,
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
-                    wind_gusts = self.dwd_weather.get_timeframe_max(
-                        WeatherDataType.WIND_GUSTS,
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
-                    pressure = self.dwd_weather.get_timeframe_max(
-                        WeatherDataType.PRESSURE,
-                        timestep,
-                        weather_interval,
-                        False,
-                    )
+        forecast_data = []
+        if self.latest_update and self.dwd_weather.is_in_timerange(current_hour):
+            forecast_data = self._build_forecast_interval(
+                self.get_forecast_store().rollup(interval, dt.get_default_time_zone()),
+                current_hour,
+            )
+        self._forecast_interval_cache[interval] = (version, forecast_data)
+        return forecast_data
+
+    def _build_forecast_interval(
+        self, rollup: Rollup, current_hour: datetime
+    ) -> list[Forecast]:
+        """Convert the buckets of a rollup level to forecast entries.
+
+        The fields are reduced like in the daily forecast: temperature max and
+        min, sums for precipitation and sun, the circular mean of the wind
+        direction and the combined condition.
+        """
+        temp_digits = 1
+        if rollup.interval == 24 and not self._config[CONF_DAILY_TEMP_HIGH_PRECISION]:
+            temp_digits = 0
+        uv_indices = self._get_uv_indices()
+        local_tz = dt.get_default_time_zone()
+
+        time_axis = self.get_forecast_store().time_axis
+        forecast_data = []
+        start = rollup.position(epoch_hour(current_hour))
+        if start is None:
+            return forecast_data
+        positions = range(start, len(rollup))
+        temperatures_max = kelvin_to_celsius(
+            (
+                rollup.max(WeatherDataType.TEMPERATURE, position)
+                for position in positions
+            ),
+            temp_digits,
+        )
+        temperatures_min = kelvin_to_celsius(
+            (
+                rollup.min(WeatherDataType.TEMPERATURE, position)
+                for position in positions
+            ),
+            temp_digits,
+        )
+        dew_points = kelvin_to_celsius(
+            rollup.max(WeatherDataType.DEWPOINT, position) for position in positions
+        )
+        pressures = pa_to_hpa(
+            rollup.max(WeatherDataType.PRESSURE, position) for position in positions
+        )
+        wind_speeds = ms_to_kmh(
+            rollup.max(WeatherDataType.WIND_SPEED, position) for position in positions
+        )
+        wind_gusts = ms_to_kmh(
+            rollup.max(WeatherDataType.WIND_GUSTS, position) for position in positions
+        )
+        wind_directions = [rollup.wind_direction(position) for position in positions]
+        points = self._get_wind_direction_points()
+        if points is not None:
+            wind_directions = wind_direction_symbols(wind_directions, points)
+        for index, position in enumerate(positions):
+            hour = rollup.hours[position]
+            timestep = time_axis.datetime(hour)
+            condition = rollup.condition(position)
+            if (
+                condition == "sunny"
+                and rollup.interval < 4
+                and self._is_night_hour(timestep)
+            ):
+                condition = "clear-night"
+            wind_dir = wind_directions[index]
+            precipitation_prop = rollup.max(
+                WeatherDataType.PRECIPITATION_PROBABILITY, position
+            )
 
-                    data_item = {
-                        ATTR_FORECAST_TIME: timestep.strftime("%Y-%m-%dT%H:00:00Z"),
-                        ATTR_FORECAST_CLOUD_COVERAGE: self.dwd_weather.get_timeframe_max(
-                            WeatherDataType.CLOUD_COVERAGE,
-                            timestep,
-                            weather_interval,
-                            False,
+            data_item = {
+                ATTR_FORECAST_TIME: time_axis.iso(hour),
+                ATTR_FORECAST_CLOUD_COVERAGE: rollup.max(
+                    WeatherDataType.CLOUD_COVERAGE, position
+                ),
+                ATTR_FORECAST_CONDITION: condition,
+                ATTR_FORECAST_NATIVE_DEW_POINT: dew_points[index],
+                ATTR_FORECAST_NATIVE_PRECIPITATION: rollup.sum(
+                    WeatherDataType.PRECIPITATION, position
+                ),
+                ATTR_FORECAST_PRECIPITATION_PROBABILITY: int(precipitation_prop)
+                if precipitation_prop is not None
+                else None,
+                ATTR_FORECAST_PRESSURE: pressures[index],
+                ATTR_FORECAST_NATIVE_TEMP: temperatures_max[index],
+                ATTR_FORECAST_NATIVE_TEMP_LOW: temperatures_min[index],
+                ATTR_WEATHER_UV_INDEX: uv_indices.get(
+                    time_axis.local_date(hour, local_tz)
+                ),
+                ATTR_FORECAST_NATIVE_WIND_SPEED: wind_speeds[index],
+                ATTR_WEATHER_WIND_GUST_SPEED: wind_gusts[index],
+                ATTR_FORECAST_WIND_BEARING: wind_dir,
+            }
+            # Additional attributes raises errors when parsed in HA weather template so this has to be optional
+            if self._config[CONF_ADDITIONAL_FORECAST_ATTRIBUTES]:
+                data_item.update(
+                    {
+                        ATTR_FORECAST_EVAPORATION: rollup.max(
+                            WeatherDataType.EVAPORATION, position
+                        ),
+                        ATTR_FORECAST_FOG_PROBABILITY: rollup.max(
+                            WeatherDataType.FOG_PROBABILITY, position
+                        ),
+                        ATTR_FORECAST_SUN_IRRADIANCE: rollup.sum(
+                            WeatherDataType.SUN_IRRADIANCE, position
                         ),
-                        ATTR_FORECAST_CONDITION: condition,
-                        ATTR_FORECAST_NATIVE_DEW_POINT: round(dew_point - 273.1, 1)
-                        if dew_point is not None
-                        else None,
-                        ATTR_FORECAST_NATIVE_PRECIPITATION: self.dwd_weather.get_timeframe_sum(
-                            WeatherDataType.PRECIPITATION,
-                            timestep,
-                            weather_interval,
-                            False,
+                        ATTR_FORECAST_VISIBILITY: rollup.min(
+                            WeatherDataType.VISIBILITY, position
                         ),
-                        ATTR_FORECAST_PRECIPITATION_PROBABILITY: precipitation_prop,
-                        ATTR_FORECAST_PRESSURE: round(pressure / 100, 1)
-                        if pressure is not None
-                        else None,
-                        ATTR_FORECAST_NATIVE_TEMP: round(temp_max - 273.1, 1)
-                        if temp_max is not None
-                        else None,
-                        ATTR_WEATHER_UV_INDEX: uv_index,
-                        ATTR_FORECAST_NATIVE_WIND_SPEED: (
-                            round(wind_speed * 3.6, 1)
-                            if wind_speed is not None
-                            else None
+                        ATTR_FORECAST_SUN_DURATION: rollup.sum(
+                            WeatherDataType.SUN_DURATION, position
                         ),
-                        ATTR_WEATHER_WIND_GUST_SPEED: (
-                            round(wind_gusts * 3.6, 1)
-                            if wind_gusts is not None
-                            else None
+                        ATTR_FORECAST_PRECIPITATION_DURATION: rollup.sum(
+                            WeatherDataType.PRECIPITATION_DURATION, position
+                        ),
+                        ATTR_FORECAST_HUMIDITY: rollup.max(
+                            WeatherDataType.HUMIDITY, position
                         ),
-                        ATTR_FORECAST_WIND_BEARING: wind_dir,
                     }
-                    if self.supports_apparent_temperature():
-                        data_item[ATTR_FORECAST_APPARENT_TEMP] = (
-                            round(apparent_temp - 273.1, 1)
-                            if apparent_temp is not None
-                            else None
-                        )
-                    # Additional attributes raises errors when parsed in HA weather template so this has to be optional
-                    if self._config[CONF_ADDITIONAL_FORECAST_ATTRIBUTES]:
-                        temp_min = self.dwd_weather.get_timeframe_min(
-                            WeatherDataType.TEMPERATURE,
-                            timestep,
-                            weather_interval,
-                            False,
-                        )
-                        humidity = self.dwd_weather.get_timeframe_max(
-                            WeatherDataType.HUMIDITY,
-                            timestep,
-                            weather_interval,
-                            False,
-                        )
-                        if humidity is not None and temp_min is not None:
-                            humidity_absolute = self.calculate_absolute_humidity(
-                                temp_min - 273.15, humidity
-                            )
-                        data_item.update(
-                            {
-                                ATTR_FORECAST_EVAPORATION: self.dwd_weather.get_timeframe_max(
-                                    WeatherDataType.EVAPORATION,
-                                    timestep,
-                                    weather_interval,
-                                    False,
-                                ),
-                                ATTR_FORECAST_FOG_PROBABILITY: self.dwd_weather.get_timeframe_max(
-                                    WeatherDataType.FOG_PROBABILITY,
-                                    timestep,
-                                    weather_interval,
-                                    False,
-                                ),
-                                ATTR_FORECAST_SUN_IRRADIANCE: self.dwd_weather.get_timeframe_sum(
-                                    WeatherDataType.SUN_IRRADIANCE,
-                                    timestep,
-                                    weather_interval,
-                                    False,
-                                ),
-                                ATTR_FORECAST_VISIBILITY: self.dwd_weather.get_timeframe_min(
-                                    WeatherDataType.VISIBILITY,
-                                    timestep,
-                                    weather_interval,
-                                    False,
-                                ),
-                                ATTR_FORECAST_SUN_DURATION: self.dwd_weather.get_timeframe_sum(
-                                    WeatherDataType.SUN_DURATION,
-                                    timestep,
-                                    weather_interval,
-                                    False,
-                                ),
-                                ATTR_FORECAST_PRECIPITATION_DURATION: self.dwd_weather.get_timeframe_max(
-                                    WeatherDataType.PRECIPITATION_DURATION,
-                                    timestep,
-                                    weather_interval,
-                                    False,
-                                ),
-                                ATTR_FORECAST_HUMIDITY: humidity,
-                                ATTR_FORECAST_HUMIDITY_ABSOLUTE: humidity_absolute,
-                            }
-                        )
-                        if (
-                            self._config[CONF_DOWNLOAD_AIRQUALITY]
-                            and self._airquality_hourly is not None
-                        ):
-                            data_item.update(
-                                self._get_airquality_forecast_values(
-                                    WeatherEntityFeature.FORECAST_HOURLY,
-                                    forecast_index,
-                                )
-                            )
-                    forecast_data.append(data_item)
-                    forecast_index += 1
-                    timestep += timedelta(hours=weather_interval)
-        end_time = time.perf_counter()
-        _LOGGER.info(
-            f"get_forecast_hourly executed in {end_time - start_time:.4f} seconds"
-        )
-        # Update cache
-        self._forecast_hourly_cache = forecast_data
-        self._forecast_hourly_cache_update = self.latest_update
-        self._forecast_hourly_cache_hour = current_hour
+                )
+            forecast_data.append(data_item)
         return forecast_data
 
+    def _get_cached_forecast_daily(self) -> list[Forecast] | None:
+        """Return the cached daily forecast if it is valid for the current day."""
+        if (
+            self._forecast_daily_cache is not None
+            and self._forecast_daily_cache_update == self.latest_update
+            and self._forecast_daily_cache_day == dt.now().date()
+        ):
+            return self._forecast_daily_cache
+        return None
+
     def get_forecast_daily(self) -> list[Forecast] | None:
         start_time = time.perf_counter()
         weather_interval = 24
         now = dt.now()
         # Check if cache is valid
         current_day = now.date()
-        if (
-            self._forecast_daily_cache is not None
-            and self._forecast_daily_cache_update == self.latest_update
-            and self._forecast_daily_cache_day == current_day
-        ):
+        cached = self._get_cached_forecast_daily()
+        if cached is not None:
             _LOGGER.debug("Daily forecast cache hit")
             end_time = time.perf_counter()
             _LOGGER.info(
                 f"get_forecast_daily (cached) executed in {end_time - start_time:.4f} seconds"
             )
-            return self._forecast_daily_cache
+            return cached
 
         forecast_data = []
         if self.latest_update and self.dwd_weather.is_in_timerange(now):
@@ -619,152 +1292,105 @@ class DWDWeatherData:
                 tzinfo=now.tzinfo,
             )
 
-            for day_index in range(0, 9):
-                _LOGGER.debug("Timestep {}".format(timestep))
-                condition = self.dwd_weather.get_daily_condition(
-                    timestep,
-                    False,
-                )
-                temp_max = self.dwd_weather.get_daily_max(
-                    WeatherDataType.TEMPERATURE,
-                    timestep,
-                    False,
+            days = self.get_forecast_store().daily(now.tzinfo)
+            uv_indices = self._get_uv_indices()
+            timesteps = [
+                timestep + timedelta(hours=weather_interval) * day_index
+                for day_index in range(0, 9)
+            ]
+            aggregates = [days.get(step.date()) for step in timesteps]
+
+            def maxima(data_type: WeatherDataType):
+                return (
+                    day.maximum.get(data_type) if day is not None else None
+                    for day in aggregates
                 )
 
-                temp_min = self.dwd_weather.get_daily_min(
-                    WeatherDataType.TEMPERATURE,
-                    timestep,
-                    False,
-                )
-
-                dew_point = self.dwd_weather.get_daily_max(
-                    WeatherDataType.DEWPOINT,
-                    timestep,
-                    False,
-                )
-
-                wind_dir = self.dwd_weather.get_daily_avg(
-                    WeatherDataType.WIND_DIRECTION,
-                    timestep,
-                    False,
-                )
-
-                if (
-                    self._config[CONF_WIND_DIRECTION_TYPE]
-                    != DEFAULT_WIND_DIRECTION_TYPE
-                ):
-                    wind_dir = self.get_wind_direction_symbol(wind_dir)
+            temp_digits = 1 if self._config[CONF_DAILY_TEMP_HIGH_PRECISION] else 0
+            temperatures_max = kelvin_to_celsius(
+                maxima(WeatherDataType.TEMPERATURE), temp_digits
+            )
+            temperatures_min = kelvin_to_celsius(
+                (
+                    day.minimum.get(WeatherDataType.TEMPERATURE)
+                    if day is not None
+                    else None
+                    for day in aggregates
+                ),
+                temp_digits,
+            )
+            dew_points = kelvin_to_celsius(maxima(WeatherDataType.DEWPOINT))
+            pressures = pa_to_hpa(maxima(WeatherDataType.PRESSURE))
+            wind_speeds = ms_to_kmh(maxima(WeatherDataType.WIND_SPEED))
+            wind_gusts = ms_to_kmh(maxima(WeatherDataType.WIND_GUSTS))
+            wind_directions = [
+                day.wind_direction if day is not None else None for day in aggregates
+            ]
+            points = self._get_wind_direction_points()
+            if points is not None:
+                wind_directions = wind_direction_symbols(wind_directions, points)
+            for day_index, (timestep, day) in enumerate(zip(timesteps, aggregates)):
+                _LOGGER.debug("Timestep {}".format(timestep))
+                if day is not None:
+                    maximum = day.maximum
+                    minimum = day.minimum
+                    total = day.total
+                    condition = day.condition
+                else:
+                    maximum = minimum = total = {}
+                    condition = None
 
-                precipitation_prop = self.dwd_weather.get_daily_max(
-                    WeatherDataType.PRECIPITATION_PROBABILITY,
-                    timestep,
-                    False,
+                precipitation_prop = maximum.get(
+                    WeatherDataType.PRECIPITATION_PROBABILITY
                 )
                 if precipitation_prop is not None:
                     precipitation_prop = int(precipitation_prop)
 
-                uv_index = (
-                    self.dwd_weather.get_uv_index(
-                        timestep.day - now.day, shouldUpdate=False
-                    )
-                    if timestep.day - now.day >= 0 and timestep.day - now.day < 3
-                    else None
-                )
-                wind_speed = self.dwd_weather.get_daily_max(
-                    WeatherDataType.WIND_SPEED,
-                    timestep,
-                    False,
-                )
-                wind_gusts = self.dwd_weather.get_daily_max(
-                    WeatherDataType.WIND_GUSTS,
-                    timestep,
-                    False,
-                )
-                pressure = self.dwd_weather.get_daily_max(
-                    WeatherDataType.PRESSURE,
-                    timestep,
-                    False,
-                )
+                uv_index = uv_indices.get(timestep.date())
 
                 data_item = {
                     ATTR_FORECAST_TIME: timestep.strftime("%Y-%m-%dT%H:00:00Z"),
-                    ATTR_FORECAST_CLOUD_COVERAGE: self.dwd_weather.get_daily_max(
-                        WeatherDataType.CLOUD_COVERAGE,
-                        timestep,
-                        False,
+                    ATTR_FORECAST_CLOUD_COVERAGE: maximum.get(
+                        WeatherDataType.CLOUD_COVERAGE
                     ),
                     ATTR_FORECAST_CONDITION: condition,
-                    ATTR_FORECAST_NATIVE_DEW_POINT: round(dew_point - 273.1, 1)
-                    if dew_point is not None
-                    else None,
-                    ATTR_FORECAST_NATIVE_PRECIPITATION: self.dwd_weather.get_daily_sum(
-                        WeatherDataType.PRECIPITATION,
-                        timestep,
-                        False,
+                    ATTR_FORECAST_NATIVE_DEW_POINT: dew_points[day_index],
+                    ATTR_FORECAST_NATIVE_PRECIPITATION: total.get(
+                        WeatherDataType.PRECIPITATION
                     ),
                     ATTR_FORECAST_PRECIPITATION_PROBABILITY: precipitation_prop,
-                    ATTR_FORECAST_PRESSURE: round(pressure / 100, 1)
-                    if pressure is not None
-                    else None,
-                    ATTR_FORECAST_NATIVE_TEMP: round(
-                        temp_max - 273.1,
-                        1 if self._config[CONF_DAILY_TEMP_HIGH_PRECISION] else 0,
-                    )
-                    if temp_max is not None
-                    else None,
-                    ATTR_FORECAST_NATIVE_TEMP_LOW: round(
-                        temp_min - 273.1,
-                        1 if self._config[CONF_DAILY_TEMP_HIGH_PRECISION] else 0,
-                    )
-                    if temp_min is not None
-                    else None,
+                    ATTR_FORECAST_PRESSURE: pressures[day_index],
+                    ATTR_FORECAST_NATIVE_TEMP: temperatures_max[day_index],
+                    ATTR_FORECAST_NATIVE_TEMP_LOW: temperatures_min[day_index],
                     ATTR_WEATHER_UV_INDEX: uv_index,
-                    ATTR_FORECAST_NATIVE_WIND_SPEED: (
-                        round(wind_speed * 3.6, 1) if wind_speed is not None else None
-                    ),
-                    ATTR_WEATHER_WIND_GUST_SPEED: (
-                        round(wind_gusts * 3.6, 1) if wind_gusts is not None else None
-                    ),
-                    ATTR_FORECAST_WIND_BEARING: wind_dir,
+                    ATTR_FORECAST_NATIVE_WIND_SPEED: wind_speeds[day_index],
+                    ATTR_WEATHER_WIND_GUST_SPEED: wind_gusts[day_index],
+                    ATTR_FORECAST_WIND_BEARING: wind_directions[day_index],
                 }
                 # Additional attributes raises errors when parsed in HA weather template so this has to be optional
                 if self._config[CONF_ADDITIONAL_FORECAST_ATTRIBUTES]:
                     data_item.update(
                         {
-                            ATTR_FORECAST_EVAPORATION: self.dwd_weather.get_daily_max(
-                                WeatherDataType.EVAPORATION,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_EVAPORATION: maximum.get(
+                                WeatherDataType.EVAPORATION
                             ),
-                            ATTR_FORECAST_FOG_PROBABILITY: self.dwd_weather.get_daily_max(
-                                WeatherDataType.FOG_PROBABILITY,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_FOG_PROBABILITY: maximum.get(
+                                WeatherDataType.FOG_PROBABILITY
                             ),
-                            ATTR_FORECAST_SUN_IRRADIANCE: self.dwd_weather.get_daily_sum(
-                                WeatherDataType.SUN_IRRADIANCE,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_SUN_IRRADIANCE: total.get(
+                                WeatherDataType.SUN_IRRADIANCE
                             ),
-                            ATTR_FORECAST_VISIBILITY: self.dwd_weather.get_daily_min(
-                                WeatherDataType.VISIBILITY,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_VISIBILITY: minimum.get(
+                                WeatherDataType.VISIBILITY
                             ),
-                            ATTR_FORECAST_SUN_DURATION: self.dwd_weather.get_daily_sum(
-                                WeatherDataType.SUN_DURATION,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_SUN_DURATION: total.get(
+                                WeatherDataType.SUN_DURATION
                             ),
-                            ATTR_FORECAST_PRECIPITATION_DURATION: self.dwd_weather.get_daily_sum(
-                                WeatherDataType.PRECIPITATION_DURATION,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_PRECIPITATION_DURATION: total.get(
+                                WeatherDataType.PRECIPITATION_DURATION
                             ),
-                            ATTR_FORECAST_HUMIDITY: self.dwd_weather.get_daily_max(
-                                WeatherDataType.HUMIDITY,
-                                timestep,
-                                False,
+                            ATTR_FORECAST_HUMIDITY: maximum.get(
+                                WeatherDataType.HUMIDITY
                             ),
                         }
                     )
@@ -775,7 +1401,6 @@ class DWDWeatherData:
                         )
                     )
                 forecast_data.append(data_item)
-                timestep += timedelta(hours=weather_interval)
         _LOGGER.debug("Daily Forecast data {}".format(forecast_data))
         end_time = time.perf_counter()
         _LOGGER.info(
@@ -789,17 +1414,17 @@ class DWDWeatherData:
 
     def get_condition(self):
         now = datetime.now(timezone.utc)
-        condition = self.dwd_weather.get_forecast_condition(now, False)
-        if condition == "sunny" and (
-            now.hour < self.sun.riseutc(now).hour  # type: ignore
-            or now.hour > self.sun.setutc(now).hour  # type: ignore
-        ):
+        condition = self.get_forecast_store().get_condition(now)
+        if condition == "sunny" and self._is_night_hour(now):
             condition = "clear-night"
         return condition
 
     def get_weather_report(self):
         return self._report["text"] if self._report else None
 
+    def get_weather_report_time(self):
+        return self._report["time"] if self._report else None
+
     def get_weather_value(self, data_type: WeatherDataType):
         value = None
         conf_data_type = self._config[CONF_DATA_TYPE]
@@ -817,76 +1442,22 @@ class DWDWeatherData:
         if conf_data_type == CONF_DATA_TYPE_FORECAST or (
             conf_data_type == CONF_DATA_TYPE_MIXED and value is None
         ):
-            value = self.dwd_weather.get_forecast_data(
-                data_type,
-                datetime.now(timezone.utc),
-                shouldUpdate=False,
-            )
+            value = self.get_forecast_store().get(data_type, datetime.now(timezone.utc))
 
         if self._config[CONF_INTERPOLATE] and value is not None:
-            if not hasattr(self, "_interpolate_value"):
-                self._interpolate_value = {}
-            now_time_actual = datetime.now(timezone.utc)
-            if data_type not in self._interpolate_value:
-                self._interpolate_value[data_type] = (value, now_time_actual)
-            next_value = self.dwd_weather.get_forecast_data(
-                data_type,
-                now_time_actual + timedelta(hours=1),
-                shouldUpdate=False,
+            value = round(
+                self.get_forecast_store().interpolate(
+                    data_type, datetime.now(timezone.utc), value
+                ),
+                2,
             )
-            if next_value is not None:
-                next_hour_time = self.dwd_weather.strip_to_hour(
-                    now_time_actual
-                ).replace(tzinfo=timezone.utc) + timedelta(hours=1)
-                value_diff = round(
-                    next_value - self._interpolate_value[data_type][0], 2
-                )
-                total_time_diff = (
-                    next_hour_time - self._interpolate_value[data_type][1]
-                ).seconds
-                elapsed_time_diff = (
-                    now_time_actual - self._interpolate_value[data_type][1]
-                ).seconds
-                if total_time_diff != 0:
-                    new_value = round(
-                        self._interpolate_value[data_type][0]
-                        + (value_diff * (elapsed_time_diff / total_time_diff)),
-                        2,
-                    )
-                else:
-                    new_value = self._interpolate_value[data_type][0]
-
-                self._interpolate_value[data_type] = (new_value, now_time_actual)
-                value = new_value
-
-        data_type_mapping = {
-            WeatherDataType.TEMPERATURE: lambda x: round(x - 273.1, 1),
-            WeatherDataType.DEWPOINT: lambda x: round(x - 273.1, 1),
-            WeatherDataType.PRESSURE: lambda x: round(x / 100, 1),
-            WeatherDataType.WIND_SPEED: lambda x: round(x * 3.6, 1),
-            WeatherDataType.WIND_DIRECTION: lambda x: (
-                round(x, 0)
-                if self._config[CONF_WIND_DIRECTION_TYPE] == DEFAULT_WIND_DIRECTION_TYPE
-                else self.get_wind_direction_symbol(round(x, 0))
-            ),
-            WeatherDataType.WIND_GUSTS: lambda x: round(x * 3.6, 1),
-            WeatherDataType.PRECIPITATION: lambda x: round(x, 1),
-            WeatherDataType.PRECIPITATION_PROBABILITY: lambda x: round(x, 0),
-            WeatherDataType.PRECIPITATION_DURATION: lambda x: round(x, 0),
-            WeatherDataType.CLOUD_COVERAGE: lambda x: round(x, 0),
-            WeatherDataType.VISIBILITY: lambda x: round(x / 1000, 1),
-            WeatherDataType.SUN_DURATION: lambda x: round(x, 0),
-            WeatherDataType.SUN_IRRADIANCE: lambda x: round(x / 3.6, 0),
-            WeatherDataType.FOG_PROBABILITY: lambda x: round(x, 0),
-            WeatherDataType.HUMIDITY: lambda x: round(x, 1),
-        }
 
-        # Check if value is not None
         if value is not None:
-            # Check if the data_type is in the dictionary
-            if data_type in data_type_mapping:
-                # Use the corresponding calculation from the dictionary
-                value = data_type_mapping[data_type](value)
+            value = convert_series(data_type, (value,))[0]
+            if data_type == WeatherDataType.WIND_DIRECTION:
+                points = self._get_wind_direction_points()
+                if points is not None:
+                    value = wind_direction_symbols((value,), points)[0]
 
         return value
 
@@ -898,7 +1469,7 @@ class DWDWeatherData:
             return None
 
         apparent_temp = self.dwd_weather.get_apparent_temperature(shouldUpdate=False)
-        return apparent_temp - 273.15 if apparent_temp is not None else None
+        return apparent_temp - ZERO_CELSIUS if apparent_temp is not None else None
 
     def get_dewpoint(self):
         return self.get_weather_value(WeatherDataType.DEWPOINT)
@@ -943,13 +1514,28 @@ class DWDWeatherData:
         return self.get_weather_value(WeatherDataType.HUMIDITY)
 
     def get_humidity_absolute(self):
-        temperature = self.get_temperature()
-        humidity = self.get_humidity()
-        abs_hum = self.calculate_absolute_humidity(temperature, humidity)
-        return abs_hum
+        return absolute_humidity((self.get_temperature(),), (self.get_humidity(),))[0]
 
     def get_uv_index(self):
-        return self.dwd_weather.get_uv_index(days_from_today=0, shouldUpdate=False)
+        return self._get_uv_indices().get(dt.now().date())
+
+    def _get_uv_indices(self) -> dict[date, int | None]:
+        """Return the UV index forecast keyed by local calendar date.
+
+        The DWD report holds today, tomorrow and the day after. The table is
+        rebuilt once per update and day.
+        """
+        today = dt.now().date()
+        version = (self.latest_update, today)
+        if self._uv_indices_version != version:
+            self._uv_indices = {
+                today + timedelta(days=offset): self.dwd_weather.get_uv_index(
+                    offset, shouldUpdate=False
+                )
+                for offset in range(3)
+            }
+            self._uv_indices_version = version
+        return self._uv_indices
 
     def _resolve_airquality_source(
         self, forecast_type: WeatherEntityFeature
@@ -983,29 +1569,29 @@ class DWDWeatherData:
             return None
 
         if isinstance(data, list):
-            return data[0] if len(data) > 0 else None
+            index = self._get_airquality_hourly_index()
+            current_hour = epoch_hour(datetime.now(timezone.utc))
+            # A run has no column for its own hour, the hour before stands in
+            entry = index.get(current_hour)
+            return entry if entry is not None else index.get(current_hour - 1)
         return data
 
     def get_airquality_hourly(self):
-        data = self._resolve_airquality_source(WeatherEntityFeature.FORECAST_HOURLY)
-        if not isinstance(data, list) or len(data) == 0:
-            return []
-
-        timestamp = datetime.now(timezone.utc).replace(
-            minute=0, second=0, microsecond=0
-        )
+        index = self._get_airquality_hourly_index()
+        current_hour = epoch_hour(datetime.now(timezone.utc))
+        time_axis = self.get_forecast_store().time_axis
         result = []
-        for index, item in enumerate(data):
+        for hour, item in index.items():
+            if hour < current_hour:
+                continue
             if (
                 self._config[CONF_SENSOR_FORECAST_STEPS]
-                and index >= self._config[CONF_SENSOR_FORECAST_STEPS]
+                and len(result) >= self._config[CONF_SENSOR_FORECAST_STEPS]
             ):
                 break
             result.append(
                 {
-                    ATTR_FORECAST_TIME: (timestamp + timedelta(hours=index)).strftime(
-                        "%Y-%m-%dT%H:00:00Z"
-                    ),
+                    ATTR_FORECAST_TIME: time_axis.iso(hour),
                     "value": item,
                 }
             )
@@ -1053,93 +1639,93 @@ class DWDWeatherData:
 
     def get_evaporation(self):
         # Evaporation is reported as "within the last 24 hours. Therefore we have to add a day in the request"
-        return self.dwd_weather.get_daily_max(
-            WeatherDataType.EVAPORATION,
-            datetime.now() + timedelta(days=1),
-            False,
-        )
+        return self._get_evaporation_of_day((datetime.now() + timedelta(days=1)).date())
+
+    def _get_evaporation_of_day(self, day: date):
+        # The library evaluates evaporation on UTC days
+        aggregate = self.get_forecast_store().daily(timezone.utc).get(day)
+        if aggregate is None:
+            return None
+        return aggregate.maximum[WeatherDataType.EVAPORATION]
 
     def get_condition_hourly(self):
         data = []
-        forecast_data = self.dwd_weather.forecast_data
-        if forecast_data:
-            for key in forecast_data:
-                item = forecast_data[key][WeatherDataType.CONDITION.value[0]]
-                value = self.dwd_weather.weather_codes[item][0] if item != "-" else None  # type: ignore
-                data.append({ATTR_FORECAST_TIME: key, "value": value})
+        store = self.get_forecast_store()
+        for key, code in zip(store.keys, store.conditions):
+            value = condition_text(code) if code != "-" else None
+            data.append({ATTR_FORECAST_TIME: key, "value": value})
         return data
 
-    def _get_forecast_timestamp(self, key: str) -> datetime:
-        if self._forecast_timestamp_cache_update != self.latest_update:
-            self._forecast_timestamp_cache = {}
-            self._forecast_timestamp_cache_update = self.latest_update
+    def _get_hourly_series(self) -> dict[WeatherDataType, list[dict]]:
+        """Return all converted hourly sensor series, built in one pass.
+
+        The series start at the current hour, are limited to the configured
+        sensor forecast steps and are cached per update and hour. The
+        absolute humidity is derived within the same pass.
+        """
+        version = (self.latest_update, epoch_hour(datetime.now(timezone.utc)))
+        if self._hourly_series_version == version:
+            return self._hourly_series
+
+        store = self.get_forecast_store()
+        series = {}
+        humidity_absolute = []
+        if len(store):
+            start = store.first_position(version[1])
+            stop = None
+            if self._config[CONF_SENSOR_FORECAST_STEPS]:
+                stop = start + self._config[CONF_SENSOR_FORECAST_STEPS]
+            keys = store.keys[start:stop]
+            points = self._get_wind_direction_points()
+            for data_type in SENSOR_CONVERSIONS:
+                values = convert_series(data_type, store.columns[data_type][start:stop])
+                if data_type == WeatherDataType.WIND_DIRECTION and points is not None:
+                    symbols = wind_direction_symbols(values, points)
+                    values = [
+                        symbol if value is not None else None
+                        for value, symbol in zip(values, symbols)
+                    ]
+                series[data_type] = [
+                    {ATTR_FORECAST_TIME: key, "value": value}
+                    for key, value in zip(keys, values)
+                ]
+            humidity_absolute = [
+                {ATTR_FORECAST_TIME: key, "value": value}
+                for key, value in zip(
+                    keys,
+                    absolute_humidity(
+                        (item["value"] for item in series[WeatherDataType.TEMPERATURE]),
+                        (item["value"] for item in series[WeatherDataType.HUMIDITY]),
+                    ),
+                )
+                if value is not None
+            ]
+        else:
+            series = {data_type: [] for data_type in SENSOR_CONVERSIONS}
 
-        timestamp = self._forecast_timestamp_cache.get(key)
-        if timestamp is None:
-            timestamp = datetime(
-                *(time.strptime(key, "%Y-%m-%dT%H:%M:%S.%fZ")[0:6]),
-                0,
-                timezone.utc,
-            )
-            self._forecast_timestamp_cache[key] = timestamp
-        return timestamp
+        self._hourly_series = series
+        self._humidity_absolute_hourly = humidity_absolute
+        self._hourly_series_version = version
+        return series
 
     def get_hourly(self, data_type: WeatherDataType):
-        data = []
-        timestamp = datetime.now(timezone.utc)
-        timestamp = datetime(
-            timestamp.year,
-            timestamp.month,
-            timestamp.day,
-            timestamp.hour,
-            tzinfo=timezone.utc,
-        )
-        forecast_data = self.dwd_weather.forecast_data
-
-        conversion_table = {
-            WeatherDataType.TEMPERATURE: lambda value: round(value - 273.1, 1),
-            WeatherDataType.DEWPOINT: lambda value: round(value - 273.1, 1),
-            WeatherDataType.PRESSURE: lambda value: round(value / 100, 1),
-            WeatherDataType.WIND_SPEED: lambda value: round(value * 3.6, 1),
-            WeatherDataType.WIND_DIRECTION: lambda value: (
-                round(value, 0)
-                if self._config[CONF_WIND_DIRECTION_TYPE] == DEFAULT_WIND_DIRECTION_TYPE
-                else self.get_wind_direction_symbol(round(value, 0))
-            ),
-            WeatherDataType.WIND_GUSTS: lambda value: round(value * 3.6, 1),
-            WeatherDataType.PRECIPITATION: lambda value: round(value, 1),
-            WeatherDataType.PRECIPITATION_PROBABILITY: lambda value: round(value, 0),
-            WeatherDataType.PRECIPITATION_DURATION: lambda value: round(value, 1),
-            WeatherDataType.CLOUD_COVERAGE: lambda value: round(value, 0),
-            WeatherDataType.VISIBILITY: lambda value: round(value / 1000, 1),
-            WeatherDataType.SUN_DURATION: lambda value: round(value, 0),
-            WeatherDataType.SUN_IRRADIANCE: lambda value: round(value / 3.6, 0),
-            WeatherDataType.FOG_PROBABILITY: lambda value: round(value, 0),
-            WeatherDataType.HUMIDITY: lambda value: round(value, 1),
-        }
-        if forecast_data:
-            item_counter = 0
-            for key in forecast_data:
-                if (
-                    self._config[CONF_SENSOR_FORECAST_STEPS]
-                    and item_counter >= self._config[CONF_SENSOR_FORECAST_STEPS]
-                ):
-                    break
-                if self._get_forecast_timestamp(key) < timestamp:
-                    continue
-                item_counter += 1
-                item = forecast_data[key]
-                value = item[data_type.value[0]]
-                if value is not None:
-                    if data_type in conversion_table:
-                        value = conversion_table[data_type](value)
-                data.append(
-                    {
-                        ATTR_FORECAST_TIME: key,
-                        "value": value,
-                    }
-                )
+        series = self._get_hourly_series().get(data_type)
+        if series is not None:
+            return series
 
+        # Data types without a sensor are returned unconverted
+        data = []
+        store = self.get_forecast_store()
+        if len(store):
+            start = store.first_position(epoch_hour(datetime.now(timezone.utc)))
+            stop = None
+            if self._config[CONF_SENSOR_FORECAST_STEPS]:
+                stop = start + self._config[CONF_SENSOR_FORECAST_STEPS]
+            for key, value in zip(
+                store.keys[start:stop],
+                convert_series(data_type, store.columns[data_type][start:stop]),
+            ):
+                data.append({ATTR_FORECAST_TIME: key, "value": value})
         return data
 
     def get_temperature_hourly(self):
@@ -1154,10 +1740,9 @@ class DWDWeatherData:
             shouldUpdate=False
         )
         if forecast_data:
-            for key in forecast_data:
-                value = forecast_data[key]
-                if value is not None:
-                    value = round(value - 273.15, 1)
+            for key, value in zip(
+                forecast_data, shift(forecast_data.values(), -ZERO_CELSIUS, 1)
+            ):
                 data.append({ATTR_FORECAST_TIME: key, "value": value})
         return data
 
@@ -1204,31 +1789,15 @@ class DWDWeatherData:
         return self.get_hourly(WeatherDataType.HUMIDITY)
 
     def get_humidity_absolute_hourly(self):
-        temperature = self.get_hourly(WeatherDataType.TEMPERATURE)
-        humidity = self.get_hourly(WeatherDataType.HUMIDITY)
-        absolute_humidity = []
-        for temp, hum in zip(temperature, humidity):
-            if temp["value"] is not None and hum["value"] is not None:
-                abs_hum = self.calculate_absolute_humidity(temp["value"], hum["value"])
-                absolute_humidity.append(
-                    {
-                        ATTR_FORECAST_TIME: temp[ATTR_FORECAST_TIME],
-                        "value": abs_hum,
-                    }
-                )
-        return absolute_humidity
+        self._get_hourly_series()
+        return self._humidity_absolute_hourly
 
     def get_uv_index_daily(self):
+        today, tomorrow, dayaftertomorrow = self._get_uv_indices().values()
         return {
-            "today": self.dwd_weather.get_uv_index(
-                days_from_today=0, shouldUpdate=False
-            ),
-            "tomorrow": self.dwd_weather.get_uv_index(
-                days_from_today=1, shouldUpdate=False
-            ),
-            "dayaftertomorrow": self.dwd_weather.get_uv_index(
-                days_from_today=2, shouldUpdate=False
-            ),
+            "today": today,
+            "tomorrow": tomorrow,
+            "dayaftertomorrow": dayaftertomorrow,
         }
 
     def get_evaporation_daily(self):
@@ -1236,60 +1805,29 @@ class DWDWeatherData:
         for i in range(9):
             timestamp = self.dwd_weather.issue_time + timedelta(days=1 + i)  # type: ignore
             timestamp = timestamp.replace(hour=6)
-            evaporation = self.dwd_weather.get_daily_max(
-                WeatherDataType.EVAPORATION,
-                timestamp,
-                False,
-            )
             data.append(
                 {
                     ATTR_FORECAST_TIME: timestamp - timedelta(days=1),
-                    "value": evaporation,
+                    "value": self._get_evaporation_of_day(
+                        timestamp.astimezone(timezone.utc).date()
+                    ),
                 }
             )
 
         return data
 
+    def _get_wind_direction_points(self) -> int | None:
+        """Return the compass points of the wind direction type, None for degrees."""
+        return WIND_DIRECTION_POINTS.get(self._config[CONF_WIND_DIRECTION_TYPE])
+
     def get_wind_direction_symbol(self, value):
-        if value is None:
-            return ""
-        elif value < 22.5:
-            return "N"
-        elif value < 67.5:
-            return "NO"
-        elif value < 112.5:
-            return "O"
-        elif value < 157.5:
-            return "SO"
-        elif value < 202.5:
-            return "S"
-        elif value < 247.5:
-            return "SW"
-        elif value < 292.5:
-            return "W"
-        elif value < 337.5:
-            return "NW"
-        else:
-            return "N"
+        """Return the compass point of a wind direction in degrees."""
+        points = self._get_wind_direction_points() or 8
+        return wind_direction_symbols((value,), points)[0]
 
     def calculate_absolute_humidity(self, temperature, humidity) -> float:
         """Calculate absolute humidity from temperature and relative humidity."""
-        # Constants for the calculation
-        mw = 18.016  # molar mass of water g/mol
-        r = 0.083143  # Universal gas constant
-
-        abs_hum = round(
-            (
-                6.112
-                * math.exp((17.67 * temperature) / (temperature + 243.5))
-                * humidity
-                * mw
-            )
-            / ((273.15 + temperature) * r * 100),
-            1,
-        )
-
-        return abs_hum
+        return absolute_humidity((temperature,), (humidity,))[0]
 
 
 class DWDMapData:
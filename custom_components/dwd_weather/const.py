@@ -7,7 +7,7 @@ from homeassistant.const import Platform
 # Base component constants
 NAME = "DWD Weather"
 DOMAIN = "dwd_weather"
-CONF_VERSION = 13
+CONF_VERSION = 14
 ATTRIBUTION = "Data provided by Deutscher Wetterdienst (DWD)"
 # Platforms
 PLATFORMS = [
@@ -42,10 +42,15 @@ ATTR_FORECAST_AIRQUALITY_STICKSTOFFDIOXID = "airquality_stickstoffdioxid"
 DEFAULT_SCAN_INTERVAL = timedelta(minutes=1)
 DEFAULT_MAP_INTERVAL = timedelta(minutes=1)
 DEFAULT_WIND_DIRECTION_TYPE = "degrees"
+# Number of compass points of the symbolic wind direction types
+WIND_DIRECTION_POINTS = {"direction": 8, "direction_16": 16}
 DEFAULT_INTERPOLATION = True
+DEFAULT_INTERPOLATION_INTERVAL = timedelta(minutes=5)
+DEFAULT_SENSOR_DATA_FORMAT = "list"
 
 DWDWEATHER_DATA = "dwd_weather_data"
 DWDWEATHER_COORDINATOR = "dwd_weather_coordinator"
+DWDWEATHER_MOSMIX_S = "dwd_weather_mosmix_s"
 DWDWEATHER_MONITORED_CONDITIONS = "dwd_weather_monitored_conditions"
 
 CONF_ENTITY_TYPE = "entity_type"
@@ -68,6 +73,9 @@ CONF_DOWNLOAD_AIRQUALITY = "download_airquality"
 CONF_ADDITIONAL_FORECAST_ATTRIBUTES = "additional_forecast_attributes"
 CONF_DAILY_TEMP_HIGH_PRECISION = "daily_temp_high_precision"
 CONF_SENSOR_FORECAST_STEPS = "sensor_forecast_steps"
+CONF_SENSOR_DATA_FORMAT = "sensor_data_format"
+CONF_SENSOR_DATA_FORMAT_LIST = "list"
+CONF_SENSOR_DATA_FORMAT_COMPACT = "compact"
 
 CONF_MAP_TYPE = "map_type"
 CONF_MAP_TYPE_GERMANY = "map_germany"
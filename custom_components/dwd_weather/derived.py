@@ -0,0 +1,205 @@
+"""Unit conversions and derived quantities over whole forecast series."""
+
+from collections.abc import Callable, Iterable
+from functools import partial
+import math
+
+from simple_dwd_weatherforecast.dwdforecast import WeatherDataType
+
+# The displayed temperatures of this integration have always been converted
+# with 273.1, the physical formula of the absolute humidity uses 273.15.
+KELVIN_OFFSET = 273.1
+ZERO_CELSIUS = 273.15
+
+# Constants of the Magnus formula and of the absolute humidity
+_MAGNUS_A = 6.112
+_MAGNUS_B = 17.67
+_MAGNUS_C = 243.5
+_MOLAR_MASS_WATER = 18.016  # g/mol
+_GAS_CONSTANT = 0.083143
+# Constants of the relative humidity of the library
+_HUMIDITY_B = 17.5043
+_HUMIDITY_C = 241.2
+
+Series = Iterable[float | None]
+
+
+def round_series(values: Series, digits: int) -> list[float | None]:
+    """Round every value, None and NaN become None."""
+    return [
+        None if value is None or value != value else round(value, digits)
+        for value in values
+    ]
+
+
+def shift(values: Series, delta: float, digits: int) -> list[float | None]:
+    """Add delta to every value and round the result."""
+    return [
+        None if value is None or value != value else round(value + delta, digits)
+        for value in values
+    ]
+
+
+def multiply(values: Series, factor: float, digits: int) -> list[float | None]:
+    """Multiply every value by factor and round the result."""
+    return [
+        None if value is None or value != value else round(value * factor, digits)
+        for value in values
+    ]
+
+
+def divide(values: Series, divisor: float, digits: int) -> list[float | None]:
+    """Divide every value by divisor and round the result."""
+    return [
+        None if value is None or value != value else round(value / divisor, digits)
+        for value in values
+    ]
+
+
+def kelvin_to_celsius(values: Series, digits: int = 1) -> list[float | None]:
+    return shift(values, -KELVIN_OFFSET, digits)
+
+
+def ms_to_kmh(values: Series, digits: int = 1) -> list[float | None]:
+    return multiply(values, 3.6, digits)
+
+
+def pa_to_hpa(values: Series, digits: int = 1) -> list[float | None]:
+    return divide(values, 100, digits)
+
+
+def absolute_humidity(temperatures: Series, humidities: Series) -> list[float | None]:
+    """Return the absolute humidity in g/m³ from °C and relative humidity in %.
+
+    Pairs with a missing value give None.
+    """
+    exp = math.exp
+    return [
+        None
+        if temperature is None
+        or humidity is None
+        or temperature != temperature
+        or humidity != humidity
+        else round(
+            (
+                _MAGNUS_A
+                * exp((_MAGNUS_B * temperature) / (temperature + _MAGNUS_C))
+                * humidity
+                * _MOLAR_MASS_WATER
+            )
+            / ((ZERO_CELSIUS + temperature) * _GAS_CONSTANT * 100),
+            1,
+        )
+        for temperature, humidity in zip(temperatures, humidities)
+    ]
+
+
+def absolute_humidity_from_kelvin(
+    temperatures: Series, humidities: Series
+) -> list[float | None]:
+    """Return the absolute humidity from temperatures in Kelvin."""
+    return absolute_humidity(
+        (
+            None if value is None or value != value else value - ZERO_CELSIUS
+            for value in temperatures
+        ),
+        humidities,
+    )
+
+
+def relative_humidity(temperatures: Series, dew_points: Series) -> list[float | None]:
+    """Return the relative humidity in % from temperatures and dew points in Kelvin.
+
+    Uses the constants of the library, so the values equal the ones of its
+    KML parser.
+    """
+    exp = math.exp
+    result = []
+    for temperature, dew_point in zip(temperatures, dew_points):
+        if temperature is None or dew_point is None:
+            result.append(None)
+            continue
+        temperature -= KELVIN_OFFSET
+        dew_point -= KELVIN_OFFSET
+        result.append(
+            round(
+                100
+                * exp(
+                    (_HUMIDITY_B * dew_point / (_HUMIDITY_C + dew_point))
+                    - (_HUMIDITY_B * temperature / (_HUMIDITY_C + temperature))
+                ),
+                1,
+            )
+        )
+    return result
+
+
+# Conversion of the raw MOSMIX values of each data type to the sensor units
+SENSOR_CONVERSIONS: dict[WeatherDataType, Callable[[Series], list]] = {
+    WeatherDataType.TEMPERATURE: kelvin_to_celsius,
+    WeatherDataType.DEWPOINT: kelvin_to_celsius,
+    WeatherDataType.PRESSURE: pa_to_hpa,
+    WeatherDataType.WIND_SPEED: ms_to_kmh,
+    WeatherDataType.WIND_DIRECTION: partial(round_series, digits=0),
+    WeatherDataType.WIND_GUSTS: ms_to_kmh,
+    WeatherDataType.PRECIPITATION: partial(round_series, digits=1),
+    WeatherDataType.PRECIPITATION_PROBABILITY: partial(round_series, digits=0),
+    WeatherDataType.PRECIPITATION_DURATION: partial(round_series, digits=1),
+    WeatherDataType.CLOUD_COVERAGE: partial(round_series, digits=0),
+    WeatherDataType.VISIBILITY: partial(divide, divisor=1000, digits=1),
+    WeatherDataType.SUN_DURATION: partial(round_series, digits=0),
+    WeatherDataType.SUN_IRRADIANCE: partial(divide, divisor=3.6, digits=0),
+    WeatherDataType.FOG_PROBABILITY: partial(round_series, digits=0),
+    WeatherDataType.HUMIDITY: partial(round_series, digits=1),
+}
+
+
+# Compass points in the German abbreviations used by the DWD (O for east)
+WIND_DIRECTION_SYMBOLS = {
+    8: ("N", "NO", "O", "SO", "S", "SW", "W", "NW"),
+    16: (
+        "N",
+        "NNO",
+        "NO",
+        "ONO",
+        "O",
+        "OSO",
+        "SO",
+        "SSO",
+        "S",
+        "SSW",
+        "SW",
+        "WSW",
+        "W",
+        "WNW",
+        "NW",
+        "NNW",
+    ),
+}
+
+
+def wind_direction_symbols(values: Series, points: int = 8) -> list[str]:
+    """Return the compass point of every direction in degrees.
+
+    Each point covers the sector centred on it, missing values give "".
+    """
+    symbols = WIND_DIRECTION_SYMBOLS[points]
+    width = 360 / points
+    half = width / 2
+    return [
+        ""
+        if value is None or value != value
+        else symbols[int(((value + half) % 360) // width) % points]
+        for value in values
+    ]
+
+
+def convert_series(data_type: WeatherDataType, values: Series) -> list[float | None]:
+    """Convert a series of raw values to the sensor unit of its data type.
+
+    Data types without a conversion are only cleaned from NaN.
+    """
+    conversion = SENSOR_CONVERSIONS.get(data_type)
+    if conversion is None:
+        return [None if value is None or value != value else value for value in values]
+    return conversion(values)
@@ -1,6 +1,9 @@
 """DWDWeatherEntity class."""
 
 import logging
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
 from custom_components.dwd_weather.connector import DWDWeatherData
@@ -29,6 +32,7 @@ class DWDWeatherEntity:
             f"{self._connector.dwd_weather.station_id}: {self._station_name}"
         )
         self._unique_id = unique_id
+        self._written_fingerprint = None
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -50,9 +54,25 @@ class DWDWeatherEntity:
     async def async_added_to_hass(self) -> None:
         """Set up a listener and load data."""
         self.async_on_remove(  # type: ignore
-            self._coordinator.async_add_listener(self.async_write_ha_state)  # type: ignore
+            self._coordinator.async_add_listener(self._handle_coordinator_update)  # type: ignore
         )
 
+    def state_fingerprint(self) -> Any:
+        """Return a cheap value that changes whenever the written state would.
+
+        None disables the comparison and the state is written on every tick.
+        """
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if it differs from the last written one."""
+        fingerprint = self.state_fingerprint()
+        if fingerprint is not None and fingerprint == self._written_fingerprint:
+            return
+        self._written_fingerprint = fingerprint
+        self.async_write_ha_state()  # type: ignore
+
     @property
     def unique_id(self):
         """Return the unique of the sensor."""
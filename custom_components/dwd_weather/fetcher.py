@@ -0,0 +1,157 @@
+"""Conditional downloads of the DWD open data files."""
+
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+import logging
+import threading
+
+import requests
+from stream_unzip import stream_unzip
+
+from .kml import MosmixForecast, MosmixParser
+
+_LOGGER = logging.getLogger(__name__)
+
+# Response headers identifying a version of a resource and the request headers
+# to ask the server whether that version is still current
+VALIDATORS = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+}
+CHUNK_SIZE = 65536
+
+MOSMIX_S_URL = (
+    "https://opendata.dwd.de/weather/local_forecasts/mos/MOSMIX_S/all_stations/kml/"
+    "MOSMIX_S_LATEST_240.kmz"
+)
+
+
+class ConditionalFetcher:
+    """Download resources only when they changed since the last download.
+
+    The validators of each resource are kept per URL and sent with the next
+    request. A 304 Not Modified response skips the download and the parsing.
+    """
+
+    def __init__(self, session: requests.Session | None = None, timeout: int = 30):
+        """Initialize the fetcher with an optional shared session."""
+        self._session = session or requests.Session()
+        self._timeout = timeout
+        self._validators: dict[str, dict[str, str]] = {}
+
+    def _get(self, url: str, stream: bool = False) -> requests.Response:
+        headers = {
+            VALIDATORS[name]: value
+            for name, value in self._validators.get(url, {}).items()
+        }
+        return self._session.get(
+            url, headers=headers, timeout=self._timeout, stream=stream
+        )
+
+    def _store_validators(self, url: str, response: requests.Response) -> None:
+        self._validators[url] = {
+            name: response.headers[name]
+            for name in VALIDATORS
+            if name in response.headers
+        }
+
+    def fetch(self, url: str) -> bytes | None:
+        """Return the content of url, None if it did not change.
+
+        Raises requests.HTTPError for unexpected status codes.
+        """
+        response = self._get(url)
+        if response.status_code == 304:
+            _LOGGER.debug("%s not modified", url)
+            return None
+        response.raise_for_status()
+        self._store_validators(url, response)
+        return response.content
+
+    @contextmanager
+    def open(self, url: str) -> Iterator[Iterable[bytes] | None]:
+        """Stream the content of url in chunks, None if it did not change.
+
+        The validators are only stored once the block completed, so a stream
+        that failed halfway is downloaded again.
+        """
+        with self._get(url, stream=True) as response:
+            if response.status_code == 304:
+                _LOGGER.debug("%s not modified", url)
+                yield None
+                return
+            response.raise_for_status()
+            yield response.iter_content(CHUNK_SIZE)
+            self._store_validators(url, response)
+
+    def forget(self, url: str) -> None:
+        """Drop the validators of url, so the next fetch downloads it again."""
+        self._validators.pop(url, None)
+
+
+def parse_mosmix(
+    chunks: Iterable[bytes], station_ids: set[str]
+) -> dict[str, MosmixForecast]:
+    """Return the forecasts of the stations from a zipped MOSMIX file.
+
+    The file is unzipped and parsed while it is downloaded.
+    """
+    parser = MosmixParser(station_ids)
+    for _name, _size, unzipped_chunks in stream_unzip(chunks):
+        for chunk in unzipped_chunks:
+            parser.feed(chunk)
+    return parser.close()
+
+
+class MosmixSFetcher:
+    """Download each MOSMIX_S release once for all stations with hourly updates.
+
+    The file covers all stations. It is parsed once per release for the
+    registered stations, whose forecasts are then handed out without
+    downloading the file again.
+    """
+
+    def __init__(
+        self, fetcher: ConditionalFetcher | None = None, url: str = MOSMIX_S_URL
+    ) -> None:
+        """Initialize the shared fetcher."""
+        self._fetcher = fetcher or ConditionalFetcher(timeout=120)
+        self._url = url
+        self._lock = threading.Lock()
+        self._stations: Counter[str] = Counter()
+        self._parsed: frozenset[str] = frozenset()
+        self._forecasts: dict[str, MosmixForecast] = {}
+
+    @property
+    def stations(self) -> set[str]:
+        """Return the registered station IDs."""
+        return set(self._stations)
+
+    def register(self, station_id: str) -> Callable[[], None]:
+        """Register a station and return a callback to unregister it."""
+        self._stations[station_id] += 1
+
+        def unregister() -> None:
+            self._stations[station_id] -= 1
+            if self._stations[station_id] <= 0:
+                del self._stations[station_id]
+
+        return unregister
+
+    def get_forecast(self, station_id: str) -> MosmixForecast | None:
+        """Return the forecast of the station from the latest release.
+
+        The release is downloaded if it changed, or if the station was not
+        registered when the current release was parsed.
+        """
+        with self._lock:
+            if station_id not in self._parsed:
+                self._fetcher.forget(self._url)
+            with self._fetcher.open(self._url) as chunks:
+                if chunks is not None:
+                    station_ids = self.stations | {station_id}
+                    _LOGGER.debug("Parsing MOSMIX_S for stations %s", station_ids)
+                    self._forecasts = parse_mosmix(chunks, station_ids)
+                    self._parsed = frozenset(station_ids)
+            return self._forecasts.get(station_id)
@@ -0,0 +1,468 @@
+"""Columnar store for the hourly MOSMIX forecast data."""
+
+from array import array
+from collections import Counter, defaultdict
+from datetime import date, datetime, timezone, tzinfo
+import math
+
+from simple_dwd_weatherforecast import dwdforecast
+from simple_dwd_weatherforecast.dwdforecast import WeatherDataType
+
+# All numeric data types of a forecast entry. The condition is kept separately
+# as it is a weather code and not a float.
+NUMERIC_DATA_TYPES = tuple(
+    data_type for data_type in WeatherDataType if data_type != WeatherDataType.CONDITION
+)
+
+# Intervals in hours of the rollup pyramid. Each level is merged from the one
+# before, so every interval has to be a multiple of its predecessor.
+ROLLUP_INTERVALS = (1, 3, 6, 12, 24)
+
+
+def epoch_hour(timestamp: datetime) -> int:
+    """Return the number of full hours between the epoch and the timestamp."""
+    return int(timestamp.timestamp() // 3600)
+
+
+def index_by_hour(series: dict[str, float | None] | None) -> dict[int, float | None]:
+    """Index a series keyed by "YYYY-MM-DDTHH:00:00.000Z" strings by epoch hour."""
+    return {
+        epoch_hour(datetime.fromisoformat(key)): value
+        for key, value in (series or {}).items()
+    }
+
+
+def condition_text(code: str | None) -> str | None:
+    """Map a MOSMIX weather code to the condition used by Home Assistant."""
+    if code is None:
+        return None
+    entry = dwdforecast.Weather.weather_codes.get(code)
+    return entry[0] if entry is not None else None
+
+
+def aggregate_condition(codes: list[str | None]) -> str | None:
+    """Combine the weather codes of several hours into one condition.
+
+    Mirrors ``Weather.get_condition`` of the library, but works on the codes
+    instead of the forecast entries. Unknown codes are skipped like "-".
+    """
+    return condition_from_counts(Counter(codes), len(codes))
+
+
+def condition_from_counts(counts: Counter, size: int) -> str | None:
+    """Combine weather codes given as counts over ``size`` hours."""
+    if size == 0:
+        return None
+    if size == 1:
+        return condition_text(next(iter(counts)))
+
+    weather_codes = dwdforecast.Weather.weather_codes
+    weight = defaultdict(int, {"sunny": 1, "cloudy": 1})
+    for code, count in counts.items():
+        if code != "-" and code in weather_codes:
+            weight[weather_codes[code][0]] += count
+
+    cloudiness = (weight["cloudy"] + 0.5 * weight["partlycloudy"]) / weight["sunny"]
+    if cloudiness > 0.7:
+        condition = "cloudy"
+    elif cloudiness > 0.2:
+        condition = "partlycloudy"
+    else:
+        condition = "sunny"
+
+    if weight["fog"] / size > 0.5:
+        condition = "fog"
+    if weight["snowy"] / size > 0.2:
+        condition = "snowy"
+    if weight["rainy"] / size > 0.2:
+        condition = "snowy-rainy" if condition == "snowy" else "rainy"
+    if weight["lightning-rainy"] > 0:
+        condition = "lightning-rainy"
+    return condition
+
+
+def circular_mean(degrees: list[float]) -> float | None:
+    """Return the mean of angles in degrees, e.g. 350 and 10 give 0."""
+    if not degrees:
+        return None
+    sin_sum = sum(math.sin(math.radians(value)) for value in degrees)
+    cos_sum = sum(math.cos(math.radians(value)) for value in degrees)
+    return _vector_direction(sin_sum, cos_sum)
+
+
+def _vector_direction(sin_sum: float, cos_sum: float) -> float:
+    return round(math.degrees(math.atan2(sin_sum, cos_sum)) % 360, 2)
+
+
+def _to_float(value) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _from_float(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+class DailyAggregate:
+    """All reductions of the hourly columns over the entries of one day.
+
+    Min, max and sum follow the rounding of the library (two decimals, the sum
+    of a day without values is 0.0). The wind direction is averaged on the
+    circle so that a day with northerly winds does not end up at 180°.
+    """
+
+    def __init__(self, store: "ForecastStore", start: int, stop: int):
+        self.start = start
+        self.stop = stop
+        self.minimum: dict[WeatherDataType, float | None] = {}
+        self.maximum: dict[WeatherDataType, float | None] = {}
+        self.total: dict[WeatherDataType, float] = {}
+        for data_type, column in store.columns.items():
+            # NaN marks a missing value
+            values = [value for value in column[start:stop] if value == value]
+            if values:
+                self.minimum[data_type] = round(min(values), 2)
+                self.maximum[data_type] = round(max(values), 2)
+            else:
+                self.minimum[data_type] = None
+                self.maximum[data_type] = None
+            self.total[data_type] = round(sum(values), 2)
+            if data_type == WeatherDataType.WIND_DIRECTION:
+                self.wind_direction = circular_mean(values)
+        self.condition = aggregate_condition(store.conditions[start:stop])
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+
+class Rollup:
+    """Decomposable statistics of the hourly columns over fixed intervals.
+
+    Buckets are aligned to multiples of the interval in the local time of tz,
+    so the 24 hour buckets are the same days as the daily forecast. Around a
+    DST change a bucket holds one hour more or less. Each bucket keeps count,
+    min, max and sum of every column, the summed unit vectors of the wind
+    direction and the counts of the weather codes, so a coarser level can be
+    merged from the level below without the raw hours.
+    """
+
+    def __init__(self, interval: int, tz: tzinfo = timezone.utc):
+        self.interval = interval
+        self.tz = tz
+        # First epoch hour at or after the local start of each bucket
+        self.hours: list[int] = []
+        self.size: list[int] = []
+        self.count = {data_type: [] for data_type in NUMERIC_DATA_TYPES}
+        self.minimum = {data_type: [] for data_type in NUMERIC_DATA_TYPES}
+        self.maximum = {data_type: [] for data_type in NUMERIC_DATA_TYPES}
+        self.total = {data_type: [] for data_type in NUMERIC_DATA_TYPES}
+        self.direction_sin: list[float] = []
+        self.direction_cos: list[float] = []
+        self.codes: list[Counter] = []
+        self._positions: dict[int, int] = {}
+
+    @classmethod
+    def from_store(cls, store: "ForecastStore") -> "Rollup":
+        """Create the hourly level, one bucket per entry of the store."""
+        rollup = cls(1)
+        rollup.hours = list(store.hours)
+        rollup.size = [1] * len(store)
+        for data_type, column in store.columns.items():
+            # NaN marks a missing value
+            values = [value if value == value else None for value in column]
+            rollup.count[data_type] = [int(value is not None) for value in values]
+            rollup.minimum[data_type] = values
+            rollup.maximum[data_type] = values
+            rollup.total[data_type] = [value or 0.0 for value in values]
+        for value in rollup.minimum[WeatherDataType.WIND_DIRECTION]:
+            angle = math.radians(value) if value is not None else None
+            rollup.direction_sin.append(math.sin(angle) if angle is not None else 0.0)
+            rollup.direction_cos.append(math.cos(angle) if angle is not None else 0.0)
+        rollup.codes = [Counter((code,)) for code in store.conditions]
+        rollup._positions = {hour: index for index, hour in enumerate(rollup.hours)}
+        return rollup
+
+    @classmethod
+    def merge(cls, lower: "Rollup", interval: int, tz: tzinfo) -> "Rollup":
+        """Create a coarser level by merging the buckets of a finer one."""
+        rollup = cls(interval, tz)
+        groups: list[list[int]] = []
+        keys = []
+        for index, hour in enumerate(lower.hours):
+            key = rollup._bucket(hour)
+            if not keys or keys[-1] != key:
+                keys.append(key)
+                day, block = key
+                local_start = datetime(
+                    day.year, day.month, day.day, block * interval, tzinfo=tz
+                )
+                # Timezones with half hour offsets start at the next full hour
+                rollup.hours.append(math.ceil(local_start.timestamp() / 3600))
+                groups.append([])
+            groups[-1].append(index)
+
+        for group in groups:
+            rollup.size.append(sum(lower.size[index] for index in group))
+            rollup.direction_sin.append(
+                sum(lower.direction_sin[index] for index in group)
+            )
+            rollup.direction_cos.append(
+                sum(lower.direction_cos[index] for index in group)
+            )
+            codes = Counter()
+            for index in group:
+                codes.update(lower.codes[index])
+            rollup.codes.append(codes)
+        for data_type in NUMERIC_DATA_TYPES:
+            count = lower.count[data_type]
+            minimum = lower.minimum[data_type]
+            maximum = lower.maximum[data_type]
+            total = lower.total[data_type]
+            for group in groups:
+                rollup.count[data_type].append(sum(count[index] for index in group))
+                minima = [minimum[index] for index in group if count[index]]
+                maxima = [maximum[index] for index in group if count[index]]
+                rollup.minimum[data_type].append(min(minima) if minima else None)
+                rollup.maximum[data_type].append(max(maxima) if maxima else None)
+                rollup.total[data_type].append(sum(total[index] for index in group))
+        rollup._positions = {key: index for index, key in enumerate(keys)}
+        return rollup
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    def _bucket(self, hour: int) -> int | tuple[date, int]:
+        """Return the key of the bucket containing an epoch hour."""
+        if self.interval == 1:
+            return hour
+        local = datetime.fromtimestamp(hour * 3600, self.tz)
+        return local.date(), local.hour // self.interval
+
+    def position(self, hour: int) -> int | None:
+        """Return the index of the bucket containing an epoch hour."""
+        return self._positions.get(self._bucket(hour))
+
+    def min(self, data_type: WeatherDataType, position: int) -> float | None:
+        value = self.minimum[data_type][position]
+        return round(value, 2) if value is not None else None
+
+    def max(self, data_type: WeatherDataType, position: int) -> float | None:
+        value = self.maximum[data_type][position]
+        return round(value, 2) if value is not None else None
+
+    def sum(self, data_type: WeatherDataType, position: int) -> float:
+        return round(self.total[data_type][position], 2)
+
+    def avg(self, data_type: WeatherDataType, position: int) -> float | None:
+        count = self.count[data_type][position]
+        if count == 0:
+            return None
+        return round(self.total[data_type][position] / count, 2)
+
+    def wind_direction(self, position: int) -> float | None:
+        """Return the circular mean of the wind direction of a bucket."""
+        if self.count[WeatherDataType.WIND_DIRECTION][position] == 0:
+            return None
+        return _vector_direction(
+            self.direction_sin[position], self.direction_cos[position]
+        )
+
+    def condition(self, position: int) -> str | None:
+        return condition_from_counts(self.codes[position], self.size[position])
+
+
+class TimeAxis:
+    """Datetimes and formatted strings of epoch hours, converted once per hour.
+
+    Each forecast store owns one axis, so every builder of a data version
+    shares the conversions instead of formatting and parsing per entry.
+    """
+
+    def __init__(self):
+        self._datetimes: dict[int, datetime] = {}
+        self._iso: dict[int, str] = {}
+        self._local_dates: dict[tuple[tzinfo, int], date] = {}
+
+    def add(self, hour: int, timestamp: datetime):
+        """Register an already parsed timestamp of an epoch hour."""
+        self._datetimes[hour] = timestamp
+
+    def datetime(self, hour: int) -> datetime:
+        """Return the start of an epoch hour as UTC datetime."""
+        timestamp = self._datetimes.get(hour)
+        if timestamp is None:
+            timestamp = datetime.fromtimestamp(hour * 3600, timezone.utc)
+            self._datetimes[hour] = timestamp
+        return timestamp
+
+    def iso(self, hour: int) -> str:
+        """Return an epoch hour formatted as forecast time (UTC)."""
+        text = self._iso.get(hour)
+        if text is None:
+            text = self.datetime(hour).strftime("%Y-%m-%dT%H:00:00Z")
+            self._iso[hour] = text
+        return text
+
+    def local_date(self, hour: int, tz: tzinfo) -> date:
+        """Return the calendar date of an epoch hour in timezone tz."""
+        key = (tz, hour)
+        day = self._local_dates.get(key)
+        if day is None:
+            day = self.datetime(hour).astimezone(tz).date()
+            self._local_dates[key] = day
+        return day
+
+
+class ForecastStore:
+    """Hourly forecast held as one float array per WeatherDataType.
+
+    The store is built once from the ``forecast_data`` OrderedDict of the
+    library. All columns share one time axis of epoch hours (UTC), missing
+    values are stored as NaN and returned as None.
+    """
+
+    def __init__(self, forecast_data: dict | None):
+        forecast_data = forecast_data or {}
+        items = list(forecast_data.values())
+        self.keys: list[str] = list(forecast_data)
+        self.time_axis = TimeAxis()
+        self.hours = array("q")
+        for key in self.keys:
+            timestamp = datetime.fromisoformat(key)
+            hour = epoch_hour(timestamp)
+            self.hours.append(hour)
+            self.time_axis.add(hour, timestamp)
+        self._positions = {hour: position for position, hour in enumerate(self.hours)}
+        self.columns = {
+            data_type: array(
+                "d", (_to_float(item.get(data_type.value[0])) for item in items)
+            )
+            for data_type in NUMERIC_DATA_TYPES
+        }
+        self.conditions: list[str | None] = [
+            item.get(WeatherDataType.CONDITION.value[0]) for item in items
+        ]
+        self._daily: dict[tzinfo, dict[date, DailyAggregate]] = {}
+        self._rollups: dict[tzinfo, dict[int, Rollup]] = {}
+        self._segment_ends: dict[WeatherDataType, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    def position(self, hour: int) -> int | None:
+        """Return the index of an epoch hour on the time axis."""
+        return self._positions.get(hour)
+
+    def first_position(self, hour: int) -> int:
+        """Return the index of the first entry at or after an epoch hour."""
+        position = self._positions.get(hour)
+        if position is not None:
+            return position
+        for position, entry_hour in enumerate(self.hours):
+            if entry_hour >= hour:
+                return position
+        return len(self.hours)
+
+    def value_at(self, data_type: WeatherDataType, position: int) -> float | None:
+        return _from_float(self.columns[data_type][position])
+
+    def values(
+        self, data_type: WeatherDataType, start: int = 0, stop: int | None = None
+    ) -> list[float | None]:
+        """Return a slice of a column with missing values as None."""
+        return [_from_float(value) for value in self.columns[data_type][start:stop]]
+
+    def get(self, data_type: WeatherDataType, timestamp: datetime) -> float | None:
+        """Return the forecast value for the hour of the timestamp."""
+        position = self._positions.get(epoch_hour(timestamp))
+        if position is None:
+            return None
+        return _from_float(self.columns[data_type][position])
+
+    def segment_ends(self, data_type: WeatherDataType) -> array:
+        """Return the end value of the linear segment starting at each entry.
+
+        A segment runs from the value of an hour to the value of the next hour.
+        Where the next hour is missing, the end is NaN and the value is held.
+        """
+        ends = self._segment_ends.get(data_type)
+        if ends is None:
+            column = self.columns[data_type]
+            ends = array("d", [math.nan] * len(column))
+            for position in range(len(column) - 1):
+                if self.hours[position + 1] == self.hours[position] + 1:
+                    ends[position] = column[position + 1]
+            self._segment_ends[data_type] = ends
+        return ends
+
+    def interpolate(
+        self,
+        data_type: WeatherDataType,
+        timestamp: datetime,
+        start: float | None = None,
+    ) -> float | None:
+        """Return the value on the segment of the hour of the timestamp.
+
+        start replaces the forecast value at the beginning of the hour, e.g.
+        with a measured value, the segment still ends at the next forecast.
+        """
+        hour = epoch_hour(timestamp)
+        position = self._positions.get(hour)
+        if position is None:
+            return start
+        if start is None:
+            start = _from_float(self.columns[data_type][position])
+            if start is None:
+                return None
+        end = self.segment_ends(data_type)[position]
+        if math.isnan(end):
+            return start
+        fraction = (timestamp.timestamp() - hour * 3600) / 3600
+        return start + (end - start) * fraction
+
+    def get_condition(self, timestamp: datetime) -> str | None:
+        """Return the condition for the hour of the timestamp."""
+        position = self._positions.get(epoch_hour(timestamp))
+        if position is None:
+            return None
+        return condition_text(self.conditions[position])
+
+    def daily(self, tz: tzinfo) -> dict[date, DailyAggregate]:
+        """Return the reductions of each day, with days taken in timezone tz.
+
+        The entries are grouped in a single pass over the time axis. The result
+        is kept per timezone for the lifetime of the store.
+        """
+        days = self._daily.get(tz)
+        if days is not None:
+            return days
+        days = {}
+        start = 0
+        current_day = None
+        for position, hour in enumerate(self.hours):
+            day = datetime.fromtimestamp(hour * 3600, tz).date()
+            if day != current_day:
+                if current_day is not None:
+                    days[current_day] = DailyAggregate(self, start, position)
+                current_day = day
+                start = position
+        if current_day is not None:
+            days[current_day] = DailyAggregate(self, start, len(self.hours))
+        self._daily[tz] = days
+        return days
+
+    def rollup(self, interval: int, tz: tzinfo = timezone.utc) -> Rollup:
+        """Return the rollup level of an interval out of ROLLUP_INTERVALS.
+
+        The buckets are aligned in timezone tz. All levels are built together
+        on first use, each one merged from the level below, and kept per
+        timezone for the lifetime of the store.
+        """
+        rollups = self._rollups.get(tz)
+        if rollups is None:
+            level = Rollup.from_store(self)
+            rollups = {level.interval: level}
+            for coarser_interval in ROLLUP_INTERVALS[1:]:
+                level = Rollup.merge(level, coarser_interval, tz)
+                rollups[coarser_interval] = level
+            self._rollups[tz] = rollups
+        return rollups[interval]
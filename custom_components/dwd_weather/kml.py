@@ -0,0 +1,139 @@
+"""Streaming parser for MOSMIX KML documents."""
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import NamedTuple
+
+from lxml import etree
+from simple_dwd_weatherforecast import dwdforecast
+from simple_dwd_weatherforecast.dwdforecast import WeatherDataType
+
+from .derived import relative_humidity
+
+KML = "{http://www.opengis.net/kml/2.2}"
+DWD = "{https://opendata.dwd.de/weather/lib/pointforecast_dwd_extension_V1_0.xsd}"
+
+# Data types read from the placemark, in the order of Weather.parse_kml
+FORECAST_DATA_TYPES = (
+    WeatherDataType.TEMPERATURE,
+    WeatherDataType.DEWPOINT,
+    WeatherDataType.PRESSURE,
+    WeatherDataType.WIND_DIRECTION,
+    WeatherDataType.WIND_SPEED,
+    WeatherDataType.WIND_GUSTS,
+    WeatherDataType.PRECIPITATION,
+    WeatherDataType.PRECIPITATION_PROBABILITY,
+    WeatherDataType.PRECIPITATION_DURATION,
+    WeatherDataType.CLOUD_COVERAGE,
+    WeatherDataType.VISIBILITY,
+    WeatherDataType.SUN_DURATION,
+    WeatherDataType.SUN_IRRADIANCE,
+    WeatherDataType.FOG_PROBABILITY,
+    WeatherDataType.EVAPORATION,
+)
+# The weather codes of the conditions
+CONDITION_ELEMENT = "ww"
+
+
+class MosmixForecast(NamedTuple):
+    """Forecast of one station, keyed by the time steps of the document."""
+
+    issue_time: datetime | None
+    station_name: str | None
+    forecast_data: OrderedDict
+
+
+def _values(text: str | None) -> list[float | None]:
+    return [
+        None if value == "-" else round(float(value), 2)
+        for value in (text or "").split()
+    ]
+
+
+class MosmixParser:
+    """Parse a MOSMIX KML stream into the forecasts of the wanted stations.
+
+    The document is fed in chunks. The header with the issue time and the
+    time steps is read first, then every placemark is released as soon as it
+    was read, so the memory does not grow with the number of stations. Only
+    the placemarks of the wanted stations are converted.
+    """
+
+    def __init__(self, station_ids: Iterable[str]) -> None:
+        """Initialize the parser for the wanted station IDs."""
+        self._station_ids = set(station_ids)
+        self._parser = etree.XMLPullParser(events=("end",), huge_tree=True)
+        self._issue_time: datetime | None = None
+        self._timesteps: list[str] = []
+        self.forecasts: dict[str, MosmixForecast] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the document."""
+        self._parser.feed(chunk)
+        self._read_events()
+
+    def close(self) -> dict[str, MosmixForecast]:
+        """Finish the document and return the forecasts by station ID."""
+        self._parser.close()
+        self._read_events()
+        return self.forecasts
+
+    def _read_events(self) -> None:
+        for _event, element in self._parser.read_events():
+            tag = element.tag
+            if tag == f"{DWD}IssueTime":
+                self._issue_time = datetime.fromisoformat(element.text)
+            elif tag == f"{DWD}ForecastTimeSteps":
+                self._timesteps = [step.text for step in element]
+            elif tag == f"{KML}Placemark":
+                station_id = element.findtext(f"{KML}name")
+                if station_id in self._station_ids:
+                    self.forecasts[station_id] = self._read_placemark(element)
+            else:
+                continue
+            # Release the element and everything read before it
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _read_placemark(self, placemark) -> MosmixForecast:
+        forecasts = {
+            forecast.get(f"{DWD}elementName"): forecast.findtext(f"{DWD}value")
+            for forecast in placemark.iter(f"{DWD}Forecast")
+        }
+        values = [
+            (data_type, _values(forecasts.get(data_type.value[0])))
+            for data_type in FORECAST_DATA_TYPES
+        ]
+        conditions = forecasts.get(CONDITION_ELEMENT) or ""
+        values.append(
+            (
+                WeatherDataType.CONDITION,
+                [value.split(".")[0] for value in conditions.split()],
+            )
+        )
+        # The temperatures and dew points are the first two series
+        values.append(
+            (WeatherDataType.HUMIDITY, relative_humidity(values[0][1], values[1][1]))
+        )
+        forecast_data = OrderedDict(
+            (
+                timestep,
+                {
+                    data_type.value[0]: (series[i] if len(series) else None)
+                    for data_type, series in values
+                },
+            )
+            for i, timestep in enumerate(self._timesteps)
+        )
+        return MosmixForecast(
+            self._issue_time, placemark.findtext(f"{KML}description"), forecast_data
+        )
+
+
+def apply_forecast(weather: dwdforecast.Weather, forecast: MosmixForecast) -> None:
+    """Set the forecast of a station like Weather.parse_kml does."""
+    weather.issue_time = forecast.issue_time
+    weather.loaded_station_name = forecast.station_name
+    weather.forecast_data = forecast.forecast_data
@@ -0,0 +1,97 @@
+"""Refresh planning along the publication schedule of the DWD open data."""
+
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+# Polling once a release is overdue, until a new issue shows up or the window
+# of the release has passed. After that the download is retried every hour.
+POLL_INTERVAL = timedelta(minutes=10)
+HOUR = timedelta(hours=1)
+
+
+def hour_start(now: datetime) -> datetime:
+    """Return the start of the hour of now."""
+    return now.replace(minute=0, second=0, microsecond=0)
+
+
+class Publication(NamedTuple):
+    """Cadence of a DWD product and when a new issue is expected."""
+
+    # Time between two issues
+    interval: timedelta
+    # Typical time from the issue time until the file is on the server
+    delay: timedelta
+    # How long to poll for an issue that is overdue
+    window: timedelta
+
+    def next_attempt(self, issue_time: datetime | None, now: datetime) -> datetime:
+        """Return when to download the product next.
+
+        Without a known issue time the product is polled.
+        """
+        if not isinstance(issue_time, datetime):
+            return now + POLL_INTERVAL
+        expected = issue_time + self.interval + self.delay
+        if now < expected:
+            return expected
+        if now < expected + self.window:
+            return now + POLL_INTERVAL
+        return hour_start(now) + HOUR
+
+
+# MOSMIX_L runs at 03, 09, 15 and 21 UTC, MOSMIX_S every hour. The delays are
+# estimates of the time the files need to appear on the open data server.
+MOSMIX_L = Publication(timedelta(hours=6), timedelta(hours=1), timedelta(hours=2))
+MOSMIX_S = Publication(HOUR, timedelta(minutes=30), timedelta(minutes=30))
+# The measurements and the text reports of the stations are published hourly
+STATION_REPORT = Publication(HOUR, timedelta(minutes=10), timedelta(minutes=30))
+
+
+class RefreshScheduler:
+    """Plan the downloads of a station from the issue times of its data.
+
+    Besides the planned downloads the station is refreshed at every full hour,
+    so the values of the current hour are published in time.
+    """
+
+    def __init__(self, hourly_update: bool, with_measurements: bool) -> None:
+        """Initialize the scheduler for the configured data."""
+        self._forecast = MOSMIX_S if hourly_update else MOSMIX_L
+        self._with_measurements = with_measurements
+        self._forecast_attempt: datetime | None = None
+        self._report_attempt: datetime | None = None
+
+    def plan(
+        self,
+        now: datetime,
+        issue_time: datetime | None,
+        report_time: datetime | None = None,
+    ) -> None:
+        """Plan the next downloads after the data was downloaded at now."""
+        self._forecast_attempt = self._forecast.next_attempt(issue_time, now)
+        if not self._with_measurements or not isinstance(report_time, datetime):
+            # The text reports have no issue time, they are expected each hour
+            report_time = hour_start(now - STATION_REPORT.delay)
+        self._report_attempt = STATION_REPORT.next_attempt(report_time, now)
+
+    def next_download(self) -> datetime | None:
+        """Return when the next download is due, None before the first one."""
+        if self._forecast_attempt is None or self._report_attempt is None:
+            return None
+        return min(self._forecast_attempt, self._report_attempt)
+
+    def is_due(self, now: datetime) -> bool:
+        """Return whether any data should be downloaded at now."""
+        next_download = self.next_download()
+        return next_download is None or now >= next_download
+
+    def forecast_due(self, now: datetime) -> bool:
+        """Return whether the forecast should be downloaded at now."""
+        return self._forecast_attempt is None or now >= self._forecast_attempt
+
+    def next_interval(self, now: datetime) -> timedelta:
+        """Return the time until the next refresh, at the latest the next hour."""
+        next_download = self.next_download()
+        if next_download is None or next_download <= now:
+            next_download = now + POLL_INTERVAL
+        return min(next_download, hour_start(now) + HOUR) - now
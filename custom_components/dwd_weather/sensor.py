@@ -1,7 +1,12 @@
 """Sensor for Deutscher Wetterdienst weather service."""
 
 import logging
-from custom_components.dwd_weather.connector import DWDWeatherData
+from operator import methodcaller
+from custom_components.dwd_weather.connector import (
+    DWDWeatherData,
+    SensorGetters,
+    SensorValues,
+)
 from custom_components.dwd_weather.entity import DWDWeatherEntity
 from homeassistant.components.sensor.const import SensorStateClass
 
@@ -303,6 +308,62 @@ SENSOR_TYPES = {
 }
 
 
+def _hourly_getters(sensor_type: str) -> SensorGetters:
+    """Return the getters of a sensor with a current value and hourly data."""
+    return (
+        methodcaller(f"get_{sensor_type}"),
+        {"data": methodcaller(f"get_{sensor_type}_hourly")},
+    )
+
+
+def _airquality_component_getters(component_name: str) -> SensorGetters:
+    """Return the getters of a sensor for one air quality component."""
+    return (
+        methodcaller("get_airquality_component_state", component_name),
+        {"data": methodcaller("get_airquality_component_hourly", component_name)},
+    )
+
+
+# Sensor types whose values do not follow the get_<type>/get_<type>_hourly pattern
+_SENSOR_GETTERS_SPECIAL: dict[str, SensorGetters] = {
+    "weather_condition": (methodcaller("get_condition"), {}),
+    "weather_report": (
+        methodcaller("get_weather_report_time"),
+        {"data": methodcaller("get_weather_report")},
+    ),
+    "measured_values_time": (
+        lambda connector: connector.infos[ATTR_REPORT_ISSUE_TIME],
+        {},
+    ),
+    "forecast_values_time": (lambda connector: connector.infos[ATTR_ISSUE_TIME], {}),
+    "uv_index": (
+        methodcaller("get_uv_index"),
+        {"data": methodcaller("get_uv_index_daily")},
+    ),
+    "evaporation": (
+        methodcaller("get_evaporation"),
+        {"data": methodcaller("get_evaporation_daily")},
+    ),
+    "airquality": (
+        methodcaller("get_airquality_state"),
+        {
+            "airquality": methodcaller("get_airquality"),
+            "data": methodcaller("get_airquality_hourly"),
+        },
+    ),
+    "airquality_stickstoffdioxid": _airquality_component_getters("Stickstoffdioxid"),
+    "airquality_ozon": _airquality_component_getters("Ozon"),
+    "airquality_pm2_5": _airquality_component_getters("PM2_5"),
+    "airquality_pm10": _airquality_component_getters("PM10"),
+}
+
+SENSOR_GETTERS: dict[str, SensorGetters] = {
+    sensor_type: _SENSOR_GETTERS_SPECIAL.get(sensor_type)
+    or _hourly_getters(sensor_type)
+    for sensor_type in SENSOR_TYPES
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigType, async_add_entities
 ) -> None:
@@ -355,6 +416,9 @@ async def async_setup_entry(
 class DWDWeatherForecastSensor(DWDWeatherEntity, SensorEntity):
     """Implementation of a DWD current weather condition sensor."""
 
+    # The forecast series are far too large for the recorder database
+    _unrecorded_attributes = frozenset({"data"})
+
     def __init__(self, entry_data, hass_data, sensor_type):
         """Initialize the sensor."""
         dwd_data: DWDWeatherData = hass_data[DWDWEATHER_DATA]
@@ -370,6 +434,10 @@ class DWDWeatherForecastSensor(DWDWeatherEntity, SensorEntity):
         )
         super().__init__(hass_data, unique_id)
 
+    def _get_values(self) -> SensorValues | None:
+        """Return the values of this sensor from the snapshot of the connector."""
+        return self._connector.get_sensor_snapshot().get(self._type)
+
     @property
     def translation_key(self):
         """Return the current condition."""
@@ -378,64 +446,25 @@ class DWDWeatherForecastSensor(DWDWeatherEntity, SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        result = ""
-        if self._type == "weather_condition":
-            result = self._connector.get_condition()
-        elif self._type == "weather_report":
-            result = (
-                self._connector._report["time"] if self._connector._report else None
-            )
-        elif self._type == "temperature":
-            result = self._connector.get_temperature()
-        elif self._type == "apparent_temperature":
-            result = self._connector.get_apparent_temperature()
-        elif self._type == "dewpoint":
-            result = self._connector.get_dewpoint()
-        elif self._type == "pressure":
-            result = self._connector.get_pressure()
-        elif self._type == "wind_speed":
-            result = self._connector.get_wind_speed()
-        elif self._type == "wind_direction":
-            result = self._connector.get_wind_direction()
-        elif self._type == "wind_gusts":
-            result = self._connector.get_wind_gusts()
-        elif self._type == "precipitation":
-            result = self._connector.get_precipitation()
-        elif self._type == "precipitation_probability":
-            result = self._connector.get_precipitation_probability()
-        elif self._type == "precipitation_duration":
-            result = self._connector.get_precipitation_duration()
-        elif self._type == "cloud_coverage":
-            result = self._connector.get_cloud_coverage()
-        elif self._type == "visibility":
-            result = self._connector.get_visibility()
-        elif self._type == "sun_duration":
-            result = self._connector.get_sun_duration()
-        elif self._type == "sun_irradiance":
-            result = self._connector.get_sun_irradiance()
-        elif self._type == "fog_probability":
-            result = self._connector.get_fog_probability()
-        elif self._type == "humidity":
-            result = self._connector.get_humidity()
-        elif self._type == "humidity_absolute":
-            result = self._connector.get_humidity_absolute()
-        elif self._type == "measured_values_time":
-            result = self._connector.infos[ATTR_REPORT_ISSUE_TIME]
-        elif self._type == "forecast_values_time":
-            result = self._connector.infos[ATTR_ISSUE_TIME]
-        elif self._type == "uv_index":
-            result = self._connector.get_uv_index()
-        elif self._type == "evaporation":
-            result = self._connector.get_evaporation()
-        elif self._type == "airquality":
-            result = self._connector.get_airquality_state()
-        elif self._type == "airquality_stickstoffdioxid":
-            result = self._connector.get_airquality_component_state("Stickstoffdioxid")
-        elif self._type == "airquality_ozon":
-            result = self._connector.get_airquality_component_state("Ozon")
-        elif self._type == "airquality_pm10":
-            result = self._connector.get_airquality_component_state("PM10")
-        return result
+        values = self._get_values()
+        if values is None:
+            # Not in the prepared snapshot yet, evaluate the getter directly
+            return SENSOR_GETTERS[self._type][0](self._connector)
+        return values.state
+
+    def state_fingerprint(self):
+        """Return the snapshot values and metadata the written state is made of."""
+        values = self._get_values()
+        if values is None:
+            return None
+        # Tuples compare their items by identity first, so an unchanged
+        # snapshot entry is recognized without comparing the data series.
+        return (
+            self._connector.latest_update,
+            self._connector.infos.get(ATTR_ISSUE_TIME),
+            values.state,
+            values.attributes,
+        )
 
     @property
     def unit_of_measurement(self):
@@ -469,62 +498,13 @@ class DWDWeatherForecastSensor(DWDWeatherEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the device."""
-        attributes = {}
-
-        if self._type == "weather":
-            attributes["data"] = self._connector.get_condition_hourly()
-        elif self._type == "weather_report":
-            attributes["data"] = self._connector.get_weather_report()
-        elif self._type == "temperature":
-            attributes["data"] = self._connector.get_temperature_hourly()
-        elif self._type == "apparent_temperature":
-            attributes["data"] = self._connector.get_apparent_temperature_hourly()
-        elif self._type == "dewpoint":
-            attributes["data"] = self._connector.get_dewpoint_hourly()
-        elif self._type == "pressure":
-            attributes["data"] = self._connector.get_pressure_hourly()
-        elif self._type == "wind_speed":
-            attributes["data"] = self._connector.get_wind_speed_hourly()
-        elif self._type == "wind_direction":
-            attributes["data"] = self._connector.get_wind_direction_hourly()
-        elif self._type == "wind_gusts":
-            attributes["data"] = self._connector.get_wind_gusts_hourly()
-        elif self._type == "precipitation":
-            attributes["data"] = self._connector.get_precipitation_hourly()
-        elif self._type == "precipitation_probability":
-            attributes["data"] = self._connector.get_precipitation_probability_hourly()
-        elif self._type == "precipitation_duration":
-            attributes["data"] = self._connector.get_precipitation_duration_hourly()
-        elif self._type == "cloud_coverage":
-            attributes["data"] = self._connector.get_cloud_coverage_hourly()
-        elif self._type == "visibility":
-            attributes["data"] = self._connector.get_visibility_hourly()
-        elif self._type == "sun_duration":
-            attributes["data"] = self._connector.get_sun_duration_hourly()
-        elif self._type == "sun_irradiance":
-            attributes["data"] = self._connector.get_sun_irradiance_hourly()
-        elif self._type == "fog_probability":
-            attributes["data"] = self._connector.get_fog_probability_hourly()
-        elif self._type == "humidity":
-            attributes["data"] = self._connector.get_humidity_hourly()
-        elif self._type == "humidity_absolute":
-            attributes["data"] = self._connector.get_humidity_absolute_hourly()
-        elif self._type == "uv_index":
-            attributes["data"] = self._connector.get_uv_index_daily()
-        elif self._type == "evaporation":
-            attributes["data"] = self._connector.get_evaporation_daily()
-        elif self._type == "airquality":
-            attributes["airquality"] = self._connector.get_airquality()
-            attributes["data"] = self._connector.get_airquality_hourly()
-        elif self._type == "airquality_stickstoffdioxid":
-            attributes["data"] = self._connector.get_airquality_component_hourly(
-                "Stickstoffdioxid"
+        values = self._get_values()
+        if values is not None:
+            attributes = dict(values.attributes)
+        else:
+            attributes = self._connector.get_sensor_attributes(
+                SENSOR_GETTERS[self._type][1]
             )
-        elif self._type == "airquality_ozon":
-            attributes["data"] = self._connector.get_airquality_component_hourly("Ozon")
-        elif self._type == "airquality_pm10":
-            attributes["data"] = self._connector.get_airquality_component_hourly("PM10")
-
         attributes[ATTR_ISSUE_TIME] = self._connector.infos[ATTR_ISSUE_TIME]
         attributes[ATTR_LATEST_UPDATE] = self._connector.infos[ATTR_LATEST_UPDATE]
         attributes[ATTR_STATION_ID] = self._connector.infos[ATTR_STATION_ID]
@@ -545,7 +525,10 @@ class DWDWeatherForecastSensor(DWDWeatherEntity, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
+            self._connector.register_sensor(self._type, SENSOR_GETTERS[self._type])
+        )
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
     async def async_update(self) -> None:
@@ -0,0 +1,85 @@
+"""Snapshot of the downloaded data of a station in the Home Assistant storage."""
+
+import base64
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+import zlib
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt
+from homeassistant.util.json import json_loads
+from simple_dwd_weatherforecast import dwdforecast
+
+from .const import DOMAIN
+
+SNAPSHOT_VERSION = 1
+# Seconds to collect updates before the snapshot is written
+SNAPSHOT_SAVE_DELAY = 30
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the snapshot of a config entry."""
+    return Store(hass, SNAPSHOT_VERSION, f"{DOMAIN}.snapshot.{entry_id}")
+
+
+def _datetime(value: Any) -> Any:
+    return dt.parse_datetime(value) if isinstance(value, str) else value
+
+
+def pack_snapshot(weather: dwdforecast.Weather, latest_update: datetime) -> dict:
+    """Return the forecast, report and UV index of the station in compact form.
+
+    The forecast is stored by column, so each data type is a plain list of
+    values, and the whole payload is compressed.
+    """
+    forecast_data = weather.forecast_data or {}
+    keys = dict.fromkeys(key for values in forecast_data.values() for key in values)
+    payload = {
+        "latest_update": latest_update,
+        "issue_time": weather.issue_time,
+        "station_name": getattr(weather, "loaded_station_name", None),
+        "timesteps": list(forecast_data),
+        "forecast": {
+            key: [values.get(key) for values in forecast_data.values()] for key in keys
+        },
+        "report": weather.report_data,
+        "weather_report": weather.weather_report,
+        "uv_report": weather.uv_reports.get(weather.nearest_uv_index_station),
+        "apparent_temperature": weather.apparent_temperature_data,
+    }
+    return {
+        "station_id": weather.station_id,
+        "data": base64.b64encode(zlib.compress(json_bytes(payload))).decode("ascii"),
+    }
+
+
+def unpack_snapshot(weather: dwdforecast.Weather, snapshot: dict) -> datetime:
+    """Restore the data of a snapshot and return the time it was downloaded.
+
+    Raises ValueError if the snapshot belongs to another station or holds
+    no forecast.
+    """
+    if snapshot.get("station_id") != weather.station_id:
+        raise ValueError(f"Snapshot of station {snapshot.get('station_id')}")
+    payload = json_loads(zlib.decompress(base64.b64decode(snapshot["data"])))
+    if not payload["timesteps"]:
+        raise ValueError("Snapshot without forecast")
+    columns = payload["forecast"].items()
+    weather.forecast_data = OrderedDict(
+        (timestep, {key: values[i] for key, values in columns})
+        for i, timestep in enumerate(payload["timesteps"])
+    )
+    weather.issue_time = _datetime(payload["issue_time"])
+    weather.loaded_station_name = payload["station_name"]
+    weather.report_data = payload["report"]
+    weather.weather_report = payload["weather_report"]
+    weather.apparent_temperature_data = payload["apparent_temperature"]
+    # The UV reports are shared by all stations, a newer download is kept
+    if payload["uv_report"] is not None:
+        weather.uv_reports.setdefault(
+            weather.nearest_uv_index_station, payload["uv_report"]
+        )
+    return _datetime(payload["latest_update"])
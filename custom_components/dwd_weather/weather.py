@@ -59,11 +59,15 @@ class DWDWeather(DWDWeatherEntity, WeatherEntity):
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast in native units."""
-        return self._connector.get_forecast(WeatherEntityFeature.FORECAST_DAILY)
+        return await self._connector.async_get_forecast(
+            WeatherEntityFeature.FORECAST_DAILY
+        )
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the hourly forecast in native units."""
-        return self._connector.get_forecast(WeatherEntityFeature.FORECAST_HOURLY)
+        return await self._connector.async_get_forecast(
+            WeatherEntityFeature.FORECAST_HOURLY
+        )
 
     @property
     def name(self):
@@ -153,8 +157,22 @@ class DWDWeather(DWDWeatherEntity, WeatherEntity):
         attributes = dict(self._connector.infos)
         return attributes
 
+    def state_fingerprint(self):
+        """Return the current values and infos the written state is made of."""
+        return (
+            self.condition,
+            self.native_temperature,
+            self.native_pressure,
+            self.native_wind_speed,
+            self.wind_bearing,
+            self.native_visibility,
+            self.humidity,
+            self.uv_index,
+            dict(self._connector.infos),
+        )
+
     async def async_added_to_hass(self) -> None:
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
         )
@@ -4,6 +4,7 @@
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from collections import OrderedDict
+import math
 
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -22,6 +23,8 @@ from custom_components.dwd_weather.const import (
     ATTR_ISSUE_TIME,
 )
 
+from .const import TEST_ENTRY_ID
+
 pytest_plugins = "pytest_homeassistant_custom_component"  # pylint: disable=invalid-name
 
 
@@ -123,6 +126,103 @@ def mock_forecast_data_fixture():
     )
 
 
+@pytest.fixture(name="mosmix_forecast_data")
+def mosmix_forecast_data_fixture():
+    """Create ten days of hourly forecast data in the MOSMIX format of the library.
+
+    The data starts at 2026-01-15T00:00:00Z. Values follow simple daily cycles
+    and a few entries are missing to cover the None handling.
+    """
+    start = datetime(2026, 1, 15, tzinfo=timezone.utc)
+    codes = ["0", "1", "2", "3", "45", "61", "63", "71", "80", "95"]
+    data = OrderedDict()
+    for hour in range(240):
+        timestamp = start + timedelta(hours=hour)
+        cycle = math.sin(hour / 24 * 2 * math.pi)
+        temperature = round(275.0 + 6 * cycle, 2)
+        dewpoint = round(271.0 + 3 * cycle, 2)
+        data[timestamp.strftime("%Y-%m-%dT%H:00:00.000Z")] = {
+            "condition": codes[(hour * 7) % len(codes)] if hour % 17 else "-",
+            "TTT": temperature,
+            "Td": dewpoint,
+            "PPPP": round(101300.0 + 150 * cycle, 2),
+            "FF": round(3.0 + 2 * abs(cycle), 2),
+            "DD": float((hour * 37) % 360),
+            "FX1": round(6.0 + 3 * abs(cycle), 2),
+            "RR1c": round(max(0.0, cycle), 2) if hour % 5 else None,
+            "wwP": float((hour * 13) % 100),
+            "DRR1": float((hour * 11) % 3600),
+            "N": float((hour * 29) % 100),
+            "VV": float(10000 + (hour * 97) % 20000),
+            "SunD1": float((hour * 53) % 3600),
+            "Rad1h": round(max(0.0, 800 * cycle), 2),
+            "wwM": float((hour * 3) % 100),
+            "PEvap": round(0.1 * (hour % 24), 2) if hour % 24 == 6 else None,
+            "humidity": round(
+                100
+                * math.exp(
+                    (17.5043 * (dewpoint - 273.1) / (241.2 + dewpoint - 273.1))
+                    - (17.5043 * (temperature - 273.1) / (241.2 + temperature - 273.1))
+                ),
+                1,
+            ),
+        }
+    return data
+
+
+@pytest.fixture(name="mosmix_kml")
+def mosmix_kml_fixture(mosmix_forecast_data):
+    """Return a builder of MOSMIX KML documents with a placemark per station.
+
+    Every station holds the values of mosmix_forecast_data.
+    """
+    elements = [key for key in next(iter(mosmix_forecast_data.values())) if key]
+    elements = [key for key in elements if key not in ("condition", "humidity")]
+
+    def value(item):
+        return "-" if item is None else f"{item:.2f}"
+
+    forecasts = "".join(
+        f'<dwd:Forecast dwd:elementName="{element}"><dwd:value>'
+        + " ".join(value(item[element]) for item in mosmix_forecast_data.values())
+        + "</dwd:value></dwd:Forecast>\n"
+        for element in elements
+    )
+    forecasts += (
+        '<dwd:Forecast dwd:elementName="ww"><dwd:value>'
+        + " ".join(
+            "-" if item["condition"] == "-" else f"{item['condition']}.00"
+            for item in mosmix_forecast_data.values()
+        )
+        + "</dwd:value></dwd:Forecast>\n"
+    )
+    timesteps = "".join(
+        f"<dwd:TimeStep>{key}</dwd:TimeStep>" for key in mosmix_forecast_data
+    )
+
+    def build(*station_ids):
+        placemarks = "".join(
+            f"<kml:Placemark>\n<kml:name>{station_id}</kml:name>\n"
+            f"<kml:description>STATION {station_id}</kml:description>\n"
+            f"<kml:ExtendedData>\n{forecasts}</kml:ExtendedData>\n"
+            "</kml:Placemark>\n"
+            for station_id in station_ids
+        )
+        return (
+            '<?xml version="1.0" encoding="ISO-8859-1" standalone="yes"?>\n'
+            '<kml:kml xmlns:dwd="https://opendata.dwd.de/weather/lib/'
+            'pointforecast_dwd_extension_V1_0.xsd" '
+            'xmlns:kml="http://www.opengis.net/kml/2.2">\n'
+            "<kml:Document>\n<kml:ExtendedData>\n<dwd:ProductDefinition>\n"
+            "<dwd:IssueTime>2026-01-15T03:00:00.000Z</dwd:IssueTime>\n"
+            f"<dwd:ForecastTimeSteps>{timesteps}</dwd:ForecastTimeSteps>\n"
+            "</dwd:ProductDefinition>\n</kml:ExtendedData>\n"
+            f"{placemarks}</kml:Document>\n</kml:kml>\n"
+        ).encode("iso-8859-1")
+
+    return build
+
+
 @pytest.fixture(name="mock_dwd_weather_object")
 def mock_dwd_weather_object_fixture(mock_forecast_data):
     """Create a mock DWD Weather object."""
@@ -137,7 +237,12 @@ def mock_dwd_weather_object_fixture(mock_forecast_data):
     }
     mock_weather.forecast_data = mock_forecast_data
     mock_weather.issue_time = "2024-01-15T12:00:00+00:00"
+    mock_weather.loaded_station_name = "TEST STATION"
     mock_weather.report_data = None
+    mock_weather.weather_report = "Test weather report"
+    mock_weather.nearest_uv_index_station = "L732"
+    mock_weather.uv_reports = {}
+    mock_weather.apparent_temperature_data = None
     mock_weather.get_weather_report = MagicMock(return_value="Test weather report")
     mock_weather.update = MagicMock()
     mock_weather.is_in_timerange = MagicMock(return_value=True)
@@ -154,6 +259,7 @@ def mock_dwd_weather_object_fixture(mock_forecast_data):
 def mock_dwd_data_fixture(hass, mock_dwd_weather_object):
     """Create a mock DWDWeatherData instance."""
     mock_config_entry = MagicMock()
+    mock_config_entry.entry_id = TEST_ENTRY_ID
     mock_config_entry.data = {
         CONF_STATION_ID: "L732",
         "station_name": "Test Station",
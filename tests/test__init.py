@@ -1,14 +1,20 @@
 # pylint: disable=protected-access,redefined-outer-name
 """Tests for integration setup and unload."""
 
+import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.dwd_weather import (
+    async_remove_entry,
     async_setup,
     async_setup_entry,
     async_unload_entry,
@@ -18,11 +24,13 @@ from custom_components.dwd_weather.const import (
     CONF_ENTITY_TYPE,
     CONF_ENTITY_TYPE_MAP,
     CONF_ENTITY_TYPE_STATION,
+    DEFAULT_INTERPOLATION_INTERVAL,
     DOMAIN,
     DWDWEATHER_COORDINATOR,
     DWDWEATHER_DATA,
+    DWDWEATHER_MOSMIX_S,
 )
-from .const import MOCK_CONFIG, MOCK_CONFIG_MAP, TEST_ENTRY_ID
+from .const import MOCK_CONFIG, MOCK_CONFIG_HOURLY, MOCK_CONFIG_MAP, TEST_ENTRY_ID
 
 
 @pytest.mark.asyncio
@@ -69,6 +77,83 @@ async def test_setup_entry_station_success(hass: HomeAssistant):
     assert DWDWEATHER_COORDINATOR in hass.data[DOMAIN][entry.entry_id]
     assert mock_forward.await_count == 2
 
+    # Stops the interpolation timer
+    await entry._async_process_on_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_station_follows_planned_refresh(hass: HomeAssistant):
+    """After each refresh the coordinator should wait for the planned refresh."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id=TEST_ENTRY_ID)
+
+    with (
+        patch("custom_components.dwd_weather.DWDWeatherData") as mock_data_cls,
+        patch("custom_components.dwd_weather.random.randint", return_value=5),
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            AsyncMock(return_value=True),
+        ),
+    ):
+        mock_data = MagicMock()
+        mock_data.async_update = AsyncMock()
+        mock_data.get_update_interval.return_value = timedelta(minutes=50)
+        mock_data.dwd_weather.forecast_data = {"ok": {}}
+        mock_data_cls.return_value = mock_data
+
+        await async_setup_entry(hass, entry)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][DWDWEATHER_COORDINATOR]
+    await coordinator.async_refresh()
+
+    mock_data.async_update.assert_awaited_once()
+    assert coordinator.update_interval == timedelta(minutes=50, seconds=5)
+    await entry._async_process_on_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_hourly_stations_share_mosmix_s_fetcher(hass: HomeAssistant):
+    """Stations with hourly updates should read MOSMIX_S from one fetcher."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={**MOCK_CONFIG_HOURLY, "station_id": station_id},
+            entry_id=f"{TEST_ENTRY_ID}_{station_id}",
+        )
+        for station_id in ("10389", "10384")
+    ]
+
+    with (
+        patch("custom_components.dwd_weather.DWDWeatherData") as mock_data_cls,
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            AsyncMock(return_value=True),
+        ),
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_unload",
+            AsyncMock(return_value=True),
+        ),
+    ):
+        mock_data_cls.return_value.dwd_weather.forecast_data = {"ok": {}}
+        for entry in entries:
+            await async_setup_entry(hass, entry)
+
+        mosmix_s = hass.data[DOMAIN][DWDWEATHER_MOSMIX_S]
+        assert [call.args[2] for call in mock_data_cls.call_args_list] == [
+            mosmix_s,
+            mosmix_s,
+        ]
+        assert mosmix_s.stations == {"10389", "10384"}
+
+        for entry in entries:
+            assert await async_unload_entry(hass, entry)
+            await entry._async_process_on_unload(hass)
+
+    assert mosmix_s.stations == set()
+    assert DOMAIN not in hass.data
+
 
 @pytest.mark.asyncio
 async def test_setup_entry_station_raises_not_ready(hass: HomeAssistant):
@@ -78,6 +163,7 @@ async def test_setup_entry_station_raises_not_ready(hass: HomeAssistant):
     with patch("custom_components.dwd_weather.DWDWeatherData") as mock_data_cls:
         mock_data = MagicMock()
         mock_data.async_update = AsyncMock()
+        mock_data.async_restore_snapshot = AsyncMock(return_value=False)
         mock_data.dwd_weather.forecast_data = None
         mock_data.dwd_weather.issue_time = None
         mock_data_cls.return_value = mock_data
@@ -85,6 +171,63 @@ async def test_setup_entry_station_raises_not_ready(hass: HomeAssistant):
         with pytest.raises(ConfigEntryNotReady):
             await async_setup_entry(hass, entry)
 
+    mock_data.async_update.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_station_restores_snapshot(hass: HomeAssistant):
+    """A restored snapshot should set up the entry and refresh in the background."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id=TEST_ENTRY_ID)
+    entry.add_to_hass(hass)
+    refreshed = asyncio.Event()
+
+    with (
+        patch("custom_components.dwd_weather.DWDWeatherData") as mock_data_cls,
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            AsyncMock(return_value=True),
+        ) as mock_forward,
+    ):
+        mock_data = MagicMock()
+        mock_data.async_update = AsyncMock(side_effect=refreshed.wait)
+        mock_data.get_update_interval.return_value = timedelta(minutes=50)
+        mock_data.dwd_weather.forecast_data = None
+        mock_data_cls.return_value = mock_data
+
+        async def restore_snapshot():
+            mock_data.dwd_weather.forecast_data = {"ok": {}}
+            return True
+
+        mock_data.async_restore_snapshot = AsyncMock(side_effect=restore_snapshot)
+
+        try:
+            assert await async_setup_entry(hass, entry) is True
+
+            # The entities are set up before the download finished
+            assert mock_forward.await_count == 2
+            mock_data.get_update_interval.assert_not_called()
+
+            refreshed.set()
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+            mock_data.async_update.assert_awaited_once()
+            mock_data.get_update_interval.assert_called_once()
+        finally:
+            # Stops the interpolation timer
+            await entry._async_process_on_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_remove_entry_removes_snapshot(hass: HomeAssistant, hass_storage):
+    """Removing a station should remove its saved data."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id=TEST_ENTRY_ID)
+    hass_storage[f"{DOMAIN}.snapshot.{TEST_ENTRY_ID}"] = {"version": 1, "data": {}}
+
+    await async_remove_entry(hass, entry)
+
+    assert f"{DOMAIN}.snapshot.{TEST_ENTRY_ID}" not in hass_storage
+
 
 @pytest.mark.asyncio
 async def test_setup_entry_map_success(hass: HomeAssistant):
@@ -135,3 +278,40 @@ async def test_unload_entry_station_success(hass: HomeAssistant):
 
     assert result is True
     assert DOMAIN not in hass.data
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_station_publishes_interpolated_values(
+    hass: HomeAssistant, freezer
+):
+    """With interpolation the listeners should be called without a refresh."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id=TEST_ENTRY_ID)
+
+    with (
+        patch("custom_components.dwd_weather.DWDWeatherData") as mock_data_cls,
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            AsyncMock(return_value=True),
+        ),
+    ):
+        mock_data = MagicMock()
+        mock_data.async_update = AsyncMock()
+        mock_data.async_prepare_sensor_snapshot = AsyncMock()
+        mock_data.dwd_weather.forecast_data = {"ok": {}}
+        mock_data_cls.return_value = mock_data
+
+        await async_setup_entry(hass, entry)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][DWDWEATHER_COORDINATOR]
+    coordinator.async_update_listeners = MagicMock()
+    mock_data.async_update.reset_mock()
+
+    freezer.tick(DEFAULT_INTERPOLATION_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    mock_data.async_prepare_sensor_snapshot.assert_awaited_once()
+    coordinator.async_update_listeners.assert_called_once()
+    mock_data.async_update.assert_not_awaited()
+    await entry._async_process_on_unload(hass)
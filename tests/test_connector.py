@@ -1,15 +1,24 @@
 """Tests for connector data object."""
 
-from datetime import datetime, timezone
+from collections import OrderedDict
+import threading
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.weather import WeatherEntityFeature
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from simple_dwd_weatherforecast import dwdforecast
+from simple_dwd_weatherforecast.dwdforecast import WeatherDataType
 
-from custom_components.dwd_weather.connector import DWDWeatherData
-from custom_components.dwd_weather.const import CONF_STATION_ID
-from .const import MOCK_CONFIG
+from custom_components.dwd_weather.connector import DWDWeatherData, compact_series
+from custom_components.dwd_weather.const import CONF_STATION_ID, DOMAIN
+from custom_components.dwd_weather.forecast_store import circular_mean
+from custom_components.dwd_weather.kml import MosmixForecast
+from custom_components.dwd_weather.snapshot import SNAPSHOT_SAVE_DELAY
+from .const import MOCK_CONFIG, TEST_ENTRY_ID
 
 
 @pytest.mark.asyncio
@@ -50,12 +59,13 @@ async def test_async_update_notifies_registered_entities(
     entity = MagicMock()
     entity.async_update_listeners = AsyncMock()
     mock_dwd_data.register_entity(entity)
+    _setup_forecast_weather_mocks(mock_dwd_data)
 
     mock_dwd_data._update = MagicMock(return_value=True)
 
     await mock_dwd_data.async_update()
 
-    entity.async_update_listeners.assert_awaited_once()
+    entity.async_update_listeners.assert_awaited_once_with(("daily", "hourly"))
 
 
 @pytest.mark.asyncio
@@ -92,16 +102,24 @@ async def test_get_forecast_dispatches_to_hourly(mock_dwd_data):
 
 
 @pytest.mark.asyncio
-async def test_update_returns_false_when_refresh_not_due(mock_dwd_data):
-    """_update should short-circuit when minute is not refresh boundary."""
-    mock_dwd_data.latest_update = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+async def test_update_returns_false_when_refresh_not_due(mock_dwd_data, freezer):
+    """_update should short-circuit until the scheduler expects new data."""
+    freezer.move_to("2026-01-01 12:00:00+00:00")
+    mock_dwd_data.latest_update = None
+    mock_dwd_data.dwd_weather.issue_time = datetime(
+        2026, 1, 1, 9, 0, tzinfo=timezone.utc
+    )
+    assert mock_dwd_data._update() is True
 
-    with patch("custom_components.dwd_weather.connector.datetime") as mock_datetime:
-        mock_datetime.now.return_value = datetime(
-            2026, 1, 1, 12, 1, tzinfo=timezone.utc
-        )
+    freezer.move_to("2026-01-01 12:01:00+00:00")
+    assert mock_dwd_data._update() is False
 
-        assert mock_dwd_data._update() is False
+    # The hourly reports are due, the next MOSMIX_L run is not
+    mock_dwd_data.dwd_weather.update.reset_mock()
+    freezer.move_to("2026-01-01 13:10:00+00:00")
+    assert mock_dwd_data._update() is True
+    assert mock_dwd_data.dwd_weather.update.call_args.kwargs["with_forecast"] is False
+    assert mock_dwd_data.get_update_interval() == timedelta(minutes=50)
 
 
 def test_mock_config_contains_required_keys():
@@ -143,11 +161,23 @@ async def test_connector_initializes_airquality_clients_when_enabled(
     mock_airquality.create.assert_awaited_once_with("station-1", "daily")
 
 
+def _download_airquality_hourly(connector, data):
+    """Let the connector download the given hourly air quality run."""
+    client = MagicMock()
+    client.data = None
+
+    def update():
+        client.data = data
+
+    client.update = MagicMock(side_effect=update)
+    connector._airquality_hourly = client
+    connector._update_airquality_hourly()
+
+
 def test_get_airquality_uses_hourly_when_requested(mock_dwd_data):
     """Air quality getter should return hourly current value for hourly forecast."""
     mock_dwd_data._config["download_airquality"] = True
-    mock_dwd_data._airquality_hourly = MagicMock()
-    mock_dwd_data._airquality_hourly.data = [{"PM2_5": 11.0}, {"PM2_5": 9.0}]
+    _download_airquality_hourly(mock_dwd_data, [{"PM2_5": 11.0}, {"PM2_5": 9.0}])
 
     result = mock_dwd_data.get_airquality(WeatherEntityFeature.FORECAST_HOURLY)
 
@@ -213,21 +243,28 @@ def _setup_forecast_weather_mocks(mock_dwd_data):
     dwd_weather.get_uv_index = MagicMock(return_value=2)
 
 
-def test_hourly_forecast_includes_airquality_when_both_options_enabled(mock_dwd_data):
+def test_hourly_forecast_includes_airquality_when_both_options_enabled(
+    mock_dwd_data, freezer
+):
     """Hourly forecast should include air quality fields only when both toggles are enabled."""
     _setup_forecast_weather_mocks(mock_dwd_data)
 
     mock_dwd_data._config["additional_forecast_attributes"] = True
     mock_dwd_data._config["download_airquality"] = True
-    mock_dwd_data._airquality_hourly = MagicMock()
-    mock_dwd_data._airquality_hourly.data = [
-        {
-            "Stickstoffdioxid": 21.0,
-            "Ozon": 34.0,
-            "PM2_5": 12.0,
-            "PM10": 19.0,
-        }
-    ]
+    freezer.move_to("2026-01-15 09:30:00+00:00")
+    _download_airquality_hourly(
+        mock_dwd_data,
+        [
+            {"PM2_5": 1.0},
+            {
+                "Stickstoffdioxid": 21.0,
+                "Ozon": 34.0,
+                "PM2_5": 12.0,
+                "PM10": 19.0,
+            },
+        ],
+    )
+    freezer.move_to("2026-01-15 10:05:00+00:00")
 
     result = mock_dwd_data.get_forecast_hourly()
 
@@ -246,8 +283,7 @@ def test_hourly_forecast_does_not_include_airquality_when_additional_attrs_disab
 
     mock_dwd_data._config["additional_forecast_attributes"] = False
     mock_dwd_data._config["download_airquality"] = True
-    mock_dwd_data._airquality_hourly = MagicMock()
-    mock_dwd_data._airquality_hourly.data = [{"PM2_5": 12.0}]
+    _download_airquality_hourly(mock_dwd_data, [{"PM2_5": 12.0}, {"PM2_5": 12.0}])
 
     result = mock_dwd_data.get_forecast_hourly()
 
@@ -281,3 +317,876 @@ def test_get_apparent_temperature_hourly_returns_empty_when_not_supported(
 
     assert result == []
     mock_dwd_data.dwd_weather.get_apparent_temperature_forecast.assert_not_called()
+
+
+def test_get_hourly_reads_columnar_store(mock_dwd_data, mosmix_forecast_data, freezer):
+    """Hourly sensor series should start at the current hour and respect the step limit."""
+    freezer.move_to("2026-01-16 10:30:00+00:00")
+    mock_dwd_data.dwd_weather.forecast_data = mosmix_forecast_data
+    mock_dwd_data.latest_update = datetime(2026, 1, 16, 10, 20, tzinfo=timezone.utc)
+
+    result = mock_dwd_data.get_temperature_hourly()
+
+    assert [item["datetime"] for item in result] == [
+        f"2026-01-16T{hour}:00:00.000Z" for hour in range(10, 15)
+    ]
+    assert result[0]["value"] == round(
+        mosmix_forecast_data["2026-01-16T10:00:00.000Z"]["TTT"] - 273.1, 1
+    )
+
+
+def test_hourly_series_are_built_in_one_pass_per_hour(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """All hourly sensor series should come from one cached pass over the store."""
+    freezer.move_to("2026-01-16 10:30:00+00:00")
+    mock_dwd_data.dwd_weather.forecast_data = mosmix_forecast_data
+    mock_dwd_data.latest_update = datetime(2026, 1, 16, 10, 20, tzinfo=timezone.utc)
+
+    temperature = mock_dwd_data.get_temperature_hourly()
+    humidity = mock_dwd_data.get_humidity_hourly()
+    pressure = mock_dwd_data.get_pressure_hourly()
+    absolute = mock_dwd_data.get_humidity_absolute_hourly()
+
+    assert mock_dwd_data.get_temperature_hourly() is temperature
+    for position, key in enumerate(
+        f"2026-01-16T{hour}:00:00.000Z" for hour in range(10, 15)
+    ):
+        item = mosmix_forecast_data[key]
+        assert pressure[position]["value"] == round(item["PPPP"] / 100, 1)
+        assert absolute[position] == {
+            "datetime": key,
+            "value": mock_dwd_data.calculate_absolute_humidity(
+                temperature[position]["value"], humidity[position]["value"]
+            ),
+        }
+
+    freezer.move_to("2026-01-16 11:05:00+00:00")
+    assert mock_dwd_data.get_temperature_hourly()[0]["datetime"] == (
+        "2026-01-16T11:00:00.000Z"
+    )
+
+
+def test_interpolated_value_does_not_depend_on_reads(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """Interpolated current values should only depend on the time."""
+    freezer.move_to("2026-01-16 10:30:00+00:00")
+    mock_dwd_data.dwd_weather.forecast_data = mosmix_forecast_data
+    mock_dwd_data.latest_update = datetime(2026, 1, 16, 10, 20, tzinfo=timezone.utc)
+    start = mosmix_forecast_data["2026-01-16T10:00:00.000Z"]["TTT"]
+    end = mosmix_forecast_data["2026-01-16T11:00:00.000Z"]["TTT"]
+
+    values = {mock_dwd_data.get_temperature() for _ in range(5)}
+
+    assert values == {round(round((start + end) / 2, 2) - 273.1, 1)}
+
+
+def test_compact_series_encodes_start_step_and_values():
+    """Regular series should become start, step and a plain list of values."""
+    data = [
+        {"datetime": "2026-01-16T10:00:00.000Z", "value": 1.0},
+        {"datetime": "2026-01-16T11:00:00.000Z", "value": 2.0},
+        {"datetime": "2026-01-16T13:00:00.000Z", "value": 4.0},
+    ]
+
+    assert compact_series(data) == {
+        "start": "2026-01-16T10:00:00.000Z",
+        "step": 3600,
+        "values": [1.0, 2.0, None, 4.0],
+    }
+    assert compact_series(data[:1])["values"] == [1.0]
+    assert compact_series([]) == {"start": None, "step": None, "values": []}
+    assert compact_series({"today": 1}) == {"today": 1}
+    assert compact_series("report") == "report"
+
+
+def test_compact_series_keeps_irregular_series():
+    """Series that do not fit on a grid should stay a list of entries."""
+    data = [
+        {"datetime": datetime(2026, 1, 16, 6, tzinfo=timezone.utc), "value": 1},
+        {"datetime": datetime(2026, 1, 16, 8, tzinfo=timezone.utc), "value": 2},
+        {"datetime": datetime(2026, 1, 16, 11, tzinfo=timezone.utc), "value": 3},
+    ]
+
+    assert compact_series(data) is data
+
+
+def test_forecast_store_is_rebuilt_per_update(mock_dwd_data, mosmix_forecast_data):
+    """The store should be reused until latest_update changes."""
+    mock_dwd_data.dwd_weather.forecast_data = mosmix_forecast_data
+
+    store = mock_dwd_data.get_forecast_store()
+    assert mock_dwd_data.get_forecast_store() is store
+
+    mock_dwd_data.latest_update = datetime(2026, 1, 16, 10, 20, tzinfo=timezone.utc)
+    assert mock_dwd_data.get_forecast_store() is not store
+
+
+def _offline_weather(forecast_data):
+    """Create a library Weather object holding the given data without downloading."""
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+    weather.forecast_data = forecast_data
+    weather.nearest_uv_index_station = "uv"
+    weather.uv_reports = {
+        "uv": {"forecast": {"today": 1, "tomorrow": 2, "dayafter_to": 3}}
+    }
+    return weather
+
+
+def _reference_hourly_forecast(connector, weather, now):
+    """Build the hourly forecast with one library timeframe query per field."""
+    result = []
+    timestep = now.replace(minute=0, second=0, microsecond=0)
+    for _ in range(9 * 24):
+        condition = weather.get_timeframe_condition(timestep, 1, False)
+        if condition == "sunny" and (
+            timestep.hour < connector.sun.riseutc(timestep).hour
+            or timestep.hour > connector.sun.setutc(timestep).hour
+        ):
+            condition = "clear-night"
+
+        def max_(data_type):
+            return weather.get_timeframe_max(data_type, timestep, 1, False)
+
+        def min_(data_type):
+            return weather.get_timeframe_min(data_type, timestep, 1, False)
+
+        def sum_(data_type):
+            return weather.get_timeframe_sum(data_type, timestep, 1, False)
+
+        wind_dir = weather.get_timeframe_avg(
+            WeatherDataType.WIND_DIRECTION, timestep, 1, False
+        )
+        if connector._config["wind_direction_type"] != "degrees":
+            wind_dir = connector.get_wind_direction_symbol(wind_dir)
+        day_offset = (dt_util.as_local(timestep).date() - dt_util.now().date()).days
+        temp = max_(WeatherDataType.TEMPERATURE)
+        dew_point = max_(WeatherDataType.DEWPOINT)
+        pressure = max_(WeatherDataType.PRESSURE)
+        wind_speed = max_(WeatherDataType.WIND_SPEED)
+        wind_gusts = max_(WeatherDataType.WIND_GUSTS)
+        precipitation_prop = max_(WeatherDataType.PRECIPITATION_PROBABILITY)
+        item = {
+            "datetime": timestep.strftime("%Y-%m-%dT%H:00:00Z"),
+            "cloud_coverage": max_(WeatherDataType.CLOUD_COVERAGE),
+            "condition": condition,
+            "native_dew_point": round(dew_point - 273.1, 1),
+            "native_precipitation": sum_(WeatherDataType.PRECIPITATION),
+            "precipitation_probability": int(precipitation_prop),
+            "pressure": round(pressure / 100, 1),
+            "native_temperature": round(temp - 273.1, 1),
+            "uv_index": weather.get_uv_index(day_offset, False)
+            if 0 <= day_offset < 3
+            else None,
+            "native_wind_speed": round(wind_speed * 3.6, 1),
+            "wind_gust_speed": round(wind_gusts * 3.6, 1),
+            "wind_bearing": wind_dir,
+        }
+        if connector._config["additional_forecast_attributes"]:
+            humidity = max_(WeatherDataType.HUMIDITY)
+            item.update(
+                {
+                    "evaporation": max_(WeatherDataType.EVAPORATION),
+                    "fog_probability": max_(WeatherDataType.FOG_PROBABILITY),
+                    "sun_irradiance": sum_(WeatherDataType.SUN_IRRADIANCE),
+                    "visibility": min_(WeatherDataType.VISIBILITY),
+                    "sun_duration": sum_(WeatherDataType.SUN_DURATION),
+                    "precipitation_duration": max_(
+                        WeatherDataType.PRECIPITATION_DURATION
+                    ),
+                    "humidity": humidity,
+                    "humidity_absolute": connector.calculate_absolute_humidity(
+                        min_(WeatherDataType.TEMPERATURE) - 273.15, humidity
+                    ),
+                }
+            )
+        result.append(item)
+        timestep += timedelta(hours=1)
+    return result
+
+
+@pytest.mark.parametrize(
+    "wind_direction_type", ["degrees", "direction", "direction_16"]
+)
+@pytest.mark.parametrize("additional_attributes", [True, False])
+def test_hourly_forecast_matches_timeframe_queries(
+    mock_dwd_data,
+    mosmix_forecast_data,
+    freezer,
+    wind_direction_type,
+    additional_attributes,
+):
+    """The single-pass builder should return what per-field timeframe queries return."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    now = datetime.now(timezone.utc)
+    weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.dwd_weather = weather
+    mock_dwd_data.latest_update = now
+    mock_dwd_data._config["wind_direction_type"] = wind_direction_type
+    mock_dwd_data._config["additional_forecast_attributes"] = additional_attributes
+
+    result = mock_dwd_data.get_forecast_hourly()
+
+    assert len(result) == 9 * 24
+    assert result == _reference_hourly_forecast(mock_dwd_data, weather, now)
+
+
+def test_hourly_forecast_hours_without_data(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """Hours beyond the forecast data should hold no values and zero sums."""
+    freezer.move_to("2026-01-23 12:00:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+
+    result = mock_dwd_data.get_forecast_hourly()
+
+    assert result[-1]["native_temperature"] is None
+    assert result[-1]["condition"] is None
+    assert result[-1]["native_precipitation"] == 0.0
+    assert result[-1]["humidity_absolute"] is None
+
+
+def _reference_daily_forecast(connector, weather, now):
+    """Build the daily forecast with one library daily query per field."""
+    result = []
+    timestep = datetime(now.year, now.month, now.day, tzinfo=now.tzinfo)
+    for _ in range(9):
+
+        def max_(data_type):
+            return weather.get_daily_max(data_type, timestep, False)
+
+        def sum_(data_type):
+            return weather.get_daily_sum(data_type, timestep, False)
+
+        temp_max = max_(WeatherDataType.TEMPERATURE)
+        temp_min = weather.get_daily_min(WeatherDataType.TEMPERATURE, timestep, False)
+        dew_point = max_(WeatherDataType.DEWPOINT)
+        pressure = max_(WeatherDataType.PRESSURE)
+        wind_speed = max_(WeatherDataType.WIND_SPEED)
+        wind_gusts = max_(WeatherDataType.WIND_GUSTS)
+        precipitation_prop = max_(WeatherDataType.PRECIPITATION_PROBABILITY)
+        day_offset = (timestep.date() - now.date()).days
+        item = {
+            "datetime": timestep.strftime("%Y-%m-%dT%H:00:00Z"),
+            "cloud_coverage": max_(WeatherDataType.CLOUD_COVERAGE),
+            "condition": weather.get_daily_condition(timestep, False),
+            "native_dew_point": None
+            if dew_point is None
+            else round(dew_point - 273.1, 1),
+            "native_precipitation": sum_(WeatherDataType.PRECIPITATION),
+            "precipitation_probability": None
+            if precipitation_prop is None
+            else int(precipitation_prop),
+            "pressure": None if pressure is None else round(pressure / 100, 1),
+            "native_temperature": None if temp_max is None else round(temp_max - 273.1),
+            "native_templow": None if temp_min is None else round(temp_min - 273.1),
+            "uv_index": weather.get_uv_index(day_offset, False)
+            if 0 <= day_offset < 3
+            else None,
+            "native_wind_speed": None
+            if wind_speed is None
+            else round(wind_speed * 3.6, 1),
+            "wind_gust_speed": None
+            if wind_gusts is None
+            else round(wind_gusts * 3.6, 1),
+        }
+        if connector._config["additional_forecast_attributes"]:
+            item.update(
+                {
+                    "evaporation": max_(WeatherDataType.EVAPORATION),
+                    "fog_probability": max_(WeatherDataType.FOG_PROBABILITY),
+                    "sun_irradiance": sum_(WeatherDataType.SUN_IRRADIANCE),
+                    "visibility": weather.get_daily_min(
+                        WeatherDataType.VISIBILITY, timestep, False
+                    ),
+                    "sun_duration": sum_(WeatherDataType.SUN_DURATION),
+                    "precipitation_duration": sum_(
+                        WeatherDataType.PRECIPITATION_DURATION
+                    ),
+                    "humidity": max_(WeatherDataType.HUMIDITY),
+                }
+            )
+        result.append(item)
+        timestep += timedelta(days=1)
+    return result
+
+
+@pytest.mark.parametrize("additional_attributes", [True, False])
+def test_daily_forecast_matches_daily_queries(
+    mock_dwd_data, mosmix_forecast_data, freezer, additional_attributes
+):
+    """The day buckets should reduce to what per-field daily queries return."""
+    freezer.move_to("2026-01-15 09:30:00+00:00")
+    now = dt_util.now()
+    weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.dwd_weather = weather
+    mock_dwd_data.latest_update = now
+    mock_dwd_data._config["daily_temp_high_precision"] = False
+    mock_dwd_data._config["additional_forecast_attributes"] = additional_attributes
+
+    result = mock_dwd_data.get_forecast_daily()
+
+    assert len(result) == 9
+    bearings = [item.pop("wind_bearing") for item in result]
+    assert result == _reference_daily_forecast(mock_dwd_data, weather, now)
+    assert bearings == [
+        circular_mean(
+            [
+                item["DD"]
+                for item in weather.get_day_values(
+                    datetime(now.year, now.month, now.day, tzinfo=now.tzinfo)
+                    + timedelta(days=day)
+                )
+            ]
+        )
+        for day in range(9)
+    ]
+
+
+def test_daily_forecast_wind_bearing_is_circular_mean(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """A day with winds around north should average to north, not to south."""
+    freezer.move_to("2026-01-16 12:00:00+00:00")
+    for index, item in enumerate(mosmix_forecast_data.values()):
+        item["DD"] = 350.0 if index % 2 else 10.0
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = dt_util.now()
+    mock_dwd_data._config["wind_direction_type"] = "degrees"
+
+    result = mock_dwd_data.get_forecast_daily()
+
+    assert result[0]["wind_bearing"] in (0.0, 360.0)
+
+
+def test_evaporation_daily_matches_daily_queries(mock_dwd_data, mosmix_forecast_data):
+    """The evaporation series should read the same UTC days as the library."""
+    weather = _offline_weather(mosmix_forecast_data)
+    weather.issue_time = datetime(2026, 1, 15, 3, tzinfo=timezone.utc)
+    mock_dwd_data.dwd_weather = weather
+
+    result = mock_dwd_data.get_evaporation_daily()
+
+    expected = []
+    for i in range(9):
+        timestamp = (weather.issue_time + timedelta(days=1 + i)).replace(hour=6)
+        expected.append(
+            {
+                "datetime": timestamp - timedelta(days=1),
+                "value": weather.get_daily_max(
+                    WeatherDataType.EVAPORATION, timestamp, False
+                ),
+            }
+        )
+    assert result == expected
+    assert result[0]["value"] is not None
+
+
+def test_hourly_forecast_rolls_forward_on_new_hour(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """Without new data only the tail hour should be built when the hour advances."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    first = mock_dwd_data.get_forecast_hourly()
+
+    freezer.move_to("2026-01-15 07:05:00+00:00")
+    with patch.object(
+        mock_dwd_data,
+        "_build_forecast_hourly",
+        wraps=mock_dwd_data._build_forecast_hourly,
+    ) as build:
+        rolled = mock_dwd_data.get_forecast_hourly()
+
+    build.assert_called_once_with(datetime(2026, 1, 24, 5, tzinfo=timezone.utc), 2)
+    assert rolled[:-2] == first[2:]
+    mock_dwd_data._forecast_hourly_cache = None
+    assert mock_dwd_data.get_forecast_hourly() == rolled
+
+
+@pytest.mark.parametrize(
+    ("next_time", "new_update"),
+    [
+        ("2026-01-16 08:05:00+00:00", False),
+        ("2026-01-16 07:05:00+00:00", True),
+    ],
+)
+def test_hourly_forecast_rebuilds_on_new_day_or_data(
+    mock_dwd_data, mosmix_forecast_data, freezer, next_time, new_update
+):
+    """A new local day or new data should rebuild all hourly entries."""
+    # Local midnight of the US/Pacific test timezone is 08:00 UTC
+    freezer.move_to("2026-01-16 06:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    mock_dwd_data.get_forecast_hourly()
+
+    freezer.move_to(next_time)
+    if new_update:
+        mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    with patch.object(
+        mock_dwd_data,
+        "_build_forecast_hourly",
+        wraps=mock_dwd_data._build_forecast_hourly,
+    ) as build:
+        mock_dwd_data.get_forecast_hourly()
+
+    assert build.call_args.args[1] == 9 * 24
+
+
+def test_sun_hours_are_computed_once_per_day(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """The clear-night check should read a daily sunrise/sunset table."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+
+    with (
+        patch.object(
+            mock_dwd_data.sun, "riseutc", wraps=mock_dwd_data.sun.riseutc
+        ) as rise,
+        patch.object(mock_dwd_data.sun, "setutc", wraps=mock_dwd_data.sun.setutc),
+    ):
+        mock_dwd_data.get_forecast_hourly()
+        mock_dwd_data.get_condition()
+        assert rise.call_count == 11
+
+        freezer.move_to("2026-01-16 00:30:00+00:00")
+        assert mock_dwd_data._is_night_hour(datetime.now(timezone.utc))
+        assert not mock_dwd_data._is_night_hour(
+            datetime(2026, 1, 16, 12, tzinfo=timezone.utc)
+        )
+        assert rise.call_count == 22
+
+
+@pytest.mark.asyncio
+async def test_async_update_prepares_forecasts(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """The executor job should build both forecasts after a successful update."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+
+    def update():
+        mock_dwd_data.latest_update = datetime.now(timezone.utc)
+        return True
+
+    mock_dwd_data._update = MagicMock(side_effect=update)
+
+    await mock_dwd_data.async_update()
+
+    assert mock_dwd_data._get_cached_forecast_hourly()
+    assert mock_dwd_data._get_cached_forecast_daily()
+
+
+@pytest.mark.asyncio
+async def test_async_get_forecast_returns_prepared_forecast(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """Prepared forecasts should be returned without an executor job."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    mock_dwd_data._prepare_forecasts()
+
+    with patch.object(
+        mock_dwd_data._hass, "async_add_executor_job", AsyncMock()
+    ) as executor_job:
+        hourly = await mock_dwd_data.async_get_forecast(
+            WeatherEntityFeature.FORECAST_HOURLY
+        )
+        daily = await mock_dwd_data.async_get_forecast(
+            WeatherEntityFeature.FORECAST_DAILY
+        )
+
+    executor_job.assert_not_awaited()
+    assert hourly is mock_dwd_data._forecast_hourly_cache
+    assert daily is mock_dwd_data._forecast_daily_cache
+
+
+@pytest.mark.asyncio
+async def test_async_get_forecast_builds_outdated_forecast_in_executor(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """An outdated forecast should be built in an executor job."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+
+    with patch.object(
+        mock_dwd_data._hass,
+        "async_add_executor_job",
+        AsyncMock(return_value=[{"condition": "sunny"}]),
+    ) as executor_job:
+        result = await mock_dwd_data.async_get_forecast(
+            WeatherEntityFeature.FORECAST_HOURLY
+        )
+
+    executor_job.assert_awaited_once_with(
+        mock_dwd_data._build_forecast, WeatherEntityFeature.FORECAST_HOURLY
+    )
+    assert result == [{"condition": "sunny"}]
+
+
+def test_forecast_build_waits_for_running_update(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """A forecast should not be built while an update replaces the data."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    results = []
+    builder = threading.Thread(
+        target=lambda: results.append(
+            mock_dwd_data._build_forecast(WeatherEntityFeature.FORECAST_HOURLY)
+        )
+    )
+
+    with mock_dwd_data._lock:
+        builder.start()
+        builder.join(0.1)
+        assert builder.is_alive()
+    builder.join()
+
+    assert len(results[0]) == 216
+
+
+@pytest.mark.asyncio
+async def test_async_update_skips_unchanged_forecasts(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """Listeners should only be notified for forecasts that changed."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    entity = MagicMock()
+    entity.async_update_listeners = AsyncMock()
+    mock_dwd_data.register_entity(entity)
+
+    def update():
+        mock_dwd_data.latest_update = datetime.now(timezone.utc)
+        return True
+
+    mock_dwd_data._update = MagicMock(side_effect=update)
+
+    await mock_dwd_data.async_update()
+    published = mock_dwd_data._published_forecasts["hourly"]
+    assert published is mock_dwd_data._forecast_hourly_cache
+
+    freezer.move_to("2026-01-15 05:40:00+00:00")
+    await mock_dwd_data.async_update()
+    assert entity.async_update_listeners.await_count == 1
+
+    # A change below the daily maximum only alters the hourly forecast
+    mosmix_forecast_data["2026-01-20T12:00:00.000Z"]["TTT"] += 1
+    freezer.move_to("2026-01-15 05:50:00+00:00")
+    await mock_dwd_data.async_update()
+    entity.async_update_listeners.assert_awaited_with(("hourly",))
+    assert mock_dwd_data.forecast_changes["hourly"] == ["2026-01-20T12:00:00Z"]
+    assert entity.async_update_listeners.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_update_notifies_expired_forecast_head(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """A new hour should be published even if no data was downloaded."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    entity = MagicMock()
+    entity.async_update_listeners = AsyncMock()
+    mock_dwd_data.register_entity(entity)
+    mock_dwd_data._update = MagicMock(return_value=False)
+
+    # Nothing is published before the first update
+    await mock_dwd_data.async_update()
+    entity.async_update_listeners.assert_not_awaited()
+
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    mock_dwd_data._prepare_forecasts()
+    await mock_dwd_data.async_update()
+    entity.async_update_listeners.assert_not_awaited()
+
+    freezer.move_to("2026-01-15 06:00:00+00:00")
+    await mock_dwd_data.async_update()
+
+    entity.async_update_listeners.assert_awaited_once_with(("hourly",))
+    hourly = mock_dwd_data._published_forecasts["hourly"]
+    assert hourly[0]["datetime"] == "2026-01-15T06:00:00Z"
+
+
+def test_changed_forecast_times_ignores_expired_head(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """A forecast shifted by an hour should only report its new tail entry."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    previous = mock_dwd_data.get_forecast_hourly()
+
+    freezer.move_to("2026-01-15 06:05:00+00:00")
+    current = mock_dwd_data.get_forecast_hourly()
+    changed = [dict(entry) for entry in current]
+    changed[10]["native_temperature"] = 99.0
+
+    assert DWDWeatherData._get_changed_forecast_times(previous, previous[1:]) == []
+    assert DWDWeatherData._get_changed_forecast_times(previous, current) == [
+        current[-1]["datetime"]
+    ]
+    assert DWDWeatherData._get_changed_forecast_times(previous, changed) == [
+        current[10]["datetime"],
+        current[-1]["datetime"],
+    ]
+    assert DWDWeatherData._get_changed_forecast_times(previous, []) == [
+        entry["datetime"] for entry in previous
+    ]
+    assert DWDWeatherData._get_changed_forecast_times(None, []) == []
+
+
+def test_hourly_forecast_reads_apparent_temperature_per_hour(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """Each hourly entry should hold the apparent temperature of its own hour."""
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    weather = _offline_weather(mosmix_forecast_data)
+    weather.apparent_temperature_data = {
+        key: item["TTT"] - 2 for key, item in list(mosmix_forecast_data.items())[:48]
+    }
+    mock_dwd_data.dwd_weather = weather
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+    mock_dwd_data._config["download_apparent_temperature"] = True
+
+    with patch.object(weather, "supports_apparent_temperature", return_value=True):
+        result = mock_dwd_data.get_forecast_hourly()
+        freezer.move_to("2026-01-15 06:05:00+00:00")
+        rolled = mock_dwd_data.get_forecast_hourly()
+
+    assert result[0]["apparent_temperature"] == round(
+        mosmix_forecast_data["2026-01-15T05:00:00.000Z"]["TTT"] - 2 - 273.1, 1
+    )
+    assert result[1]["apparent_temperature"] == round(
+        mosmix_forecast_data["2026-01-15T06:00:00.000Z"]["TTT"] - 2 - 273.1, 1
+    )
+    assert result[-1]["apparent_temperature"] is None
+    assert rolled[:-1] == result[1:]
+
+
+def test_uv_index_table_is_keyed_by_local_date(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """UV values should be looked up by calendar date, also across month ends."""
+    freezer.move_to("2026-01-31 20:00:00+00:00")
+    weather = _offline_weather(mosmix_forecast_data)
+    weather.get_uv_index = MagicMock(wraps=weather.get_uv_index)
+    mock_dwd_data.dwd_weather = weather
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+
+    assert mock_dwd_data.get_uv_index() == 1
+    assert mock_dwd_data.get_uv_index_daily() == {
+        "today": 1,
+        "tomorrow": 2,
+        "dayaftertomorrow": 3,
+    }
+    assert mock_dwd_data._get_uv_indices() == {
+        date(2026, 1, 31): 1,
+        date(2026, 2, 1): 2,
+        date(2026, 2, 2): 3,
+    }
+    assert weather.get_uv_index.call_count == 3
+
+
+def test_airquality_is_joined_by_hour(mock_dwd_data, mosmix_forecast_data, freezer):
+    """Air quality values should be keyed by the hours of their forecast run."""
+    freezer.move_to("2026-01-15 03:20:00+00:00")
+    weather = _offline_weather(mosmix_forecast_data)
+    weather.update = MagicMock()
+    weather.get_weather_report = MagicMock(return_value=None)
+    mock_dwd_data.dwd_weather = weather
+    mock_dwd_data._config["download_airquality"] = True
+    mock_dwd_data._config["sensor_forecast_steps"] = 2
+    _download_airquality_hourly(mock_dwd_data, [{"PM10": float(i)} for i in range(97)])
+    mock_dwd_data.latest_update = None
+    mock_dwd_data._update()
+
+    # The run of 03:00 starts with "-01h" and continues with "+01h"
+    index = mock_dwd_data._get_airquality_hourly_index()
+    first_hour = datetime(2026, 1, 15, 2, tzinfo=timezone.utc)
+    assert min(index) * 3600 == first_hour.timestamp()
+    assert sorted(index) == [min(index)] + list(range(min(index) + 2, min(index) + 98))
+    assert mock_dwd_data.get_airquality() == {"PM10": 0.0}
+
+    freezer.move_to("2026-01-15 05:30:00+00:00")
+    result = mock_dwd_data.get_forecast_hourly()
+
+    assert result[0]["datetime"] == "2026-01-15T05:00:00Z"
+    assert result[0]["airquality_pm10"] == 2.0
+    assert result[94]["airquality_pm10"] == 96.0
+    assert "airquality_pm10" not in result[95]
+    assert mock_dwd_data.get_airquality() == {"PM10": 2.0}
+    assert mock_dwd_data.get_airquality_component_hourly("PM10") == [
+        {"datetime": "2026-01-15T05:00:00Z", "value": 2.0},
+        {"datetime": "2026-01-15T06:00:00Z", "value": 3.0},
+    ]
+
+    # A download that brings no new run keeps the keys of the old one
+    mock_dwd_data._airquality_hourly.update = MagicMock()
+    mock_dwd_data.latest_update = None
+    mock_dwd_data._update()
+    assert mock_dwd_data.get_forecast_hourly() == result
+
+
+def test_get_forecast_with_interval_reads_rollups(
+    mock_dwd_data, mosmix_forecast_data, freezer
+):
+    """get_forecast with an interval should return one entry per bucket."""
+    freezer.move_to("2026-01-15 13:30:00+00:00")
+    mock_dwd_data.dwd_weather = _offline_weather(mosmix_forecast_data)
+    mock_dwd_data.latest_update = datetime.now(timezone.utc)
+
+    result = mock_dwd_data.get_forecast(
+        WeatherEntityFeature.FORECAST_HOURLY, interval=6
+    )
+
+    # The buckets follow the local time of the tests (US/Pacific, UTC-8)
+    assert result[0]["datetime"] == "2026-01-15T08:00:00Z"
+    assert result[1]["datetime"] == "2026-01-15T14:00:00Z"
+    assert result[-1]["datetime"] == "2026-01-24T20:00:00Z"
+    temperatures = [
+        mosmix_forecast_data[f"2026-01-15T{hour:02d}:00:00.000Z"]["TTT"]
+        for hour in range(8, 14)
+    ]
+    assert result[0]["native_temperature"] == round(max(temperatures) - 273.1, 1)
+    assert result[0]["native_templow"] == round(min(temperatures) - 273.1, 1)
+    assert (
+        mock_dwd_data.get_forecast(WeatherEntityFeature.FORECAST_HOURLY, interval=6)
+        is result
+    )
+    assert (
+        mock_dwd_data.get_forecast(WeatherEntityFeature.FORECAST_HOURLY, interval=5)
+        is None
+    )
+
+    # The days equal the ones of the daily forecast, without clear-night
+    daily = mock_dwd_data.get_forecast(WeatherEntityFeature.FORECAST_HOURLY, 24)
+    assert daily[0]["datetime"] == "2026-01-15T08:00:00Z"
+    assert all(entry["condition"] != "clear-night" for entry in daily)
+
+
+def test_measurements_are_parsed_only_when_changed(mock_dwd_data):
+    """Unchanged measurements should neither be downloaded nor parsed again."""
+    csv_content = "\n".join(
+        [
+            "surface observations;Parameter description;cloud_cover_total;"
+            "horizontal_visibility;present_weather",
+            "units;unit;%;km;CODE_TABLE",
+            "descriptions;description;Cloud cover;Visibility;Weather",
+            "15.01.26;12:00;---;---;1",
+            "15.01.26;11:00;75;---;2",
+            "15.01.26;10:00;50;20,0;3",
+        ]
+    ).encode()
+    dwd_weather = mock_dwd_data.dwd_weather
+    dwd_weather.station_id = "10389"
+    dwd_weather.NOT_AVAILABLE = "---"
+    mock_dwd_data._fetcher = MagicMock()
+    mock_dwd_data._fetcher.fetch.side_effect = [csv_content, None]
+
+    mock_dwd_data._download_measurements()
+    mock_dwd_data._download_measurements()
+
+    mock_dwd_data._fetcher.fetch.assert_called_with(
+        "https://opendata.dwd.de/weather/weather_reports/poi/10389-BEOB.csv"
+    )
+    # The latest row is completed with the last hourly values
+    dwd_weather.parse_csv_row.assert_called_once_with(
+        {
+            "surface observations": "15.01.26",
+            "Parameter description": "12:00",
+            "cloud_cover_total": "75",
+            "horizontal_visibility": "20,0",
+            "present_weather": "1",
+        }
+    )
+
+
+def test_shared_mosmix_s_forecast_applied(mock_dwd_data):
+    """A station should take its forecast from the shared MOSMIX_S release."""
+    forecast = MosmixForecast(
+        datetime(2026, 1, 15, 3, tzinfo=timezone.utc), "STATION", OrderedDict()
+    )
+    mock_dwd_data._mosmix_s = MagicMock()
+    mock_dwd_data._mosmix_s.get_forecast.side_effect = [forecast, None]
+    mock_dwd_data.dwd_weather.station_id = "10389"
+
+    mock_dwd_data._update_mosmix_s()
+
+    mock_dwd_data._mosmix_s.get_forecast.assert_called_with("10389")
+    assert mock_dwd_data.dwd_weather.issue_time == forecast.issue_time
+    assert mock_dwd_data.dwd_weather.loaded_station_name == "STATION"
+    assert mock_dwd_data.dwd_weather.forecast_data is forecast.forecast_data
+
+    # Stations missing in the release keep their last forecast
+    mock_dwd_data._update_mosmix_s()
+    assert mock_dwd_data.dwd_weather.forecast_data is forecast.forecast_data
+
+
+async def test_snapshot_restored_after_restart(
+    hass, hass_storage, mock_dwd_data, mock_dwd_weather_object, mosmix_forecast_data
+):
+    """The data of the last update should be restored without a download."""
+    issue_time = datetime(2026, 1, 15, 3, tzinfo=timezone.utc)
+    mock_dwd_weather_object.forecast_data = mosmix_forecast_data
+    mock_dwd_weather_object.issue_time = issue_time
+    mock_dwd_weather_object.uv_reports = {"L732": {"forecast": {"today": 3}}}
+    _setup_forecast_weather_mocks(mock_dwd_data)
+    await mock_dwd_data.async_update()
+    assert f"{DOMAIN}.snapshot.{TEST_ENTRY_ID}" not in hass_storage
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[f"{DOMAIN}.snapshot.{TEST_ENTRY_ID}"]["data"]["station_id"] == (
+        "L732"
+    )
+
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+    weather.station = mock_dwd_weather_object.station
+    weather.station_id = "L732"
+    weather.nearest_uv_index_station = "L732"
+    weather.uv_reports = {}
+    entry = MagicMock(data=mock_dwd_data._config, entry_id=TEST_ENTRY_ID)
+    with patch(
+        "custom_components.dwd_weather.connector.dwdforecast.Weather",
+        return_value=weather,
+    ):
+        restored = DWDWeatherData(hass, entry)
+
+    assert await restored.async_restore_snapshot() is True
+    weather.update = MagicMock()
+    assert restored.latest_update == mock_dwd_data.latest_update
+    assert weather.forecast_data == mosmix_forecast_data
+    assert list(weather.forecast_data) == list(mosmix_forecast_data)
+    assert weather.issue_time == issue_time
+    assert weather.loaded_station_name == "TEST STATION"
+    assert weather.weather_report == "Test weather report"
+    assert weather.uv_reports == {"L732": {"forecast": {"today": 3}}}
+    assert "daily" in restored._published_forecasts
+    weather.update.assert_not_called()
+
+
+async def test_snapshot_of_other_station_ignored(hass_storage, mock_dwd_data):
+    """A snapshot that does not match the station should not be restored."""
+    key = f"{DOMAIN}.snapshot.{TEST_ENTRY_ID}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {"station_id": "10389", "data": ""},
+    }
+    forecast_data = mock_dwd_data.dwd_weather.forecast_data
+
+    assert await mock_dwd_data.async_restore_snapshot() is False
+    assert mock_dwd_data.dwd_weather.forecast_data is forecast_data
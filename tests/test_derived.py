@@ -0,0 +1,78 @@
+"""Tests for the batch unit conversions."""
+
+import math
+
+from simple_dwd_weatherforecast.dwdforecast import WeatherDataType
+
+from custom_components.dwd_weather.derived import (
+    absolute_humidity,
+    absolute_humidity_from_kelvin,
+    convert_series,
+    kelvin_to_celsius,
+    ms_to_kmh,
+    pa_to_hpa,
+    wind_direction_symbols,
+)
+
+
+def test_unit_conversions_skip_missing_values():
+    """NaN and None should both become None, everything else is converted."""
+    assert kelvin_to_celsius([283.15, math.nan, None]) == [10.0, None, None]
+    assert kelvin_to_celsius([283.16], 0) == [10.0]
+    assert ms_to_kmh([10.0, None]) == [36.0, None]
+    assert pa_to_hpa([101325.0]) == [1013.2]
+
+
+def test_absolute_humidity_matches_magnus_formula():
+    """The batch kernel should equal the scalar formula for every pair."""
+    temperatures = [-10.0, 0.0, 12.5, 30.0]
+    humidities = [90.0, 75.0, 60.0, 40.0]
+
+    expected = [
+        round(
+            (6.112 * math.exp((17.67 * t) / (t + 243.5)) * h * 18.016)
+            / ((273.15 + t) * 0.083143 * 100),
+            1,
+        )
+        for t, h in zip(temperatures, humidities)
+    ]
+
+    assert absolute_humidity(temperatures, humidities) == expected
+    assert (
+        absolute_humidity_from_kelvin([t + 273.15 for t in temperatures], humidities)
+        == expected
+    )
+    assert absolute_humidity([None, 10.0], [50.0, math.nan]) == [None, None]
+
+
+def test_convert_series_by_data_type():
+    """Each data type should be converted to the unit of its sensor."""
+    assert convert_series(WeatherDataType.VISIBILITY, [12345.0]) == [12.3]
+    assert convert_series(WeatherDataType.SUN_IRRADIANCE, [360.0]) == [100.0]
+    assert convert_series(WeatherDataType.CLOUD_COVERAGE, [42.4]) == [42.0]
+    # Data types without a sensor unit are passed through
+    assert convert_series(WeatherDataType.EVAPORATION, [0.3, math.nan]) == [
+        0.3,
+        None,
+    ]
+
+
+def test_wind_direction_symbols_by_sector():
+    """Every point should cover the sector centred on it."""
+    assert wind_direction_symbols([0.0, 22.4, 22.5, 180.0, 337.4, 337.5, 360.0]) == [
+        "N",
+        "N",
+        "NO",
+        "S",
+        "NW",
+        "N",
+        "N",
+    ]
+    assert wind_direction_symbols([11.2, 11.25, 247.5, 348.75, None, math.nan], 16) == [
+        "N",
+        "NNO",
+        "WSW",
+        "N",
+        "",
+        "",
+    ]
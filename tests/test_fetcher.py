@@ -0,0 +1,132 @@
+"""Tests for the conditional fetcher against a local HTTP server."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+import threading
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+import requests
+
+from custom_components.dwd_weather.fetcher import ConditionalFetcher, MosmixSFetcher
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve the file of the server, honoring its validators."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if self.path != "/file":
+            self.send_error(404)
+            return
+        if (server.etag and self.headers.get("If-None-Match") == server.etag) or (
+            not server.etag
+            and self.headers.get("If-Modified-Since") == server.last_modified
+        ):
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if server.etag:
+            self.send_header("ETag", server.etag)
+        self.send_header("Last-Modified", server.last_modified)
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def file_server(socket_enabled):
+    """Run a local stand-in for the DWD open data server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.requests = []
+    server.body = b"MOSMIX v1"
+    server.etag = '"v1"'
+    server.last_modified = "Thu, 15 Jan 2026 04:00:00 GMT"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _url(server, path="/file"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_fetch_skips_unchanged_resources(file_server):
+    """A resource should only be returned when its ETag changed."""
+    fetcher = ConditionalFetcher()
+
+    assert fetcher.fetch(_url(file_server)) == b"MOSMIX v1"
+    assert fetcher.fetch(_url(file_server)) is None
+    assert file_server.requests[1]["If-None-Match"] == '"v1"'
+    assert (
+        file_server.requests[1]["If-Modified-Since"] == "Thu, 15 Jan 2026 04:00:00 GMT"
+    )
+
+    file_server.body = b"MOSMIX v2"
+    file_server.etag = '"v2"'
+    assert fetcher.fetch(_url(file_server)) == b"MOSMIX v2"
+    assert fetcher.fetch(_url(file_server)) is None
+
+
+def test_fetch_uses_last_modified_without_etag(file_server):
+    """Servers without ETags should be asked with the modification time."""
+    file_server.etag = None
+    fetcher = ConditionalFetcher()
+
+    assert fetcher.fetch(_url(file_server)) == b"MOSMIX v1"
+    assert fetcher.fetch(_url(file_server)) is None
+    assert "If-None-Match" not in file_server.requests[1]
+
+
+def test_fetch_forget_and_errors(file_server):
+    """Forgotten resources are downloaded again, errors are raised."""
+    fetcher = ConditionalFetcher()
+    fetcher.fetch(_url(file_server))
+
+    fetcher.forget(_url(file_server))
+
+    assert fetcher.fetch(_url(file_server)) == b"MOSMIX v1"
+    with pytest.raises(requests.HTTPError):
+        fetcher.fetch(_url(file_server, "/missing"))
+
+
+def _kmz(kml):
+    """Zip a MOSMIX document."""
+    content = BytesIO()
+    with ZipFile(content, "w", ZIP_DEFLATED) as kmz:
+        kmz.writestr("MOSMIX_S.kml", kml)
+    return content.getvalue()
+
+
+def test_mosmix_s_downloaded_once_per_release(file_server, mosmix_kml):
+    """Stations should share one download of each MOSMIX_S release."""
+    file_server.body = _kmz(mosmix_kml("10389", "10384", "P0489"))
+    fetcher = MosmixSFetcher(url=_url(file_server))
+    fetcher.register("10389")
+    unregister = fetcher.register("10384")
+
+    first = fetcher.get_forecast("10389")
+    assert first.station_name == "STATION 10389"
+    assert fetcher.get_forecast("10384").station_name == "STATION 10384"
+    assert fetcher.get_forecast("10389") is first
+    assert [request.get("If-None-Match") for request in file_server.requests] == [
+        None,
+        '"v1"',
+        '"v1"',
+    ]
+
+    # A station registered later needs the release to be scanned again
+    fetcher.register("P0489")
+    assert fetcher.get_forecast("P0489").station_name == "STATION P0489"
+    assert file_server.requests[-1].get("If-None-Match") is None
+
+    unregister()
+    assert fetcher.stations == {"10389", "P0489"}
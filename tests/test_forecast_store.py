@@ -0,0 +1,249 @@
+"""Tests for the columnar forecast store."""
+
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from simple_dwd_weatherforecast import dwdforecast
+from simple_dwd_weatherforecast.dwdforecast import WeatherDataType
+
+from custom_components.dwd_weather.forecast_store import (
+    ForecastStore,
+    TimeAxis,
+    aggregate_condition,
+    circular_mean,
+    condition_text,
+    epoch_hour,
+)
+
+
+def test_store_builds_one_column_per_data_type(mosmix_forecast_data):
+    """Every numeric data type should get a column on the shared time axis."""
+    store = ForecastStore(mosmix_forecast_data)
+
+    assert len(store) == len(mosmix_forecast_data)
+    assert store.keys == list(mosmix_forecast_data)
+    for column in store.columns.values():
+        assert len(column) == len(store)
+    assert WeatherDataType.CONDITION not in store.columns
+
+
+def test_store_values_match_forecast_data(mosmix_forecast_data):
+    """Values read from the store should equal the values of the source dict."""
+    store = ForecastStore(mosmix_forecast_data)
+
+    for position, item in enumerate(mosmix_forecast_data.values()):
+        for data_type in (WeatherDataType.TEMPERATURE, WeatherDataType.PRECIPITATION):
+            assert store.value_at(data_type, position) == item[data_type.value[0]]
+        assert store.conditions[position] == item["condition"]
+
+
+def test_store_lookup_by_timestamp(mosmix_forecast_data):
+    """Timestamps should resolve to the entry of their hour."""
+    store = ForecastStore(mosmix_forecast_data)
+    timestamp = datetime(2026, 1, 16, 3, 42, tzinfo=timezone.utc)
+
+    assert (
+        store.get(WeatherDataType.TEMPERATURE, timestamp)
+        == (mosmix_forecast_data["2026-01-16T03:00:00.000Z"]["TTT"])
+    )
+    assert (
+        store.get(
+            WeatherDataType.TEMPERATURE, datetime(2025, 1, 1, tzinfo=timezone.utc)
+        )
+        is None
+    )
+    assert store.get_condition(timestamp) == condition_text(
+        mosmix_forecast_data["2026-01-16T03:00:00.000Z"]["condition"]
+    )
+
+
+def test_store_first_position(mosmix_forecast_data):
+    """first_position should clamp to the start and the end of the time axis."""
+    store = ForecastStore(mosmix_forecast_data)
+    first_hour = store.hours[0]
+
+    assert store.first_position(first_hour + 5) == 5
+    assert store.first_position(first_hour - 3) == 0
+    assert store.first_position(first_hour + 1000) == len(store)
+
+
+def test_store_handles_missing_data():
+    """An empty store should behave like a store without any hour."""
+    store = ForecastStore(None)
+
+    assert len(store) == 0
+    assert store.get(WeatherDataType.TEMPERATURE, datetime.now(timezone.utc)) is None
+    assert store.values(WeatherDataType.TEMPERATURE) == []
+
+
+def test_epoch_hour_truncates_to_the_hour():
+    """epoch_hour should ignore minutes and seconds."""
+    assert epoch_hour(datetime(1970, 1, 1, 2, 59, 59, tzinfo=timezone.utc)) == 2
+
+
+def test_daily_groups_hours_by_local_day(mosmix_forecast_data):
+    """Each day bucket should hold the hours of one day in the given timezone."""
+    store = ForecastStore(mosmix_forecast_data)
+
+    utc_days = store.daily(timezone.utc)
+    berlin_days = store.daily(ZoneInfo("Europe/Berlin"))
+
+    assert len(utc_days) == 10
+    assert all(len(day) == 24 for day in utc_days.values())
+    # The first UTC hour already belongs to 01:00 local time
+    assert len(berlin_days[date(2026, 1, 15)]) == 23
+    assert len(berlin_days[date(2026, 1, 25)]) == 1
+    assert store.daily(timezone.utc) is utc_days
+
+
+def test_daily_reductions_match_library(mosmix_forecast_data):
+    """Min, max, sum and condition of a day should equal the library results."""
+    store = ForecastStore(mosmix_forecast_data)
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+    weather.forecast_data = mosmix_forecast_data
+    timestamp = datetime(2026, 1, 17, tzinfo=timezone.utc)
+    day_values = weather.get_day_values(timestamp)
+
+    day = store.daily(timezone.utc)[timestamp.date()]
+
+    for data_type in (WeatherDataType.TEMPERATURE, WeatherDataType.VISIBILITY):
+        assert day.maximum[data_type] == weather.get_max(day_values, data_type)
+        assert day.minimum[data_type] == weather.get_min(day_values, data_type)
+    assert day.total[WeatherDataType.PRECIPITATION] == weather.get_sum(
+        day_values, WeatherDataType.PRECIPITATION
+    )
+    assert day.condition == weather.get_condition(day_values)
+
+
+@pytest.mark.parametrize(
+    "codes",
+    [
+        ["0"],
+        ["0", "0", "0", "0", "0", "-"],
+        ["3", "3", "3", "3"],
+        ["2", "0", "0", "0", "1"],
+        ["61", "61", "3", "3"],
+        ["71", "71", "61", "3"],
+        ["45", "45", "45", "0"],
+        ["95", "0", "0", "0"],
+    ],
+)
+def test_aggregate_condition_matches_library(codes):
+    """Combined conditions should follow the weighting of the library."""
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+    entries = [{WeatherDataType.CONDITION.value[0]: code} for code in codes]
+
+    assert aggregate_condition(codes) == weather.get_condition(entries)
+    assert aggregate_condition([]) is None
+
+
+def test_circular_mean():
+    """Angles should be averaged on the circle."""
+    assert circular_mean([]) is None
+    assert circular_mean([350.0, 10.0]) in (0.0, 360.0)
+    assert circular_mean([80.0, 100.0]) == 90.0
+
+
+def test_rollup_levels_match_timeframe_queries(mosmix_forecast_data):
+    """Every rollup bucket should reduce like a library timeframe query."""
+    store = ForecastStore(mosmix_forecast_data)
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+    weather.forecast_data = mosmix_forecast_data
+
+    for interval in (3, 6, 12):
+        rollup = store.rollup(interval)
+        assert len(rollup) == len(store) // interval
+        for position in (0, 5):
+            timestamp = datetime.fromtimestamp(
+                rollup.hours[position] * 3600, timezone.utc
+            )
+            values = weather.get_timeframe_values(timestamp, interval)
+            for data_type in (WeatherDataType.TEMPERATURE, WeatherDataType.VISIBILITY):
+                assert rollup.max(data_type, position) == weather.get_max(
+                    values, data_type
+                )
+                assert rollup.min(data_type, position) == weather.get_min(
+                    values, data_type
+                )
+            assert rollup.sum(WeatherDataType.PRECIPITATION, position) == (
+                weather.get_sum(values, WeatherDataType.PRECIPITATION)
+            )
+            precipitation = [
+                item["RR1c"] for item in values if item["RR1c"] is not None
+            ]
+            assert rollup.avg(WeatherDataType.PRECIPITATION, position) == round(
+                sum(precipitation) / len(precipitation), 2
+            )
+            assert rollup.condition(position) == weather.get_condition(values)
+
+
+@pytest.mark.parametrize(
+    "tz", [timezone.utc, ZoneInfo("Europe/Berlin"), ZoneInfo("Asia/Kolkata")]
+)
+def test_rollup_days_match_daily_aggregates(mosmix_forecast_data, tz):
+    """The 24h level merged from finer levels should equal the local days."""
+    store = ForecastStore(mosmix_forecast_data)
+    rollup = store.rollup(24, tz)
+    days = list(store.daily(tz).values())
+
+    assert len(rollup) == len(days)
+    for position, day in enumerate(days):
+        for data_type in (WeatherDataType.TEMPERATURE, WeatherDataType.WIND_GUSTS):
+            assert rollup.max(data_type, position) == day.maximum[data_type]
+            assert rollup.min(data_type, position) == day.minimum[data_type]
+        assert (
+            rollup.sum(WeatherDataType.SUN_DURATION, position)
+            == (day.total[WeatherDataType.SUN_DURATION])
+        )
+        assert rollup.wind_direction(position) == pytest.approx(day.wind_direction)
+        assert rollup.condition(position) == day.condition
+    assert store.rollup(24, tz) is rollup
+    assert [
+        datetime.fromtimestamp(hour * 3600, tz).date() for hour in rollup.hours
+    ] == list(store.daily(tz))
+    assert {datetime.fromtimestamp(hour * 3600, tz).hour for hour in rollup.hours} == {
+        0
+    }
+
+
+def test_time_axis_converts_each_hour_once(mosmix_forecast_data):
+    """The axis should reuse the parsed keys and memoize formatted strings."""
+    store = ForecastStore(mosmix_forecast_data)
+    axis = store.time_axis
+    first_hour = store.hours[0]
+
+    assert axis.datetime(first_hour) == datetime(2026, 1, 15, tzinfo=timezone.utc)
+    assert axis.iso(first_hour) == "2026-01-15T00:00:00Z"
+    assert axis.iso(first_hour) is axis.iso(first_hour)
+    assert axis.local_date(first_hour, ZoneInfo("US/Pacific")) == date(2026, 1, 14)
+
+    # Hours outside of the forecast data are converted on demand
+    assert TimeAxis().iso(first_hour - 1) == "2026-01-14T23:00:00Z"
+
+
+def test_interpolate_follows_hourly_segments(mosmix_forecast_data):
+    """Values within an hour should lie on the line to the next hour."""
+    store = ForecastStore(mosmix_forecast_data)
+    start = mosmix_forecast_data["2026-01-16T03:00:00.000Z"]["TTT"]
+    end = mosmix_forecast_data["2026-01-16T04:00:00.000Z"]["TTT"]
+    timestamp = datetime(2026, 1, 16, 3, 15, tzinfo=timezone.utc)
+
+    assert store.interpolate(WeatherDataType.TEMPERATURE, timestamp) == (
+        pytest.approx(start + (end - start) / 4)
+    )
+    assert store.interpolate(WeatherDataType.TEMPERATURE, timestamp, 280.0) == (
+        pytest.approx(280.0 + (end - 280.0) / 4)
+    )
+    # The last hour has no segment end and is held
+    last = datetime.fromtimestamp(store.hours[-1] * 3600 + 1800, timezone.utc)
+    assert store.interpolate(WeatherDataType.TEMPERATURE, last) == (
+        store.value_at(WeatherDataType.TEMPERATURE, len(store) - 1)
+    )
+    assert (
+        store.interpolate(
+            WeatherDataType.TEMPERATURE, datetime(2025, 1, 1, tzinfo=timezone.utc)
+        )
+        is None
+    )
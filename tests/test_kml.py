@@ -0,0 +1,44 @@
+"""Tests for the streaming MOSMIX KML parser."""
+
+from simple_dwd_weatherforecast import dwdforecast
+
+from custom_components.dwd_weather.kml import MosmixParser, apply_forecast
+
+
+def _parse(kml, station_ids, chunk_size=4096):
+    parser = MosmixParser(station_ids)
+    for start in range(0, len(kml), chunk_size):
+        parser.feed(kml[start : start + chunk_size])
+    return parser.close()
+
+
+def test_parser_matches_library(mosmix_kml, mosmix_forecast_data):
+    """The forecast of a station should equal the one of Weather.parse_kml."""
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+    weather.parse_kml(mosmix_kml("10389"))
+
+    forecast = _parse(mosmix_kml("P0489", "10389", "10384"), {"10389"})["10389"]
+
+    assert forecast.issue_time == weather.issue_time
+    assert forecast.station_name == weather.loaded_station_name == "STATION 10389"
+    assert forecast.forecast_data == weather.forecast_data
+    assert forecast.forecast_data == mosmix_forecast_data
+
+
+def test_parser_skips_other_stations(mosmix_kml):
+    """Only the wanted stations should be converted, in chunks of any size."""
+    forecasts = _parse(mosmix_kml("10389", "P0489", "10384"), {"10384", "99999"}, 7)
+
+    assert list(forecasts) == ["10384"]
+
+
+def test_apply_forecast_sets_weather_data(mosmix_kml):
+    """Applying a forecast should set what Weather.parse_kml sets."""
+    forecast = _parse(mosmix_kml("10389"), {"10389"})["10389"]
+    weather = dwdforecast.Weather.__new__(dwdforecast.Weather)
+
+    apply_forecast(weather, forecast)
+
+    assert weather.issue_time == forecast.issue_time
+    assert weather.loaded_station_name == "STATION 10389"
+    assert weather.forecast_data is forecast.forecast_data
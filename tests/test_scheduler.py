@@ -0,0 +1,56 @@
+"""Tests for the refresh scheduler."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.dwd_weather.scheduler import (
+    MOSMIX_L,
+    POLL_INTERVAL,
+    RefreshScheduler,
+)
+
+
+def _utc(hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 1, 15, hour, minute, tzinfo=timezone.utc)
+
+
+def test_publication_polls_only_near_the_release():
+    """Downloads should wait for the release and poll within its window."""
+    issue_time = _utc(3)
+
+    assert MOSMIX_L.next_attempt(issue_time, _utc(5)) == _utc(10)
+    assert MOSMIX_L.next_attempt(issue_time, _utc(10, 5)) == _utc(10, 15)
+    # Past the window the download is retried at the next hour
+    assert MOSMIX_L.next_attempt(issue_time, _utc(12, 5)) == _utc(13)
+    assert MOSMIX_L.next_attempt(None, _utc(5)) == _utc(5) + POLL_INTERVAL
+
+
+def test_scheduler_plans_forecast_and_reports():
+    """The next download should be the earliest expected release."""
+    scheduler = RefreshScheduler(hourly_update=False, with_measurements=False)
+    assert scheduler.is_due(_utc(5))
+
+    scheduler.plan(_utc(5), _utc(3))
+
+    assert not scheduler.is_due(_utc(5, 9))
+    assert scheduler.is_due(_utc(5, 10))
+    assert not scheduler.forecast_due(_utc(5, 10))
+    assert scheduler.next_interval(_utc(5)) == timedelta(minutes=10)
+
+    scheduler.plan(_utc(5, 10), _utc(3))
+
+    assert scheduler.next_download() == _utc(6, 10)
+    assert scheduler.forecast_due(_utc(10))
+    # The refresh at the full hour publishes the values of the new hour
+    assert scheduler.next_interval(_utc(5, 10)) == timedelta(minutes=50)
+
+
+def test_scheduler_follows_the_measurements():
+    """With measurements the reports are expected an hour after the last one."""
+    scheduler = RefreshScheduler(hourly_update=True, with_measurements=True)
+
+    scheduler.plan(_utc(5, 20), _utc(5), report_time=_utc(4))
+
+    # The report of 05:00 is overdue and polled, MOSMIX_S is expected at 06:30
+    assert scheduler.next_download() == _utc(5, 30)
+    assert not scheduler.forecast_due(_utc(5, 30))
+    assert scheduler.forecast_due(_utc(6, 30))
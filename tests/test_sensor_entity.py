@@ -6,11 +6,16 @@ import pytest
 from homeassistant.const import UnitOfTemperature
 
 from custom_components.dwd_weather.sensor import (
+    SENSOR_GETTERS,
+    SENSOR_TYPES,
     DWDWeatherForecastSensor,
     async_setup_entry,
 )
 from custom_components.dwd_weather.const import (
     CONF_DOWNLOAD_AIRQUALITY,
+    CONF_INTERPOLATE,
+    CONF_SENSOR_DATA_FORMAT,
+    CONF_SENSOR_DATA_FORMAT_COMPACT,
     ATTR_ISSUE_TIME,
     ATTR_LATEST_UPDATE,
     ATTR_STATION_ID,
@@ -151,3 +156,129 @@ async def test_sensor_async_update_requests_refresh(sensor_entity):
     await sensor_entity.async_update()
 
     sensor_entity._coordinator.async_request_refresh.assert_awaited_once()
+
+
+def test_registered_sensors_read_from_one_snapshot_per_tick(sensor_entity):
+    """Registered sensors should evaluate their getters once per update."""
+    connector = sensor_entity._connector
+    unregister = connector.register_sensor("temperature", SENSOR_GETTERS["temperature"])
+    connector._prepare_sensor_snapshot()
+
+    for _ in range(3):
+        connector._prepare_sensor_snapshot()
+        assert sensor_entity.state == 15.5
+        assert sensor_entity.extra_state_attributes["data"] == [15.5, 16.0]
+    connector.get_temperature.assert_called_once()
+    connector.get_temperature_hourly.assert_called_once()
+
+    snapshot = connector.get_sensor_snapshot()
+    with pytest.raises(TypeError):
+        snapshot["temperature"] = None
+
+    connector.latest_update = "2026-01-01T01:01:00+00:00"
+    connector.get_temperature.return_value = 16.0
+    # Reading the snapshot does not rebuild it
+    assert sensor_entity.state == 15.5
+    connector._prepare_sensor_snapshot()
+    assert sensor_entity.state == 16.0
+    assert connector.get_temperature.call_count == 2
+
+    unregister()
+    connector.latest_update = "2026-01-01T02:01:00+00:00"
+    connector._prepare_sensor_snapshot()
+    assert "temperature" not in connector.get_sensor_snapshot()
+
+
+def test_sensor_getters_cover_all_sensor_types():
+    """Every sensor type should have a state getter in the dispatch table."""
+    connector = MagicMock()
+
+    assert set(SENSOR_GETTERS) == set(SENSOR_TYPES)
+    SENSOR_GETTERS["airquality_pm2_5"][0](connector)
+    connector.get_airquality_component_state.assert_called_once_with("PM2_5")
+
+
+def test_weather_report_sensor_reads_report_time(mock_dwd_data):
+    """The weather report sensor should show the time of the report."""
+    state_getter, attribute_getters = SENSOR_GETTERS["weather_report"]
+    assert state_getter(mock_dwd_data) is None
+
+    mock_dwd_data._report = {"text": "Report", "time": "Mittwoch, 15.01.26, 10:00"}
+
+    assert state_getter(mock_dwd_data) == "Mittwoch, 15.01.26, 10:00"
+    assert attribute_getters["data"](mock_dwd_data) == "Report"
+
+
+def test_sensor_snapshot_follows_interpolation_interval(sensor_entity, freezer):
+    """Interpolated sensors should get a new snapshot every interpolation interval."""
+    freezer.move_to("2026-01-01 10:20:00+00:00")
+    connector = sensor_entity._connector
+    connector._config[CONF_INTERPOLATE] = True
+    connector.register_sensor("temperature", SENSOR_GETTERS["temperature"])
+
+    connector._prepare_sensor_snapshot()
+    assert sensor_entity.state == 15.5
+    freezer.move_to("2026-01-01 10:24:59+00:00")
+    connector._prepare_sensor_snapshot()
+    assert sensor_entity.state == 15.5
+    connector.get_temperature.assert_called_once()
+
+    freezer.move_to("2026-01-01 10:25:00+00:00")
+    connector.get_temperature.return_value = 15.6
+    connector._prepare_sensor_snapshot()
+    assert sensor_entity.state == 15.6
+
+
+def test_sensor_skips_writes_of_unchanged_state(sensor_entity):
+    """Coordinator ticks should only write the state when the snapshot changed."""
+    connector = sensor_entity._connector
+    connector.register_sensor("temperature", SENSOR_GETTERS["temperature"])
+    connector._prepare_sensor_snapshot()
+    sensor_entity.async_write_ha_state = MagicMock()
+
+    sensor_entity._handle_coordinator_update()
+    sensor_entity._handle_coordinator_update()
+    sensor_entity.async_write_ha_state.assert_called_once()
+
+    # A rebuilt snapshot with equal values is not written again
+    connector._sensor_snapshot_version = None
+    connector._prepare_sensor_snapshot()
+    sensor_entity._handle_coordinator_update()
+    sensor_entity.async_write_ha_state.assert_called_once()
+
+    connector.latest_update = "2026-01-01T00:11:00+00:00"
+    connector._prepare_sensor_snapshot()
+    sensor_entity._handle_coordinator_update()
+    assert sensor_entity.async_write_ha_state.call_count == 2
+
+
+def test_unregistered_sensor_writes_on_every_tick(sensor_entity):
+    """Without a snapshot entry there is no fingerprint to compare."""
+    sensor_entity.async_write_ha_state = MagicMock()
+
+    sensor_entity._handle_coordinator_update()
+    sensor_entity._handle_coordinator_update()
+
+    assert sensor_entity.async_write_ha_state.call_count == 2
+
+
+def test_sensor_data_is_not_recorded(sensor_entity):
+    """The forecast series should be excluded from the recorder."""
+    assert "data" in sensor_entity._unrecorded_attributes
+
+
+def test_sensor_data_in_compact_format(sensor_entity):
+    """The compact format should encode the series as start, step and values."""
+    connector = sensor_entity._connector
+    connector._config[CONF_SENSOR_DATA_FORMAT] = CONF_SENSOR_DATA_FORMAT_COMPACT
+    connector.get_temperature_hourly.return_value = [
+        {"datetime": "2026-01-01T00:00:00.000Z", "value": 15.5},
+        {"datetime": "2026-01-01T01:00:00.000Z", "value": 16.0},
+    ]
+    connector.register_sensor("temperature", SENSOR_GETTERS["temperature"])
+
+    assert sensor_entity.extra_state_attributes["data"] == {
+        "start": "2026-01-01T00:00:00.000Z",
+        "step": 3600,
+        "values": [15.5, 16.0],
+    }
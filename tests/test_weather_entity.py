@@ -30,7 +30,7 @@ def weather_entity(hass_data):
     connector.get_uv_index = MagicMock(return_value=3)
     connector.get_apparent_temperature = MagicMock(return_value=10.9)
     connector.get_airquality = MagicMock(return_value={"PM2_5": 12.0, "PM10": 20.0})
-    connector.get_forecast = MagicMock(return_value=[{"condition": "sunny"}])
+    connector.async_get_forecast = AsyncMock(return_value=[{"condition": "sunny"}])
     connector.infos = {"station_id": "L732"}
 
     return DWDWeather(MOCK_CONFIG, hass_data)
@@ -89,6 +89,12 @@ async def test_weather_forecast_methods(weather_entity):
 
     assert daily == [{"condition": "sunny"}]
     assert hourly == [{"condition": "sunny"}]
+    weather_entity._connector.async_get_forecast.assert_any_await(
+        WeatherEntityFeature.FORECAST_DAILY
+    )
+    weather_entity._connector.async_get_forecast.assert_any_await(
+        WeatherEntityFeature.FORECAST_HOURLY
+    )
 
 
 @pytest.mark.asyncio
@@ -99,3 +105,16 @@ async def test_weather_async_update_requests_refresh(weather_entity):
     await weather_entity.async_update()
 
     weather_entity._coordinator.async_request_refresh.assert_awaited_once()
+
+
+def test_weather_skips_writes_of_unchanged_state(weather_entity):
+    """Coordinator ticks should only write the state when a value changed."""
+    weather_entity.async_write_ha_state = MagicMock()
+
+    weather_entity._handle_coordinator_update()
+    weather_entity._handle_coordinator_update()
+    weather_entity.async_write_ha_state.assert_called_once()
+
+    weather_entity._connector.get_temperature.return_value = 12.5
+    weather_entity._handle_coordinator_update()
+    assert weather_entity.async_write_ha_state.call_count == 2